@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-import bpy
+try:
+    import bpy
+    import bmesh
+except ImportError:     # Export All worker processes run outside Blender
+    bpy = bmesh = None
 import struct
 import os
 import zlib
-import bmesh
 import math
+import base64
 import numpy as np
 from dataclasses import dataclass, field
 from typing import List, Optional
@@ -1101,6 +1105,11 @@ class Std_Model:
 
         self.point_normal_list: Optional[List[Std_Point]] = None
 
+        # Strip cache: digest of the pre-strip model data and a per-run
+        # set_strip_point call counter (see _cached_set_strip_point).
+        self.src_digest: Optional[bytes] = None
+        self.strip_call_ct: int = 0
+
 
 bump_polygon: bool = False
 
@@ -1696,14 +1705,112 @@ def _apply_options_ro(opts) -> None:
     input_file_name_base = getattr(opts, "input_file_name_base",   "")
 
 
-# Binary output channel  — write one little-endian 32-bit word
-_binary_out: Optional[io.RawIOBase] = None
+# Binary output channel — little-endian 32-bit words
+
+_LE32 = struct.Struct("<I")
+_LE32_RECORDS: dict = {}
+
+
+def _le32_record(n: int) -> struct.Struct:
+    """Precompiled '<nI' struct for an n-word record."""
+    st = _LE32_RECORDS.get(n)
+    if st is None:
+        st = _LE32_RECORDS[n] = struct.Struct(f"<{n}I")
+    return st
+
+
+class BinaryEmitter:
+    """Word sink for the binary writer.
+
+    Words are packed with precompiled structs straight into one
+    preallocated bytearray, grown by doubling if the size hint was short.
+    When *stream* is given the buffer is written out each time it fills,
+    so large outputs go straight to the target file.
+    """
+
+    __slots__ = ("buf", "pos", "stream", "flushed")
+
+    STREAM_CHUNK = 4 << 20
+
+    def __init__(self, size_hint: int = 0, stream=None):
+        if stream is not None:
+            size_hint = min(max(size_hint, 4096), self.STREAM_CHUNK)
+        self.buf     = bytearray(max(size_hint, 4096))
+        self.pos     = 0
+        self.stream  = stream
+        self.flushed = 0
+
+    def reserve(self, nbytes: int) -> None:
+        """Make room for *nbytes* more bytes at the write position."""
+        need = self.pos + nbytes
+        if need <= len(self.buf):
+            return
+        if self.stream is not None and self.pos:
+            self.flush()
+            need = nbytes
+            if need <= len(self.buf):
+                return
+        self.buf.extend(bytes(max(need, 2 * len(self.buf)) - len(self.buf)))
+
+    def le32(self, value: int) -> None:
+        pos = self.pos
+        if pos + 4 > len(self.buf):
+            self.reserve(4)
+            pos = self.pos
+        _LE32.pack_into(self.buf, pos, value & 0xFFFFFFFF)
+        self.pos = pos + 4
+
+    def le32s(self, values) -> None:
+        """Write a whole record; every value must already be a uint32."""
+        n = 4 * len(values)
+        pos = self.pos
+        if pos + n > len(self.buf):
+            self.reserve(n)
+            pos = self.pos
+        _le32_record(len(values)).pack_into(self.buf, pos, *values)
+        self.pos = pos + n
+
+    def write(self, data) -> None:
+        """Write a pre-packed little-endian block (e.g. ndarray.tobytes())."""
+        n = len(data)
+        pos = self.pos
+        if pos + n > len(self.buf):
+            self.reserve(n)
+            pos = self.pos
+        self.buf[pos:pos + n] = data
+        self.pos = pos + n
+
+    def tell(self) -> int:
+        return self.flushed + self.pos
+
+    def flush(self) -> None:
+        if self.stream is not None and self.pos:
+            self.stream.write(memoryview(self.buf)[:self.pos])
+            self.flushed += self.pos
+            self.pos = 0
+
+    def getvalue(self) -> bytes:
+        """Bytes not yet flushed (all of them when not streaming)."""
+        return bytes(memoryview(self.buf)[:self.pos])
+
+
+_binary_out: Optional[BinaryEmitter] = None
 
 def write_le32(value: int) -> None:
     if _binary_out is not None:
-        _binary_out.write(struct.pack("<I", value & 0xFFFFFFFF))
+        _binary_out.le32(value)
+
+def write_le32s(*values: int) -> None:
+    """Emit one multi-word record; values must already be uint32."""
+    if _binary_out is not None:
+        _binary_out.le32s(values)
+
+def write_block(data) -> None:
+    """Emit a pre-packed block of whole little-endian words."""
+    if _binary_out is not None:
+        _binary_out.write(data)
 
-def set_binary_output(stream: Optional[io.RawIOBase]) -> None:
+def set_binary_output(stream: Optional[BinaryEmitter]) -> None:
     global _binary_out
     _binary_out = stream
 
@@ -2683,7 +2790,7 @@ def naomi_format_type_2_7_main(i: int, j: int) -> None:
         )
         tex.v1 = tex1_out[0]
 
-    StdModel[i].set_strip_point(j, pnum[0], tex)
+    _cached_set_strip_point(StdModel[i], j, pnum[0], tex)
     StdModel[i].put_strip_point(j, sas[0])
 
     mat_disp_mode   = 2
@@ -2787,10 +2894,7 @@ def naomi_format_type_2_7(name: Optional[str], nullmodel: bool) -> None:
     mcr = Std_Float(float(mcr) * allScale)
 
     if not output_after_all:
-        write_le32(mcx.hex())
-        write_le32(mcy.hex())
-        write_le32(mcz.hex())
-        write_le32(mcr.hex())
+        write_le32s(mcx.hex(), mcy.hex(), mcz.hex(), mcr.hex())
     else:
         after_output_mcx = mcx
         after_output_mcy = mcy
@@ -5329,8 +5433,7 @@ def _Std_Model_put_point_info(
             _dma_u32 = (-e_dif_dma) & 0xFFFFFFFF
             _ram_u32 = r_dif_ram    & 0xFFFFFFFF
 
-            write_le32((-e_dif_dma) & 0xFFFFFFFF)
-            write_le32(r_dif_ram & 0xFFFFFFFF)
+            write_le32s(_dma_u32, _ram_u32)
 
             self.RAM_ADRS += 8
             object_all_address += 8
@@ -5348,10 +5451,9 @@ def _Std_Model_put_point_info(
     yp = Std_Float(float(yp) * allScale)
     zp = Std_Float(float(zp) * allScale)
 
-    # Emit position words.
-    write_le32(xp.hex() | 1)
-    write_le32(yp.hex())
-    write_le32(zp.hex())
+    # Position words; the rest of the record is appended below and the
+    # whole vertex is emitted with a single write_le32s at the end.
+    rec = [xp.hex() | 1, yp.hex(), zp.hex()]
 
     # Advance address counters.
     if True:
@@ -5410,15 +5512,11 @@ def _Std_Model_put_point_info(
             chk_before_bump_nrm1_z = tnz1
 
             nrml_word = (nx.hex() & ~1) | same_bump
-            write_le32(nrml_word & 0xFFFFFFFF)
-            write_le32(ny.hex())
-            write_le32(nz.hex())
+            rec += (nrml_word & 0xFFFFFFFF, ny.hex(), nz.hex())
 
         else:
             # E1b — plain flat/gouraud normal
-            write_le32(nx.hex())
-            write_le32(ny.hex())
-            write_le32(nz.hex())
+            rec += (nx.hex(), ny.hex(), nz.hex())
 
     else:
         # E2 — shading_type == 7, not bump: packed nrml + vertex colour
@@ -5440,24 +5538,23 @@ def _Std_Model_put_point_info(
             vtcl = (va << 24) | (vr << 16) | (vg << 8) | vb
             vtcl_out, vtcl2 = vtcl, vtcl
 
-            write_le32(nrml)
-            write_le32(vtcl_out & 0xFFFFFFFF)
-            write_le32(vtcl2   & 0xFFFFFFFF)
+            rec += (nrml, vtcl_out & 0xFFFFFFFF, vtcl2 & 0xFFFFFFFF)
         else:
             # NL1: write packed normal + colour pair
             vtcl = (va << 24) | (vr << 16) | (vg << 8) | vb
 
-            write_le32(nrml);  write_le32(vtcl);  write_le32(vtcl)
+            rec += (nrml, vtcl, vtcl)
 
     # F. Bump tex-normal emit (only when bump_polygon)
     if bump_polygon:
-        write_le32(tnx0.hex()); write_le32(tny0.hex()); write_le32(tnz0.hex())
-        write_le32(tnx1.hex()); write_le32(tny1.hex()); write_le32(tnz1.hex())
+        rec += (tnx0.hex(), tny0.hex(), tnz0.hex(),
+                tnx1.hex(), tny1.hex(), tnz1.hex())
 
     # G. UV emit
     if True:
-        write_le32(u.hex())
-        write_le32(v.hex() | 1)
+        rec += (u.hex(), v.hex() | 1)
+
+    write_le32s(*rec)
 
 # naomi2hg_put_point_info
 # NAOMI2 / "naomi2hg" variant of put_point_info.
@@ -5563,12 +5660,7 @@ def _Std_Model_naomi2hg_put_point_info(
             # Negative RAM delta: accounts for `mov @R_poly+,r0; add R_poly,r0`
             r_dif_ram = -(dif_ram + 8)
 
-            if flag == 0:
-                write_le32((-e_dif_dma) & 0xFFFFFFFF)
-                write_le32(r_dif_ram    & 0xFFFFFFFF)
-            else:
-                write_le32((-e_dif_dma) & 0xFFFFFFFF)
-                write_le32(r_dif_ram    & 0xFFFFFFFF)
+            write_le32s((-e_dif_dma) & 0xFFFFFFFF, r_dif_ram & 0xFFFFFFFF)
 
             self.RAM_ADRS        += 8
             object_all_address += 8
@@ -5611,11 +5703,8 @@ def _Std_Model_naomi2hg_put_point_info(
         topo_byte |= 0x80
 
     flag_word = (topo_byte << 24) | (nrml & 0x00FFFFFF)
-    write_le32(flag_word)
-
-    write_le32(xp.hex())
-    write_le32(yp.hex())
-    write_le32(zp.hex())
+    # flag+xyz; the rest of the record is appended below and emitted once.
+    rec = [flag_word, xp.hex(), yp.hex(), zp.hex()]
 
     # Address accounting (RAM / object / naomi2hg)
     # E. Normal / vertex-colour emit
@@ -5648,8 +5737,7 @@ def _Std_Model_naomi2hg_put_point_info(
 
     if not env_map_polygon:
         if True:
-            write_le32(u.hex())
-            write_le32(v.hex())
+            rec += (u.hex(), v.hex())
 
     _DK_MAT_PHONG    = 4
     _DK_MAT_CONSTANT = 1
@@ -5709,8 +5797,7 @@ def _Std_Model_naomi2hg_put_point_info(
         vtcl = (va << 24) | (vr << 16) | (vg << 8) | vb
 
         # Colour words written after UV — matches order: flag+xyz+uv+vtcl+vtcl2
-        write_le32(vtcl & 0xFFFFFFFF)
-        write_le32(vtcl & 0xFFFFFFFF)
+        rec += (vtcl & 0xFFFFFFFF, vtcl & 0xFFFFFFFF)
     # F. Bump tex-normal emit (naomi2hg path)
     if bump_polygon:
         mc0 = sas.mc[0]
@@ -5728,10 +5815,117 @@ def _Std_Model_naomi2hg_put_point_info(
             (f2i255(float(tny1)) << 8)  |
             (f2i255(float(tnz1)) << 16)
         )
-        write_le32(offset_scale & 0xFFFFFFFF)
-        write_le32(tx0nrml     & 0xFFFFFFFF)
-        write_le32(tx1nrml     & 0xFFFFFFFF)
-        write_le32(0)
+        rec += (offset_scale & 0xFFFFFFFF,
+                tx0nrml      & 0xFFFFFFFF,
+                tx1nrml      & 0xFFFFFFFF,
+                0)
+
+    write_le32s(*rec)
+
+
+# naomi2hg_put_strip_points
+# Whole-strip variant of naomi2hg_put_point_info for the common case (no
+# super-index back-references, no bump tex-normals): each vertex's fields
+# are gathered once, normals / colours are packed as arrays, and the strip
+# is emitted as one structured block laid out exactly like the per-vertex
+# records (flag+xyz [+uv] [+rgb pair]).  Only called for naomi2hg output;
+# returns False when the strip needs the per-vertex path.
+
+# NL2 vertex record layouts keyed by (has_uv, has_rgb) from MODEL_DATA_FLAGS;
+# shared with the importer, which reads the same records.
+_NL2_VERTEX_DTYPES = {
+    (has_uv, has_rgb): np.dtype(
+        [('flag', '<u4'), ('x', '<f4'), ('y', '<f4'), ('z', '<f4')]
+        + ([('u', '<f4'), ('v', '<f4')] if has_uv else [])
+        + ([('base_rgb', '<u4'), ('offset_rgb', '<u4')] if has_rgb else []))
+    for has_uv in (False, True) for has_rgb in (False, True)
+}
+
+
+def _f2i255_array(x: np.ndarray) -> np.ndarray:
+    """Vector f2i255: int(x * 128) clamped to [-128, 127], as uint8 bits."""
+    return (np.clip(np.trunc(x * 128.0), -128, 127).astype(np.int64) & 0xFF).astype(np.uint32)
+
+
+def _Std_Model_naomi2hg_put_strip_points(
+        self: "Std_Model",
+        s:    "StripData",
+        tex:  bool,
+) -> bool:
+    if super_index_format or bump_polygon:
+        return False
+
+    global naomi2hg_all_address, object_all_address
+
+    n = s.strip_num
+    if n == 0:
+        return True
+    spnt = self.point_list
+    spol = self.polygon
+    mats = self.material
+
+    pols  = [spol[p.pol_idx] for p in s.pi[:n]]
+    infos = [pol.info_list[p.inf_idx] for pol, p in zip(pols, s.pi[:n])]
+
+    has_rgb = {mats[pol.material_index].shading_type == 7 for pol in pols}
+    if len(has_rgb) != 1:
+        return False
+    has_rgb = has_rgb.pop()
+    has_uv  = not env_map_polygon
+
+    # A. Normal selection — per-vertex for gouraud, else the polygon normal
+    #    (or the vertex one again when flat_not_normal_calc).
+    nrm = np.array([
+        (float(i.nx), float(i.ny), float(i.nz))
+        if pol.gr or flat_not_normal_calc else
+        (float(pol.normal.x), float(pol.normal.y), float(pol.normal.z))
+        for pol, i in zip(pols, infos)
+    ], dtype=np.float64).astype(np.float32).astype(np.float64)
+    nrml = (_f2i255_array(nrm[:, 0])
+            | _f2i255_array(nrm[:, 1]) << 8
+            | _f2i255_array(nrm[:, 2]) << 16)
+
+    # Topology byte: BT0/BT0/BT1 then strip (0x20) or fan (0x40); 0x80 = V_END
+    no = np.arange(n)
+    if s._NL_PF_TRIANGLE == 1:
+        no = no % 3
+        topo = np.where(no == 2, 0x60 | 0x80, 0x00)
+    else:
+        cont = 0x20 if s._NL_PF_STRIP == 1 else 0x40
+        topo = np.where(no <= 1, 0x00, np.where(no == 2, 0x60, cont))
+        topo[-1] |= 0x80
+
+    rec = np.empty(n, dtype=_NL2_VERTEX_DTYPES[(has_uv, has_rgb)])
+    rec['flag'] = (topo.astype(np.uint32) << 24) | nrml
+
+    # D. Position, single-precision then global scale
+    pts = [spnt[i.point_index] for i in infos]
+    xyz = np.array([(float(p.x), float(p.y), float(p.z)) for p in pts],
+                   dtype=np.float64).astype(np.float32)
+    xyz = (xyz.astype(np.float64) * allScale).astype(np.float32)
+    rec['x'], rec['y'], rec['z'] = xyz[:, 0], xyz[:, 1], xyz[:, 2]
+
+    # G. UV (v negated), zero when untextured
+    if has_uv:
+        if tex:
+            rec['u'] = np.array([float(i.u) for i in infos], dtype=np.float64)
+            rec['v'] = -np.array([float(i.v) for i in infos], dtype=np.float64)
+        else:
+            rec['u'] = rec['v'] = 0.0
+
+    # E2. Packed ARGB vertex colour, written twice
+    if has_rgb:
+        argb = np.array([(i.vtx_color_A, i.vtx_color_R, i.vtx_color_G, i.vtx_color_B)
+                         for i in infos], dtype=np.int64) & 0xFF
+        vtcl = (argb[:, 0] << 24 | argb[:, 1] << 16 | argb[:, 2] << 8 | argb[:, 3]).astype(np.uint32)
+        rec['base_rgb'] = rec['offset_rgb'] = vtcl
+
+    write_block(rec.tobytes())
+
+    self.RAM_ADRS          += n * _NL_PF_PolygonFormat2_size
+    object_all_address     += n * _NL_PF_PolygonFormat2_size
+    naomi2hg_all_address   += n * (16 if env_map_polygon else 24)
+    return True
 
 
 # Std_Model.chk_si_rate
@@ -6689,12 +6883,12 @@ def global_info_disp(null_flag: int) -> None:
     else:
         format_flag = 0
 
-    write_le32(format_flag & 0xFFFFFFFF)
-    write_le32((after_output_sta | 1) & 0xFFFFFFFF)
-    write_le32(after_output_mcx.hex())
-    write_le32(after_output_mcy.hex())
-    write_le32(after_output_mcz.hex())
-    write_le32(after_output_mcr.hex())
+    write_le32s(format_flag & 0xFFFFFFFF,
+                (after_output_sta | 1) & 0xFFFFFFFF,
+                after_output_mcx.hex(),
+                after_output_mcy.hex(),
+                after_output_mcz.hex(),
+                after_output_mcr.hex())
 
 
 class MODEL_ALL_INFO:
@@ -6972,7 +7166,6 @@ def naomi2hg_put_gmp(sas: "SAVE_ALL_STRIP") -> None:
     # Hardcoded NL2 constant
     # NOT derived from NL_PF_ fields — the GMP uses its own parameter control word.
     PCW_GMP = 0x08000500
-    write_le32(PCW_GMP)
 
     # Layout: byte[0]=para0_gloss, byte[1]=para1_gloss, byte[2]=0, byte[3]=0
     if sas.use2para == 0:
@@ -6985,7 +7178,7 @@ def naomi2hg_put_gmp(sas: "SAVE_ALL_STRIP") -> None:
         g0 = naomi2hg_gloss[exp0]
         g1 = naomi2hg_gloss[exp1]
     gloss_val = (g1 << 8) | g0
-    write_le32(gloss_val & 0xFFFFFFFF)
+    write_le32s(PCW_GMP, gloss_val & 0xFFFFFFFF)
 
     env = sas.env_map_polygon
 
@@ -7040,11 +7233,11 @@ def naomi2hg_put_gmp(sas: "SAVE_ALL_STRIP") -> None:
                 diff0, spec0 = diffuse_color, 0
                 diff1, spec1 = diffuse_color, 0
 
-        write_le32(select_word & 0xFFFFFFFF)
-        write_le32(diff0 & 0xFFFFFFFF)
-        write_le32(spec0 & 0xFFFFFFFF)
-        write_le32(diff1 & 0xFFFFFFFF)
-        write_le32(spec1 & 0xFFFFFFFF)
+        write_le32s(select_word & 0xFFFFFFFF,
+                    diff0 & 0xFFFFFFFF,
+                    spec0 & 0xFFFFFFFF,
+                    diff1 & 0xFFFFFFFF,
+                    spec1 & 0xFFFFFFFF)
 
     else:
         def _pack_mc(mc):
@@ -7104,11 +7297,11 @@ def naomi2hg_put_gmp(sas: "SAVE_ALL_STRIP") -> None:
             (b0 << 22) | (b1 << 21) |
             (env << 2) | (env << 1)
         )
-        write_le32(select_word & 0xFFFFFFFF)
-        write_le32(diffuse_color0  & 0xFFFFFFFF)
-        write_le32(specular_color0 & 0xFFFFFFFF)
-        write_le32(diffuse_color1  & 0xFFFFFFFF)
-        write_le32(specular_color1 & 0xFFFFFFFF)
+        write_le32s(select_word     & 0xFFFFFFFF,
+                    diffuse_color0  & 0xFFFFFFFF,
+                    specular_color0 & 0xFFFFFFFF,
+                    diffuse_color1  & 0xFFFFFFFF,
+                    specular_color1 & 0xFFFFFFFF)
 
     write_le32(0)
 
@@ -7116,19 +7309,15 @@ def naomi2hg_put_gmp(sas: "SAVE_ALL_STRIP") -> None:
     PCW_NULL = 0x08000000
 
     def _emit_tex_pal(mc, mat_ref, is_bump):
-        write_le32(PCW_NULL)
         if mc.texture_flag:
             tex_id = mc.tex_id if mc.tex_id >= 0 else -1
-            write_le32(tex_id & 0xFFFFFFFF)
         else:
-            write_le32(0xFFFFFFFF)
-
-        write_le32(PCW_NULL)
+            tex_id = -1
         if mc.palette_flag >= 1:
             pal_id = mc.pal_direct_num if mc.palette_flag == 2 else -1
-            write_le32(pal_id & 0xFFFFFFFF)
         else:
-            write_le32(0xFFFFFFFF)
+            pal_id = -1
+        write_le32s(PCW_NULL, tex_id & 0xFFFFFFFF, PCW_NULL, pal_id & 0xFFFFFFFF)
 
     _emit_tex_pal(sas.mc[0], mat, sas.bump_polygon)
 
@@ -7250,7 +7439,6 @@ def naomi2hg_put_pvr(
         (gr                 << NL_PF_Gouraud  ) |
         (mc._NL_PF_16bit_UV << NL_PF_16bit_UV)
     )
-    write_le32(pcw & 0xFFFFFFFF)
 
     # Word 1: ISP_TSP_instruction 
     isp_tsp = (
@@ -7264,7 +7452,6 @@ def naomi2hg_put_pvr(
         (mc._NL_PF_CacheBypass      << NL_PF_CacheBypass      ) |
         (mc._NL_PF_DcalcCtrl        << NL_PF_DcalcCtrl        )
     )
-    write_le32(isp_tsp & 0xFFFFFFFF)
 
     # Word 2: TSP_instruction 
     tsp = (
@@ -7285,7 +7472,6 @@ def naomi2hg_put_pvr(
         (mc._NL_PF_TextureSize_U       << NL_PF_TextureSize_U      ) |
         (mc._NL_PF_TextureSize_V       << NL_PF_TextureSize_V      )
     )
-    write_le32(tsp & 0xFFFFFFFF)
 
     # Word 3: texture_control 
     tex_ctrl = (
@@ -7296,7 +7482,6 @@ def naomi2hg_put_pvr(
         (mc._NL_PF_StrideSelect     << NL_PF_StrideSelect     ) |
         (mc._NL_PF_TextureAddress   << NL_PF_TextureAddress   )
     )
-    write_le32(tex_ctrl & 0xFFFFFFFF)
 
     # Words 4-5: TSP2 + TexCtrl2 
     # Always written for both single-para and vol2para.
@@ -7329,12 +7514,9 @@ def naomi2hg_put_pvr(
             (mc1._NL_PF_StrideSelect   << NL_PF_StrideSelect   ) |
             (mc1._NL_PF_TextureAddress << NL_PF_TextureAddress )
         )
-        write_le32(tsp2 & 0xFFFFFFFF)
-        write_le32(tex_ctrl2 & 0xFFFFFFFF)
     else:
         # Single-para: duplicate para0 TSP+TexCtrl into para1 slot
-        write_le32(tsp & 0xFFFFFFFF)
-        write_le32(tex_ctrl & 0xFFFFFFFF)
+        tsp2, tex_ctrl2 = tsp, tex_ctrl
 
     # Derived from reference binary (0x0000000A for textured lambert with normals):
     #   bit0 = ??? (0 in reference — not used for "vertex present", XYZ always written)
@@ -7377,10 +7559,16 @@ def naomi2hg_put_pvr(
     if Bump:     flags_parts.append(" | naomi2hg_Bump")
     if Bump1:    flags_parts.append(" | naomi2hg_Bump1")
 
-    write_le32(model_data_flags & 0xFFFFFFFF)
-
     vtx_ct = get_vertex_count_until_not_gp(s)
-    write_le32(vtx_ct & 0xFFFFFFFF)
+    # PCW, ISP_TSP, TSP, TexCtrl, TSP2, TexCtrl2, MODEL_DATA_FLAGS, vertex count
+    write_le32s(pcw              & 0xFFFFFFFF,
+                isp_tsp          & 0xFFFFFFFF,
+                tsp              & 0xFFFFFFFF,
+                tex_ctrl         & 0xFFFFFFFF,
+                tsp2             & 0xFFFFFFFF,
+                tex_ctrl2        & 0xFFFFFFFF,
+                model_data_flags & 0xFFFFFFFF,
+                vtx_ct           & 0xFFFFFFFF)
 # Std_Model.put_strip_point2
 # The inner loop that actually emits every gflag header + vertex record for
 # a single material's strip list.  This is the true workhorse called by both
@@ -7460,6 +7648,11 @@ def _Std_Model_put_strip_point2(
                 cnt = s.strip_num
                 write_le32(cnt & 0xFFFFFFFF)
 
+        if naomi2hg and self.naomi2hg_put_strip_points(s, s.tex.v0):
+            s.pi = None
+            s = s.next
+            continue
+
         for i in range(s.strip_num):
             if naomi2hg:
                 v_end = 0
@@ -9459,6 +9652,7 @@ class NlcvOptions:
     div_concave: bool = False
     div_trnsl: bool = False
     adjust_uv: bool = False
+    strip_cache: bool = True
 
     @classmethod
     def defaults(cls) -> "NlcvOptions":
@@ -9571,6 +9765,7 @@ Std_Model.set_same_point_sort_sidx = _Std_Model_set_same_point_sort_sidx
 Std_Model.srch_polygon_strip = _Std_Model_srch_polygon_strip
 Std_Model.put_point_info = _Std_Model_put_point_info
 Std_Model.naomi2hg_put_point_info = _Std_Model_naomi2hg_put_point_info
+Std_Model.naomi2hg_put_strip_points = _Std_Model_naomi2hg_put_strip_points
 Std_Model.chk_si_rate = _Std_Model_chk_si_rate
 Std_Model.put_point_info2 = _Std_Model_put_point_info2
 Std_Model.chk_sprite = _Std_Model_chk_sprite
@@ -9783,91 +9978,179 @@ def write_uint8_at(file_data, offset, value):
     struct.pack_into("<B", file_data, offset, value)
 
 
-def get_vertex_colors(obj, merge_map=None):
-    original_mode = bpy.context.object.mode if bpy.context.object else 'OBJECT'
-    was_active = bpy.context.view_layer.objects.active
-    bpy.context.view_layer.objects.active = obj
-    vertex_colors_data = {}
-
-    _vcols = (obj.data.color_attributes
-              if hasattr(obj.data, 'color_attributes')
-              else obj.data.vertex_colors)
-
-    try:
-        if original_mode == 'EDIT' and obj == bpy.context.view_layer.objects.active:
-            bm = bmesh.from_edit_mesh(obj.data)
-            active = _vcols.active if _vcols else None
-            if active:
-                color_layer_name = active.name
-                if color_layer_name in bm.loops.layers.color:
-                    color_layer = bm.loops.layers.color[color_layer_name]
-                    for face in bm.faces:
-                        for loop in face.loops:
-                            vertex_index = loop.vert.index
-                            color = loop[color_layer]
-                            vertex_colors_data[vertex_index] = (
-                                color[0], color[1], color[2], color[3]
-                            )
-        else:
-            active = _vcols.active if _vcols else None
-            if active:
-                for loop in obj.data.loops:
-                    vertex_index = loop.vertex_index
-                    color = active.data[loop.index].color
-                    vertex_colors_data[vertex_index] = (
-                        color[0], color[1], color[2], color[3]
-                    )
-    finally:
-        bpy.context.view_layer.objects.active = was_active
+def nl_slot_maps(obj):
+    """Import-time binary vertex-slot tables for obj: ``(merge_map, uvs)``.
 
+    ``merge_map`` maps every slot of the source strip data to a mesh vertex
+    (None when slots are the mesh vertices one-to-one); ``uvs`` is an (N, 2)
+    float32 array of hardware UVs in slot order, or None.  Read from the
+    mesh attributes the importer writes — ``nl_uv`` (POINT, unwelded) or
+    ``nl_slot``/``nl_uv_u``/``nl_uv_v`` (CORNER, welded) — falling back to
+    the ``nl_merge_map``/``nl_uv_map`` ID-property lists of older files.
+    """
+    mesh = obj.data
+    attrs = getattr(mesh, 'attributes', None)
+    uv_attr = attrs.get('nl_uv') if attrs is not None else None
+    slot_attr = attrs.get('nl_slot') if attrs is not None else None
+
+    if uv_attr is not None and uv_attr.domain == 'POINT':
+        uvs = np.empty(len(uv_attr.data) * 2, dtype=np.float32)
+        uv_attr.data.foreach_get('vector', uvs)
+        return None, uvs.reshape(-1, 2)
+
+    if slot_attr is not None and slot_attr.domain == 'CORNER':
+        n_loops = len(mesh.loops)
+        loop_slot = np.empty(n_loops, dtype=np.int32)
+        slot_attr.data.foreach_get('value', loop_slot)
+        loop_vi = np.empty(n_loops, dtype=np.int64)
+        mesh.loops.foreach_get('vertex_index', loop_vi)
+        count = int(obj.get('nl_slot_count', 0)) or (int(loop_slot.max()) + 1 if n_loops else 0)
+        keep = (loop_slot >= 0) & (loop_slot < count)
+        merge_map = np.zeros(count, dtype=np.int64)
+        merge_map[loop_slot[keep]] = loop_vi[keep]
+        # Slots no face references keep the mapping computed at import
+        extra = np.asarray(list(obj.get('nl_merge_extra', ())), dtype=np.int64).reshape(-1, 2)
+        if len(extra):
+            merge_map[extra[:, 0]] = extra[:, 1]
+        uvs = np.zeros((count, 2), dtype=np.float32)
+        u_attr, v_attr = attrs.get('nl_uv_u'), attrs.get('nl_uv_v')
+        if u_attr is not None and v_attr is not None:
+            col = np.empty(n_loops, dtype=np.float32)
+            u_attr.data.foreach_get('value', col)
+            uvs[loop_slot[keep], 0] = col[keep]
+            v_attr.data.foreach_get('value', col)
+            uvs[loop_slot[keep], 1] = col[keep]
+        return merge_map, uvs
+
+    # Legacy ID-property lists
+    merge_map = obj.get("nl_merge_map")
     if merge_map is not None:
-        return {orig_i: vertex_colors_data[merge_map[orig_i]]
-                for orig_i in range(len(merge_map))
-                if merge_map[orig_i] in vertex_colors_data}
-
-    return vertex_colors_data
-
+        merge_map = np.asarray(list(merge_map), dtype=np.int64)
+    uv_flat = obj.get("nl_uv_map")
+    uvs = None
+    if uv_flat is not None:
+        uvs = np.asarray(list(uv_flat), dtype=np.float64)
+        uvs = uvs[:len(uvs) // 2 * 2].reshape(-1, 2)
+    return merge_map, uvs
 
-def get_vertex_uvs(obj, merge_map=None):
-    # Prefer nl_uv_map (import-stored, hardware UV space); fall back to Blender UV layer
-    _nl_uv_flat = obj.get("nl_uv_map")
-    if _nl_uv_flat is not None:
-        n = len(_nl_uv_flat) // 2
-        return {i: (_nl_uv_flat[i * 2], _nl_uv_flat[i * 2 + 1]) for i in range(n)}
 
-    original_mode = bpy.context.object.mode if bpy.context.object else 'OBJECT'
-    was_active = bpy.context.view_layer.objects.active
-    bpy.context.view_layer.objects.active = obj
-    vertex_uv_data = {}
-
-    try:
-        if original_mode == 'EDIT' and obj == bpy.context.view_layer.objects.active:
-            bm = bmesh.from_edit_mesh(obj.data)
-            if bm.loops.layers.uv.active:
-                uv_layer = bm.loops.layers.uv.active
-                for face in bm.faces:
-                    for loop in face.loops:
-                        vertex_index = loop.vert.index
-                        if vertex_index not in vertex_uv_data:
-                            uv = loop[uv_layer]
-                            vertex_uv_data[vertex_index] = (uv.uv[0], uv.uv[1])
-        else:
-            if obj.data.uv_layers.active:
-                uv_layer = obj.data.uv_layers.active
-                for loop in obj.data.loops:
-                    vertex_index = loop.vertex_index
-                    if vertex_index not in vertex_uv_data:
-                        uv = uv_layer.data[loop.index].uv
-                        vertex_uv_data[vertex_index] = (uv[0], uv[1])
-    finally:
-        bpy.context.view_layer.objects.active = was_active
+def vertex_color_array(obj, merge_map=None):
+    """Per-vertex colours of the active colour layer.
 
+    Returns ``(colors, valid)``: an (N, 4) float array and a bool mask of
+    slots that received a colour, or None when the mesh has no active colour
+    layer.  Corner colours resolve last-loop-wins.
+    """
+    mesh = obj.data
+    _vcols = (mesh.color_attributes
+              if hasattr(mesh, 'color_attributes')
+              else mesh.vertex_colors)
+    active = _vcols.active if _vcols else None
+    if not active:
+        return None
+
+    n_verts = len(mesh.vertices)
+    colors = np.zeros((n_verts, 4), dtype=np.float64)
+    valid = np.zeros(n_verts, dtype=bool)
+
+    if getattr(active, 'domain', 'CORNER') == 'POINT':
+        flat = np.empty(n_verts * 4, dtype=np.float32)
+        active.data.foreach_get('color', flat)
+        colors[:] = flat.reshape(-1, 4)
+        valid[:] = True
+    else:
+        n_loops = len(mesh.loops)
+        flat = np.empty(n_loops * 4, dtype=np.float32)
+        active.data.foreach_get('color', flat)
+        loop_vi = np.empty(n_loops, dtype=np.int64)
+        mesh.loops.foreach_get('vertex_index', loop_vi)
+        # Last loop touching a vertex wins: take the first hit in reverse.
+        vi_rev = loop_vi[::-1]
+        vis, first = np.unique(vi_rev, return_index=True)
+        colors[vis] = flat.reshape(-1, 4)[::-1][first]
+        valid[vis] = True
+
+    return _expand_by_merge_map(colors, valid, merge_map)
+
+
+def vertex_uv_array(obj, merge_map=None):
+    """Per-vertex UVs, preferring the import-stored hardware UVs.
+
+    Returns ``(uvs, valid)`` with an (N, 2) float array, or None when there
+    are neither import-stored slot UVs (nl_slot_maps) nor an active UV layer.
+    Blender UVs resolve first-loop-wins; slot UVs are already in slot order
+    and bypass the merge map.
+    """
+    _slot_uvs = nl_slot_maps(obj)[1]
+    if _slot_uvs is not None:
+        return _slot_uvs, np.ones(len(_slot_uvs), dtype=bool)
+
+    mesh = obj.data
+    uv_layer = mesh.uv_layers.active
+    if not uv_layer:
+        return None
+
+    n_verts = len(mesh.vertices)
+    n_loops = len(mesh.loops)
+    flat = np.empty(n_loops * 2, dtype=np.float32)
+    uv_layer.data.foreach_get('uv', flat)
+    loop_vi = np.empty(n_loops, dtype=np.int64)
+    mesh.loops.foreach_get('vertex_index', loop_vi)
+
+    uvs = np.zeros((n_verts, 2), dtype=np.float64)
+    valid = np.zeros(n_verts, dtype=bool)
+    vis, first = np.unique(loop_vi, return_index=True)
+    uvs[vis] = flat.reshape(-1, 2)[first]
+    valid[vis] = True
+
+    return _expand_by_merge_map(uvs, valid, merge_map)
+
+
+def _expand_by_merge_map(values, valid, merge_map):
+    if merge_map is None:
+        return values, valid
+    mm = np.asarray(merge_map, dtype=np.int64)
+    inside = (mm >= 0) & (mm < len(valid))
+    out_valid = np.zeros(len(mm), dtype=bool)
+    out_valid[inside] = valid[mm[inside]]
+    out = np.zeros((len(mm),) + values.shape[1:], dtype=values.dtype)
+    out[inside] = values[mm[inside]]
+    return out, out_valid
+
+
+def vertex_world_positions(obj, merge_map=None):
+    """World-space vertex positions as an (N, 3) float32 array, expanded
+    through the slot merge map (nl_slot_maps) when given."""
+    mesh = obj.data
+    n_verts = len(mesh.vertices)
+    co = np.empty(n_verts * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', co)
+    co = co.reshape(-1, 3)
+    mw = np.array(obj.matrix_world, dtype=np.float32)
+    world = (co @ mw[:3, :3].T + mw[:3, 3]).astype(np.float32)
     if merge_map is not None:
-        return {orig_i: vertex_uv_data[merge_map[orig_i]]
-                for orig_i in range(len(merge_map))
-                if merge_map[orig_i] in vertex_uv_data}
+        world = world[np.asarray(merge_map, dtype=np.int64)]
+    return world
+
 
-    return vertex_uv_data
+def remap_array(co, forward: str = _DEFAULT_FORWARD,
+                up: str = _DEFAULT_UP,
+                neg_x: bool = _DEFAULT_NEG_X):
+    """Vectorised make_remap(): (N, 3) Blender coords → (N, 3) float32."""
+    key = (forward, up)
+    if key not in _AXIS_TABLE:
+        raise ValueError(
+            f"Invalid axis combination forward={forward!r} up={up!r}. "
+            f"Axes must be orthogonal and from: +X -X +Y -Y +Z -Z.")
+    xi, xs, yi, ys, zi, zs = _AXIS_TABLE[key]
+    if neg_x:
+        xs = -xs
+    co = np.asarray(co, dtype=np.float32).reshape(-1, 3)
+    out = np.empty_like(co)
+    out[:, 0] = co[:, xi] * xs
+    out[:, 1] = co[:, yi] * ys
+    out[:, 2] = co[:, zi] * zs
+    return out
 
 
 def mesh_data_update(collection):
@@ -10023,7 +10306,179 @@ def _sort_mesh_objects_for_export(mesh_objects):
     return ordered
 
 
+# NL1 vertex records are a fixed 32 bytes (xyz, normal/colour, uv); a word in
+# this range is an 8-byte Type-B pointer to an earlier vertex instead.
+NL_VERTEX_STRIDE = 32
+NL_POINTER_MIN   = 0x5FF00000
+NL_POINTER_MAX   = 0x5FFFFFFF
+NL_MESH_HEADER   = 0x4C    # param..offset colour, up to mesh_data_size
+
+
+def index_naomi_bin(data):
+    """Walk an NL1 model once and return the patchable layout.
+
+    One dict per mesh slot: ``offset`` (its parameter word), ``end``,
+    ``vertices`` — an int64 array holding the byte offset of every
+    non-pointer vertex record in strip order — and ``pointers``, the offsets
+    of the Type-B pointer records, which are never patched.
+    """
+    unpack = _LE32.unpack_from
+    size = len(data)
+    meshes = []
+    pos = 0x18
+
+    while pos < size - 4:
+        if unpack(data, pos)[0] == 0:
+            break
+        mesh_offset = pos
+        pos += NL_MESH_HEADER
+        if pos + 4 > size:
+            break
+        mesh_end = pos + 4 + unpack(data, pos)[0]
+        pos += 4
+
+        vertices = []
+        pointers = []
+        append = vertices.append
+        while pos < mesh_end and pos < size - 8:
+            face_type = unpack(data, pos)[0]
+            n_faces = unpack(data, pos + 4)[0]
+            pos += 8
+            n_vertices = n_faces * 3 if (face_type >> 3) & 1 else n_faces
+            for _ in range(n_vertices):
+                if pos >= mesh_end or pos + NL_VERTEX_STRIDE > size:
+                    break       # size fields pointing past EOF
+                if NL_POINTER_MIN <= unpack(data, pos)[0] <= NL_POINTER_MAX:
+                    pointers.append(pos)
+                    pos += 8
+                else:
+                    append(pos)
+                    pos += NL_VERTEX_STRIDE
+
+        meshes.append({
+            'offset':   mesh_offset,
+            'end':      mesh_end,
+            'vertices': np.asarray(vertices, dtype=np.int64),
+            'pointers': np.asarray(pointers, dtype=np.int64),
+        })
+        pos = mesh_end
+
+    return meshes
+
+
+# Layout index as stored in naomi_import_meta.layout_index: magic, mesh count,
+# then per mesh (offset, end, n_vertices, n_pointers), followed by every
+# vertex and pointer offset delta-coded against its predecessor.  Records are
+# mostly 32 bytes apart, so zlib shrinks it to a few bytes per strip.
+_LAYOUT_INDEX_MAGIC = b'NLX1'
+
+
+def pack_layout_index(layout) -> str:
+    """Serialise an index_naomi_bin() layout to a compact ASCII string."""
+    heads = np.array([(m['offset'], m['end'], len(m['vertices']), len(m['pointers']))
+                      for m in layout], dtype='<u4').reshape(-1, 4)
+    offsets = [a for m in layout for a in (m['vertices'], m['pointers'])]
+    flat = np.concatenate(offsets) if offsets else np.zeros(0, dtype=np.int64)
+    deltas = np.diff(flat, prepend=0).astype('<i4')
+    raw = (_LAYOUT_INDEX_MAGIC + struct.pack('<I', len(layout))
+           + heads.tobytes() + deltas.tobytes())
+    return base64.b64encode(zlib.compress(raw, 9)).decode('ascii')
+
+
+def unpack_layout_index(text: str, file_size: int):
+    """Inverse of pack_layout_index(); returns None if *text* is empty,
+    malformed or points outside a file of *file_size* bytes."""
+    if not text:
+        return None
+    try:
+        raw = zlib.decompress(base64.b64decode(text))
+    except (ValueError, zlib.error):
+        return None
+    if raw[:4] != _LAYOUT_INDEX_MAGIC or len(raw) < 8:
+        return None
+    n_meshes = struct.unpack_from('<I', raw, 4)[0]
+    head_end = 8 + n_meshes * 16
+    if len(raw) < head_end or (len(raw) - head_end) % 4:
+        return None
+    heads = np.frombuffer(raw, dtype='<u4', count=n_meshes * 4, offset=8).reshape(-1, 4)
+    flat = np.cumsum(np.frombuffer(raw, dtype='<i4', offset=head_end).astype(np.int64))
+    if len(flat) != int(heads[:, 2:].sum()):
+        return None
+    if len(flat) and (flat.min() < 0 or flat.max() + NL_VERTEX_STRIDE > file_size):
+        return None
+    if n_meshes and int(heads[:, 1].max()) > file_size:
+        return None
+
+    layout = []
+    pos = 0
+    for offset, end, n_verts, n_ptrs in heads.tolist():
+        layout.append({
+            'offset':   offset,
+            'end':      end,
+            'vertices': flat[pos:pos + n_verts],
+            'pointers': flat[pos + n_verts:pos + n_verts + n_ptrs],
+        })
+        pos += n_verts + n_ptrs
+    return layout
+
+
+def _mesh_vertex_patches(obj, vertex_offsets, remap_axes):
+    """(word_index, uint32 value) arrays for one mesh's vertex records."""
+    p = obj.naomi_param
+    merge_map, slot_uvs = nl_slot_maps(obj)
+
+    positions = remap_array(vertex_world_positions(obj, merge_map), *remap_axes)
+    n = min(len(positions), len(vertex_offsets))
+    if n == 0:
+        return [], []
+    base = vertex_offsets[:n] // 4
+    positions = positions[:n]
+
+    idx = [base, base + 1, base + 2]
+    val = [positions[:, 0].view(np.uint32) | np.uint32(1),    # x keeps bit 0 set
+           positions[:, 1].view(np.uint32),
+           positions[:, 2].view(np.uint32)]
+
+    if getattr(p, 'm_tex_shading', 0) == -3:                 # Type C colours
+        cols = vertex_color_array(obj, merge_map)
+        if cols is not None:
+            c, ok = cols[0][:n], cols[1][:n]
+            b = np.clip(c * 255, 0, 255).astype(np.uint32)
+            packed = b[:, 2] | (b[:, 1] << 8) | (b[:, 0] << 16) | (b[:, 3] << 24)
+            hit = np.flatnonzero(ok)
+            idx += [base[hit] + 4, base[hit] + 5]
+            val += [packed[hit], packed[hit]]
+
+    # UV sits in the last two words of every record type (A, C and D).
+    if p.mh_texID == -1:
+        idx += [base + 6, base + 7]
+        val += [np.zeros(n, dtype=np.uint32), np.ones(n, dtype=np.uint32)]
+    else:
+        if slot_uvs is not None:
+            uvs = slot_uvs, np.ones(len(slot_uvs), dtype=bool)
+        else:
+            uvs = vertex_uv_array(obj, merge_map)
+        if uvs is not None:
+            uv, ok = uvs
+            m = min(n, len(uv))
+            hit = np.flatnonzero(ok[:m])
+            uv32 = uv[:m][hit].astype(np.float32)
+            idx += [base[hit] + 6, base[hit] + 7]
+            val += [uv32[:, 0].view(np.uint32), uv32[:, 1].view(np.uint32)]
+
+    return idx, val
+
+
 def update_naomi_bin(filepath, collection, update_centroids=False):
+    """Patch an imported NL1 model in place from the edited collection.
+
+    The layout index stored at import time is used when its CRC matches the
+    file; otherwise the file is walked once and the index refreshed.  Every
+    new value is computed as NumPy arrays and only then written through a
+    memory map, so a failure part-way leaves the file untouched.
+
+    Returns the CRC32 of the patched file.
+    """
     if not collection.naomi_import_meta.source_filepath:
         raise ValueError("No import metadata found. Collection was not imported from NaomiLib file.")
 
@@ -10032,251 +10487,154 @@ def update_naomi_bin(filepath, collection, update_centroids=False):
     if original_filename != target_filename:
         raise ValueError(f"Filename mismatch: {original_filename} vs {target_filename}")
 
+    meta = collection.naomi_import_meta
+    target_crc32 = None
     if os.path.exists(filepath):
         target_crc32 = calculate_crc32(filepath)
-        if target_crc32 != collection.naomi_import_meta.source_crc32:
+        if target_crc32 != meta.source_crc32:
             raise ValueError(
-                f"CRC32 mismatch: expected {collection.naomi_import_meta.source_crc32}, got {target_crc32}"
+                f"CRC32 mismatch: expected {meta.source_crc32}, got {target_crc32}"
             )
 
-    with open(filepath, 'rb') as f:
-        file_data = bytearray(f.read())
-
     _fwd      = collection.naomi_import_meta.import_forward_axis or _DEFAULT_FORWARD
     _up       = collection.naomi_import_meta.import_up_axis      or _DEFAULT_UP
     _remap_fn = make_remap(_fwd, _up)
 
-    mesh_data_update(collection)
-    bpy.context.view_layer.update()
-
-    if update_centroids:
-        recalc_centroids(collection)
-
-    import re as _re
-    def _slot_key(o):
-        """Sort by stored binary slot index; fall back to natural name sort."""
-        idx = o.get("nl_slot_index")
-        if idx is not None:
-            return (0, int(idx), [])
-        return (1, 0, [int(t) if t.isdigit() else t.lower()
-                       for t in _re.split(r'(\d+)', o.name)])
-
-    all_mesh = [obj for obj in collection.objects if obj.type == 'MESH']
-    mesh_objects = sorted(
-        [obj for obj in all_mesh
-         if hasattr(obj, 'naomi_param') and obj.naomi_param.naomi_assigned],
-        key=_slot_key
-    )
-    if not mesh_objects:
-        mesh_objects = sorted(all_mesh, key=_slot_key)
-    mesh_objects = _sort_mesh_objects_for_export(mesh_objects)
-    adjust_color_type_intensity(mesh_objects)
-
-    gp0 = collection.gp0
-    gp1 = collection.gp1
-    file_data[0x0] = 0x00 if gp0.objFormat == '0' else 0x01
-
-    gflag1 = 0x0001
-    if gp1.skp1stSrcOp: gflag1 |= (1 << 1)
-    if gp1.envMap: gflag1 |= (1 << 2)
-    if gp1.pltTex: gflag1 |= (1 << 3)
-    if gp1.bumpMap: gflag1 |= (1 << 4)
-    file_data[0x4:0x6] = struct.pack('<H', gflag1)
-
-    def _snap_centroid_component(v: float, radius: float) -> float:
-        """Snap near-zero f32 noise to 0.0; clamp denormals to ±0.0."""
-        import math as _m
-        bits = struct.unpack('<I', struct.pack('<f', v))[0]
-        exp  = (bits >> 23) & 0xFF
-        mant = bits & 0x7FFFFF
-        if exp == 0 and mant != 0:            # denormal
-            return _m.copysign(0.0, v)
-        thresh = 4.0 * (2.0 ** -23) * max(abs(radius), 1e-6)
-        return 0.0 if abs(v) < thresh else v
-
-    _col_r = collection.naomi_centroidData.collection_bound_radius
-    _raw_cx = collection.naomi_centroidData.centroid_x
-    _raw_cy = collection.naomi_centroidData.centroid_y
-    _raw_cz = collection.naomi_centroidData.centroid_z
-    _col_cx = _snap_centroid_component(_raw_cx, _col_r)
-    _col_cy = _snap_centroid_component(_raw_cy, _col_r)
-    _col_cz = _snap_centroid_component(_raw_cz, _col_r)
-    if _col_cx != _raw_cx or _col_cy != _raw_cy or _col_cz != _raw_cz:
-        pass    # snap applied silently
-
-    rev_cx, rev_cy, rev_cz = _remap_fn(_col_cx, _col_cy, _col_cz)
-    write_float_at(file_data, 0x8,  rev_cx)
-    write_float_at(file_data, 0xC,  rev_cy)
-    write_float_at(file_data, 0x10, rev_cz)
-    write_float_at(file_data, 0x14, _col_r)
-
-    current_pos = 0x18
-    mesh_index = 0
-
-    while mesh_index < len(mesh_objects) and current_pos < len(file_data) - 4:
-        if struct.unpack_from("<I", file_data, current_pos)[0] == 0:
-            break
-
-        current_obj = mesh_objects[mesh_index]
-        current_mesh = current_obj.data
-        p = current_obj.naomi_param
-
+    file_size = os.path.getsize(filepath)
+    words = np.memmap(filepath, dtype='<u4', mode='r+', shape=(file_size // 4,))
+    file_data = None
+    try:
+        file_data = words.view(np.uint8)
+        layout = None
+        if target_crc32 is not None and meta.layout_crc32 == target_crc32:
+            layout = unpack_layout_index(meta.layout_index, file_size)
+        if layout is None:
+            layout = index_naomi_bin(file_data)
+            meta.layout_index = pack_layout_index(layout)
+
+        mesh_data_update(collection)
+        bpy.context.view_layer.update()
 
-        new_params = (
-                (int(p.paramType) << 29) | (int(p.endOfStrip) << 28) | (int(p.listType) << 24) |
-                (int(p.grpEn) << 23) | (int(p.stripLen) << 18) | (int(p.usrClip) << 16) |
-                (int(p.shadow) << 7) | (int(p.volume) << 6) | (int(p.colType) << 4) |
-                (int(p.textureUsage) << 3) | (int(p.offsColorUsage) << 2) |
-                (int(p.gouraudShdUsage) << 1) | int(p.uvDataSize)
+        if update_centroids:
+            recalc_centroids(collection)
+
+        import re as _re
+        def _slot_key(o):
+            """Sort by stored binary slot index; fall back to natural name sort."""
+            idx = o.get("nl_slot_index")
+            if idx is not None:
+                return (0, int(idx), [])
+            return (1, 0, [int(t) if t.isdigit() else t.lower()
+                           for t in _re.split(r'(\d+)', o.name)])
+
+        all_mesh = [obj for obj in collection.objects if obj.type == 'MESH']
+        mesh_objects = sorted(
+            [obj for obj in all_mesh
+             if hasattr(obj, 'naomi_param') and obj.naomi_param.naomi_assigned],
+            key=_slot_key
         )
-        write_uint32_at(file_data, current_pos, new_params)
-        current_pos += 16
-
-        _mesh_r   = p.bound_radius
-        _mesh_cx  = _snap_centroid_component(p.centroid_x, _mesh_r)
-        _mesh_cy  = _snap_centroid_component(p.centroid_y, _mesh_r)
-        _mesh_cz  = _snap_centroid_component(p.centroid_z, _mesh_r)
-
-        rev_mx, rev_my, rev_mz = _remap_fn(_mesh_cx, _mesh_cy, _mesh_cz)
-        write_float_at(file_data, current_pos,      rev_mx)
-        write_float_at(file_data, current_pos + 4,  rev_my)
-        write_float_at(file_data, current_pos + 8,  rev_mz)
-        write_float_at(file_data, current_pos + 12, _mesh_r)
-        current_pos += 16
-
-        write_sint32_at(file_data, current_pos, p.mh_texID)
-        current_pos += 4
-        write_sint32_at(file_data, current_pos, p.m_tex_shading)
-        current_pos += 4
-        write_float_at(file_data, current_pos, p.m_ambient_light)
-        current_pos += 4
-
-        bc = p.meshColor
-
-        write_float_at(file_data, current_pos, bc[3])
-        write_float_at(file_data, current_pos + 4, bc[0])
-        write_float_at(file_data, current_pos + 8, bc[1])
-        write_float_at(file_data, current_pos + 12, bc[2])
-        current_pos += 16
-
-        oc = p.meshOffsetColor
-        write_float_at(file_data, current_pos, oc[3])
-        write_float_at(file_data, current_pos + 4, oc[0])
-        write_float_at(file_data, current_pos + 8, oc[1])
-        write_float_at(file_data, current_pos + 12, oc[2])
-        current_pos += 16
-
-        mesh_data_size = struct.unpack_from("<I", file_data, current_pos)[0]
-        current_pos += 4
-        mesh_end = current_pos + mesh_data_size
-
-        mw = current_obj.matrix_world
-        _merged_verts = [mw @ v.co for v in current_mesh.vertices]
-
-        _raw_merge_map = current_obj.get("nl_merge_map")
-        if _raw_merge_map is not None:
-            vertex_positions = [_merged_verts[int(idx)] for idx in _raw_merge_map]
-        else:
-            vertex_positions = _merged_verts
-
-        vertex_index = 0
-
-        vertex_colors_data = {}
-        vertex_uv_data = {}
-
-        if hasattr(current_obj.naomi_param, "m_tex_shading") and current_obj.naomi_param.m_tex_shading == -3:
-            vertex_colors_data = get_vertex_colors(current_obj, _raw_merge_map)
-
-        vertex_uv_data = get_vertex_uvs(current_obj, _raw_merge_map)
-
-        while current_pos < mesh_end and current_pos < len(file_data) - 8:
-            face_type = struct.unpack_from("<I", file_data, current_pos)[0]
-            current_pos += 4
-            is_triangles = (face_type >> 3) & 1
-            n_faces = struct.unpack_from("<I", file_data, current_pos)[0]
-            current_pos += 4
-            n_vertices = n_faces * 3 if is_triangles else n_faces
-
-            for _ in range(n_vertices):
-                if current_pos >= mesh_end:
-                    break
-
-                vertex_value = struct.unpack_from("<I", file_data, current_pos)[0]
-
-                if 0x5FF00000 <= vertex_value <= 0x5FFFFFFF:
-                    current_pos += 8
-                else:
-                    if vertex_index < len(vertex_positions):
-                        co = vertex_positions[vertex_index]
-                        rev_x, rev_y, rev_z = _remap_fn(co[0], co[1], co[2])
-
-                        write_float_x_aligned(file_data, current_pos,     rev_x)
-                        write_float_at(file_data, current_pos + 4,        rev_y)
-                        write_float_at(file_data, current_pos + 8,        rev_z)
-                        current_pos += 12
-
-                        tex_shading = getattr(current_obj.naomi_param, 'm_tex_shading', 0)
-
-                        if tex_shading == -3:    # Type C
-                            current_pos += 4    # skip normal (3 bytes + padding)
-
-                            if vertex_colors_data and vertex_index in vertex_colors_data:
-                                color_data = vertex_colors_data[vertex_index]
-                                b = int(max(0, min(255, color_data[2] * 255)))
-                                g = int(max(0, min(255, color_data[1] * 255)))
-                                r = int(max(0, min(255, color_data[0] * 255)))
-                                a = int(max(0, min(255, color_data[3] * 255)))
-                                for i, val in enumerate([b, g, r, a, b, g, r, a]):
-                                    write_uint8_at(file_data, current_pos + i, val)
-                            current_pos += 8
-
-                            if p.mh_texID == -1:
-                                write_uint32_at(file_data, current_pos, 0)
-                                write_uint32_at(file_data, current_pos + 4, 1)
-                            else:
-                                if vertex_index in vertex_uv_data:
-                                    u, v = vertex_uv_data[vertex_index]
-                                    write_float_at(file_data, current_pos, u)
-                                    write_float_at(file_data, current_pos + 4, v)
-                            current_pos += 8
-
-                        elif tex_shading == -2:    # Type D
-                            current_pos += 4    # skip normal
-                            current_pos += 4    # skip bump0 normal
-                            current_pos += 4    # skip bump1 normal
-
-                            if p.mh_texID == -1:
-                                write_uint32_at(file_data, current_pos, 0)
-                                write_uint32_at(file_data, current_pos + 4, 1)
-                            else:
-                                if vertex_index in vertex_uv_data:
-                                    u, v = vertex_uv_data[vertex_index]
-                                    write_float_at(file_data, current_pos, u)
-                                    write_float_at(file_data, current_pos + 4, v)
-                            current_pos += 8
-
-                        else:    # Type A
-                            current_pos += 12    # skip normals (3 floats)
-
-                            if p.mh_texID == -1:
-                                write_uint32_at(file_data, current_pos, 0)
-                                write_uint32_at(file_data, current_pos + 4, 1)
-                            else:
-                                if vertex_index in vertex_uv_data:
-                                    u, v = vertex_uv_data[vertex_index]
-                                    write_float_at(file_data, current_pos, u)
-                                    write_float_at(file_data, current_pos + 4, v)
-                            current_pos += 8
-
-                        vertex_index += 1
-                    else:
-                        current_pos += 32
+        if not mesh_objects:
+            mesh_objects = sorted(all_mesh, key=_slot_key)
+        mesh_objects = _sort_mesh_objects_for_export(mesh_objects)
+        adjust_color_type_intensity(mesh_objects)
+
+        def _snap_centroid_component(v: float, radius: float) -> float:
+            """Snap near-zero f32 noise to 0.0; clamp denormals to ±0.0."""
+            import math as _m
+            bits = struct.unpack('<I', struct.pack('<f', v))[0]
+            exp  = (bits >> 23) & 0xFF
+            mant = bits & 0x7FFFFF
+            if exp == 0 and mant != 0:            # denormal
+                return _m.copysign(0.0, v)
+            thresh = 4.0 * (2.0 ** -23) * max(abs(radius), 1e-6)
+            return 0.0 if abs(v) < thresh else v
+
+        # Header words are few; stage them in a small buffer and copy them in
+        # alongside the vertex arrays.
+        gp0 = collection.gp0
+        gp1 = collection.gp1
+        header = bytearray(file_data[:0x18])
+        header[0x0] = 0x00 if gp0.objFormat == '0' else 0x01
+
+        gflag1 = 0x0001
+        if gp1.skp1stSrcOp: gflag1 |= (1 << 1)
+        if gp1.envMap: gflag1 |= (1 << 2)
+        if gp1.pltTex: gflag1 |= (1 << 3)
+        if gp1.bumpMap: gflag1 |= (1 << 4)
+        header[0x4:0x6] = struct.pack('<H', gflag1)
+
+        _col_r = collection.naomi_centroidData.collection_bound_radius
+        _col_cx = _snap_centroid_component(collection.naomi_centroidData.centroid_x, _col_r)
+        _col_cy = _snap_centroid_component(collection.naomi_centroidData.centroid_y, _col_r)
+        _col_cz = _snap_centroid_component(collection.naomi_centroidData.centroid_z, _col_r)
+
+        rev_cx, rev_cy, rev_cz = _remap_fn(_col_cx, _col_cy, _col_cz)
+        write_float_at(header, 0x8,  rev_cx)
+        write_float_at(header, 0xC,  rev_cy)
+        write_float_at(header, 0x10, rev_cz)
+        write_float_at(header, 0x14, _col_r)
+
+        patch_idx = []
+        patch_val = []
+
+        for current_obj, slot in zip(mesh_objects, layout):
+            p = current_obj.naomi_param
+
+            new_params = (
+                    (int(p.paramType) << 29) | (int(p.endOfStrip) << 28) | (int(p.listType) << 24) |
+                    (int(p.grpEn) << 23) | (int(p.stripLen) << 18) | (int(p.usrClip) << 16) |
+                    (int(p.shadow) << 7) | (int(p.volume) << 6) | (int(p.colType) << 4) |
+                    (int(p.textureUsage) << 3) | (int(p.offsColorUsage) << 2) |
+                    (int(p.gouraudShdUsage) << 1) | int(p.uvDataSize)
+            )
 
-        current_pos = mesh_end
-        mesh_index += 1
+            _mesh_r   = p.bound_radius
+            _mesh_cx  = _snap_centroid_component(p.centroid_x, _mesh_r)
+            _mesh_cy  = _snap_centroid_component(p.centroid_y, _mesh_r)
+            _mesh_cz  = _snap_centroid_component(p.centroid_z, _mesh_r)
+            rev_mx, rev_my, rev_mz = _remap_fn(_mesh_cx, _mesh_cy, _mesh_cz)
+
+            bc = p.meshColor
+            oc = p.meshOffsetColor
+
+            # param word, then (skipping 3 words) centroid, texID, shading,
+            # ambient, base ARGB and offset ARGB — 15 contiguous words.
+            head = bytearray(4)
+            write_uint32_at(head, 0, new_params)
+            mesh_head = bytearray(60)
+            for i, v in enumerate((rev_mx, rev_my, rev_mz, _mesh_r)):
+                write_float_at(mesh_head, i * 4, v)
+            write_sint32_at(mesh_head, 16, p.mh_texID)
+            write_sint32_at(mesh_head, 20, p.m_tex_shading)
+            write_float_at(mesh_head, 24, p.m_ambient_light)
+            for i, v in enumerate((bc[3], bc[0], bc[1], bc[2],
+                                   oc[3], oc[0], oc[1], oc[2])):
+                write_float_at(mesh_head, 28 + i * 4, v)
+
+            w = slot['offset'] // 4
+            patch_idx += [np.array([w], dtype=np.int64),
+                          np.arange(w + 4, w + 19, dtype=np.int64)]
+            patch_val += [np.frombuffer(head, dtype='<u4'),
+                          np.frombuffer(mesh_head, dtype='<u4')]
+
+            idx, val = _mesh_vertex_patches(current_obj, slot['vertices'], (_fwd, _up))
+            patch_idx += idx
+            patch_val += val
+
+        file_data[:0x18] = np.frombuffer(bytes(header), dtype=np.uint8)
+        if patch_idx:
+            words[np.concatenate(patch_idx)] = np.concatenate(
+                [np.asarray(v, dtype=np.uint32) for v in patch_val])
+        words.flush()
+    finally:
+        # Drop the map even on failure: an open mapping keeps the .bin
+        # locked on Windows.
+        del file_data, words
 
-    with open(filepath, 'wb') as f:
-        f.write(file_data)
+    # Patching never moves records, so the index stays valid for the new CRC.
+    new_crc32 = calculate_crc32(filepath)
+    meta.layout_crc32 = new_crc32
+    return new_crc32
 
 
 DK_TXT_ALPHA     = 1
@@ -10425,7 +10783,7 @@ def _build_std_material(obj, opts) -> Std_Material:
     if two_sided:
         mat.double_side = True
     else:
-        blender_mat = obj.data.materials[0] if obj.data.materials else None
+        blender_mat = obj.material_slots[0].material if obj.material_slots else None
         if blender_mat is not None:
             mat.double_side = not blender_mat.use_backface_culling
         else:
@@ -10870,7 +11228,7 @@ def _fill_polygons(STM, obj, eval_mesh, remap_fn,
                 loop_colors[li] = (int(c[0]*255), int(c[1]*255),
                                    int(c[2]*255), int(c[3]*255))
 
-    blender_mat = obj.data.materials[0] if obj.data.materials else None
+    blender_mat = obj.material_slots[0].material if obj.material_slots else None
     if blender_mat is not None:
         backface_on = blender_mat.use_backface_culling
     else:
@@ -10960,53 +11318,235 @@ def _fill_polygons(STM, obj, eval_mesh, remap_fn,
         sp.gr = tri.use_smooth
 
 
-def convert_collection(
-        collection,
-        opts,
-) -> bytes:
-    """Convert a Blender collection directly to a NAOMI .bin blob. Returns bytes."""
+# Strip cache
+#
+# The strip search in set_strip_point dominates export time, yet its result
+# depends only on the model's own pre-strip data, the conversion options and
+# the call context. Results are kept per (model digest, options digest,
+# context) so re-exporting a collection replays the strip chains of unchanged
+# meshes instead of searching again. Binary emission always re-runs: output
+# addresses and merge passes depend on every model in the collection.
+
+_STRIP_CACHE_MAX = 4096
+_strip_cache: dict = {}
+_strip_cache_opts: Optional[bytes] = None    # None = caching disabled
+strip_cache_hits:   int = 0
+strip_cache_misses: int = 0
+
+# Option fields that never influence strip building.
+_STRIP_CACHE_IGNORED_OPTS = frozenset({
+    'input_file_name', 'input_file_name_base',
+    'texpath', 'texpath_count', 'palpath', 'palpath_count', 'texoutpath',
+    'strip_cache', 'remesh',
+})
+
+
+def clear_strip_cache() -> None:
+    """Drop every cached strip-search result."""
+    _strip_cache.clear()
+
+
+def _digest(obj) -> bytes:
+    import hashlib
+    import pickle
+    return hashlib.blake2b(pickle.dumps(obj, protocol=4),
+                           digest_size=16).digest()
+
+
+def _strip_cache_begin(opts) -> None:
+    """Digest the options and every model in StdModel before strip building."""
+    global _strip_cache_opts, strip_cache_hits, strip_cache_misses
+    strip_cache_hits = strip_cache_misses = 0
+    if not getattr(opts, 'strip_cache', False):
+        _strip_cache_opts = None
+        return
+    _strip_cache_opts = _digest(sorted(
+        (k, v) for k, v in vars(opts).items()
+        if k not in _STRIP_CACHE_IGNORED_OPTS))
+    for i in range(StdModelCount):
+        STM = StdModel[i]
+        STM.src_digest    = _digest(_std_model_to_plain(STM))
+        STM.strip_call_ct = 0
+
+
+def _strip_cache_end() -> None:
+    global _strip_cache_opts
+    _strip_cache_opts = None
+
+
+def _strip_chain_to_plain(sd: Optional[StripData], tex: VOL2_TEX_FLAG):
+    """Flatten a StripData chain; None if it cannot be replayed."""
+    out = []
+    while sd is not None:
+        if sd.tex is not tex:
+            return None
+        pi = None
+        if sd.pi is not None:
+            pi = tuple((p.sp_idx, p.flag, p.pol_idx, p.inf_idx, p.flag2)
+                       for p in sd.pi)
+        out.append((sd._NL_PF_S_INDEX, sd._NL_PF_NOT_GP, sd._NL_PF_GOURAUD,
+                    sd._NL_PF_CULLING, sd._NL_PF_STRIP, sd._NL_PF_TRIANGLE,
+                    sd._NL_PF_SPRITE, sd.strip_num, sd.grp_no,
+                    sd.sort_flag0, sd.sort_flag_byte_diff, pi))
+        sd = sd.next
+    return out
+
+
+def _strip_chain_from_plain(data, tex: VOL2_TEX_FLAG) -> Optional[StripData]:
+    _PI = StripData.POINT_INDEX
+    head = None
+    tail = None
+    for (s_index, not_gp, gouraud_, culling, strip, triangle, sprite,
+         strip_num, grp_no, sort_flag0, byte_diff, pi) in data:
+        sd = StripData()
+        sd._NL_PF_S_INDEX  = s_index
+        sd._NL_PF_NOT_GP   = not_gp
+        sd._NL_PF_GOURAUD  = gouraud_
+        sd._NL_PF_CULLING  = culling
+        sd._NL_PF_STRIP    = strip
+        sd._NL_PF_TRIANGLE = triangle
+        sd._NL_PF_SPRITE   = sprite
+        sd.tex             = tex
+        sd.strip_num       = strip_num
+        sd.grp_no          = grp_no
+        sd.sort_flag0      = sort_flag0
+        sd.sort_flag_byte_diff = byte_diff
+        if pi is not None:
+            lst = []
+            for sp_idx, flag, pol_idx, inf_idx, flag2 in pi:
+                p = _PI()
+                p.sp_idx = sp_idx; p.flag = flag
+                p.pol_idx = pol_idx; p.inf_idx = inf_idx; p.flag2 = flag2
+                lst.append(p)
+            sd.pi = lst
+        if tail is None:
+            head = sd
+        else:
+            tail.next = sd
+        tail = sd
+    return head
+
+
+def _cached_set_strip_point(
+        STM:              Std_Model,
+        mat_index:        int,
+        mat_same_polynum: int,
+        tex:              VOL2_TEX_FLAG,
+) -> None:
+    """STM.set_strip_point(), replayed from the strip cache when possible."""
+    global all_strip_ct, all_fan_ct, all_once_ct
+    global file_all_point_count, file_all_polygon_count
+    global strip_cache_hits, strip_cache_misses
+
+    if _strip_cache_opts is None or STM.src_digest is None:
+        STM.set_strip_point(mat_index, mat_same_polynum, tex)
+        return
+
+    key = (STM.src_digest, _strip_cache_opts, STM.strip_call_ct,
+           mat_index, mat_same_polynum, tex.v0, tex.v1,
+           bump_polygon, bump_polygon_dup, bump_polygon_trs,
+           env_map_polygon, super_index_format, tri_liner_mode)
+    STM.strip_call_ct += 1
+
+    hit = _strip_cache.get(key)
+    if hit is not None:
+        chain, deltas, model_state = hit
+        STM.stripdata = _strip_chain_from_plain(chain, tex)
+        d_strip, d_fan, d_once, d_point, d_poly = deltas
+        all_strip_ct           += d_strip
+        all_fan_ct             += d_fan
+        all_once_ct            += d_once
+        file_all_point_count   += d_point
+        file_all_polygon_count += d_poly
+        (STM.model_all_strip_point_count,
+         STM.before_srch_point_count,
+         STM.before_best_dec_count) = model_state
+        strip_cache_hits += 1
+        return
+
+    before = (all_strip_ct, all_fan_ct, all_once_ct,
+              file_all_point_count, file_all_polygon_count)
+    STM.set_strip_point(mat_index, mat_same_polynum, tex)
+    strip_cache_misses += 1
+
+    chain = _strip_chain_to_plain(STM.stripdata, tex)
+    if chain is None:
+        return
+    after = (all_strip_ct, all_fan_ct, all_once_ct,
+             file_all_point_count, file_all_polygon_count)
+    if len(_strip_cache) >= _STRIP_CACHE_MAX:
+        del _strip_cache[next(iter(_strip_cache))]
+    _strip_cache[key] = (
+        chain,
+        tuple(a - b for a, b in zip(after, before)),
+        (STM.model_all_strip_point_count,
+         STM.before_srch_point_count,
+         STM.before_best_dec_count),
+    )
+
+
+def _reset_render_output() -> None:
+    """Reset render_output module state between export runs."""
     global StdModel, StdModelCount, mcx, mcy, mcz, mcr
-    global output_after_all, naomi2hg, bump_polygon, bump_polygon_dup, bump_polygon_trs, env_map_polygon
-    import io
-
-    def _reset_render_output() -> None:
-        """Reset render_output module state between export runs."""
-        global StdModel, StdModelCount, mcx, mcy, mcz, mcr
-        global output_after_all, naomi2hg, bump_polygon
-        global bump_polygon_dup, bump_polygon_trs, env_map_polygon
-        set_binary_output(None)
-        StdModel      = []
-        StdModelCount = 0
-        mcx = Std_Float(0.0)
-        mcy = Std_Float(0.0)
-        mcz = Std_Float(0.0)
-        mcr = Std_Float(0.0)
-        output_after_all = False
-        naomi2hg         = False
-        bump_polygon     = False
-        bump_polygon_dup = False
-        bump_polygon_trs = False
-        env_map_polygon  = False
-
-    bin_buf = io.BytesIO()
+    global output_after_all, naomi2hg, bump_polygon
+    global bump_polygon_dup, bump_polygon_trs, env_map_polygon
+    set_binary_output(None)
+    StdModel      = []
+    StdModelCount = 0
+    mcx = Std_Float(0.0)
+    mcy = Std_Float(0.0)
+    mcz = Std_Float(0.0)
+    mcr = Std_Float(0.0)
+    output_after_all = False
+    naomi2hg         = False
+    bump_polygon     = False
+    bump_polygon_dup = False
+    bump_polygon_trs = False
+    env_map_polygon  = False
+
+
+def _estimate_output_size() -> int:
+    """Size hint for the BinaryEmitter from the loaded models.
+
+    Assumes every triangle emits three full vertex records (the
+    independent-triangle worst case) plus a fixed per-material header.
+    """
+    total = 256
+    for i in range(StdModelCount):
+        md  = StdModel[i]
+        mats = md.material[:md.material_num]
+        rec = 56 if any(m.bump_map for m in mats) else 32
+        total += 256 * md.material_num + 3 * rec * md.polygon_num
+    return total
+
 
+def _run_conversion(opts, fill_models, stream=None):
+    """Apply *opts*, let *fill_models()* populate StdModel, then strip-build
+    and emit the NAOMI .bin blob.
+
+    Returns the bytes, or the byte count when *stream* is given: the output
+    is then written to *stream* (truncated first) as it is produced.
+    """
     try:
         reset_globals()
         _reset_render_output()
 
         apply_options(opts)
-        set_binary_output(bin_buf)
 
-        _fwd = getattr(opts, 'forward_axis', '+Y')
-        _up  = getattr(opts, 'up_axis',      '+Z')
-        _nx  = getattr(opts, 'neg_x',        False)
-        blender_collection_to_std_models(
-            collection, opts, _fwd, _up, _nx)
+        fill_models()
 
         if StdModelCount == 0:
             raise NlcvError("No mesh objects found in collection",
                             NLCV_ERR_CONVERT)
 
+        if stream is not None:
+            stream.seek(0)
+            stream.truncate()
+        emitter = BinaryEmitter(_estimate_output_size(), stream)
+        set_binary_output(emitter)
+
+        _strip_cache_begin(opts)
+
         try:
             mem_all_clear()
             get_model_culling_all(
@@ -11033,12 +11573,270 @@ def convert_collection(
                 f"Unexpected error in strip-building: {exc}",
                 NLCV_ERR_INTERNAL) from exc
 
-        result = bin_buf.getvalue()
-        if not result:
+        if not emitter.tell():
             raise NlcvError("Conversion produced no output bytes.",
                             NLCV_ERR_OUTPUT)
-        return result
+        if stream is not None:
+            emitter.flush()
+            return emitter.tell()
+        return emitter.getvalue()
+
+    finally:
+        _strip_cache_end()
+        reset_globals()
+        _reset_render_output()
+
+
+def convert_collection(
+        collection,
+        opts,
+        stream=None,
+):
+    """Convert a Blender collection directly to a NAOMI .bin blob.
+
+    Returns bytes, or the byte count when streaming to *stream*
+    (a seekable binary file object).
+    """
+    _fwd = getattr(opts, 'forward_axis', '+Y')
+    _up  = getattr(opts, 'up_axis',      '+Z')
+    _nx  = getattr(opts, 'neg_x',        False)
+    return _run_conversion(opts, lambda: blender_collection_to_std_models(
+        collection, opts, _fwd, _up, _nx), stream)
+
+
+TOUCH_COUNT_START = 3
+TOUCH_COUNT_MAX   = 32
+
+
+def convert_with_touch_retry(convert, opts):
+    """Call convert(opts), raising opts.touch_count_max on touch_count overflow.
+
+    Returns (bin_bytes, touch_limit). bin_bytes is None when the overflow
+    persists at TOUCH_COUNT_MAX. Any other NlcvError propagates.
+    """
+    touch_limit = TOUCH_COUNT_START
+    while touch_limit <= TOUCH_COUNT_MAX:
+        opts.touch_count_max = touch_limit
+        try:
+            return convert(opts), touch_limit
+        except NlcvError as exc:
+            if exc.code != NLCV_ERR_CONVERT:
+                raise
+            touch_limit = 5 if touch_limit == 3 else touch_limit + 1
+    return None, touch_limit
+
+
+def convert_to_file(convert, opts, out_path: str):
+    """convert_with_touch_retry() streaming straight into *out_path*.
+
+    *convert(opts, stream)* must write to *stream* and return the byte
+    count. Output goes to a temporary file next to *out_path* that replaces
+    it only on success. Returns (nbytes, touch_limit); nbytes is None when
+    the touch_count overflow persists.
+    """
+    tmp_path = out_path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            nbytes, touch_limit = convert_with_touch_retry(
+                lambda o: convert(o, f), opts)
+        if nbytes is not None:
+            os.replace(tmp_path, out_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return nbytes, touch_limit
+
+
+# Collection snapshots (Export All)
+#
+# Export All runs in two phases. snapshot_collection() runs on the main
+# thread: it evaluates every mesh of a collection into Std_Models and flattens
+# them into plain tuples/dicts. export_snapshot() rebuilds the Std_Models from
+# that data and runs strip building + binary emission without touching bpy, so
+# it can be dispatched to a worker process.
+
+def _std_material_to_plain(mat: Std_Material) -> dict:
+    floats = {}
+    attrs  = {}
+    vol2   = None
+    for key, val in vars(mat).items():
+        if isinstance(val, Std_Float):
+            floats[key] = val._data
+        elif isinstance(val, Std_Material):
+            vol2 = _std_material_to_plain(val)
+        else:
+            attrs[key] = val
+    return {'floats': floats, 'attrs': attrs, 'vol2': vol2}
+
+
+def _std_material_from_plain(data: dict) -> Std_Material:
+    mat = Std_Material()
+    for key, val in data['attrs'].items():
+        setattr(mat, key, val)
+    for key, val in data['floats'].items():
+        f = object.__new__(Std_Float)
+        f._data = val
+        setattr(mat, key, f)
+    if data['vol2'] is not None:
+        mat.Vol2para = _std_material_from_plain(data['vol2'])
+    return mat
+
+
+def _std_model_to_plain(STM: Std_Model) -> dict:
+    """Flatten a filled (pre-strip) Std_Model into picklable builtins."""
+    points = [(p.x._data, p.y._data, p.z._data, p.tag_flag)
+              for p in STM.point_list[:STM.point_num]]
+    polygons = []
+    for sp in STM.polygon[:STM.polygon_num]:
+        info = [(pi.point_index,
+                 pi.nx._data, pi.ny._data, pi.nz._data,
+                 pi.u._data, pi.v._data,
+                 pi.vtx_color_A, pi.vtx_color_R,
+                 pi.vtx_color_G, pi.vtx_color_B,
+                 pi.normal_diff, pi.nx0, pi.ny0, pi.nz0,
+                 pi._eq_key)
+                for pi in sp.info_list[:sp.info_list_num]]
+        n = sp.normal
+        polygons.append((sp.material_index, sp.gr,
+                         (n.x._data, n.y._data, n.z._data), info))
+    return {
+        'model_name': STM.model_name,
+        'discAngle':  STM.discAngle,
+        'gouraud':    STM.gouraud,
+        'materials':  [_std_material_to_plain(m)
+                       for m in STM.material[:STM.material_num]],
+        'points':     points,
+        'polygons':   polygons,
+    }
+
+
+def _std_model_from_plain(data: dict) -> Std_Model:
+    """Inverse of _std_model_to_plain."""
+    _SF = Std_Float
+
+    def _sf(v: float) -> Std_Float:
+        f = object.__new__(_SF)
+        f._data = v
+        return f
+
+    STM = Std_Model()
+    STM.model_name = data['model_name']
+    STM.discAngle  = data['discAngle']
+    STM.gouraud    = data['gouraud']
+
+    STM.material     = [_std_material_from_plain(m) for m in data['materials']]
+    STM.material_num = len(STM.material)
+
+    point_list = []
+    for x, y, z, tag in data['points']:
+        pt = Std_Point._make(x, y, z)
+        pt.tag_flag = tag
+        point_list.append(pt)
+    STM.point_list = point_list
+    STM.point_num  = len(point_list)
+
+    polygons = []
+    for mat_idx, gr, (fnx, fny, fnz), info in data['polygons']:
+        sp = Std_Polygon()
+        sp.model          = STM
+        sp.material_index = mat_idx
+        sp.gr             = gr
+        sp.normal         = Std_Point._make(fnx, fny, fnz)
+        sp.info_list_num  = len(info)
+        info_list = []
+        for (vi, nx, ny, nz, u, v, ca, cr, cg, cb,
+             ndiff, nx0, ny0, nz0, eq_key) in info:
+            pi = Std_PointInfo()
+            pi.poly        = sp
+            pi.point_index = vi
+            pi.nx = _sf(nx); pi.ny = _sf(ny); pi.nz = _sf(nz)
+            pi.u  = _sf(u);  pi.v  = _sf(v)
+            pi.vtx_color_A = ca; pi.vtx_color_R = cr
+            pi.vtx_color_G = cg; pi.vtx_color_B = cb
+            pi.normal_diff = ndiff
+            pi.nx0 = nx0; pi.ny0 = ny0; pi.nz0 = nz0
+            pi._eq_key = eq_key
+            info_list.append(pi)
+        sp.info_list = info_list
+        polygons.append(sp)
+    STM.polygon     = polygons
+    STM.polygon_num = len(polygons)
+    return STM
+
+
+def snapshot_collection(collection, opts) -> dict:
+    """Evaluate *collection* on the main thread into a picklable snapshot.
+
+    The snapshot holds the pre-strip Std_Model data and the conversion
+    options; feed it to export_snapshot() (in-process or in a worker).
+    """
+    global StdModel, StdModelCount
+    try:
+        reset_globals()
+        _reset_render_output()
+        apply_options(opts)
+
+        blender_collection_to_std_models(
+            collection, opts,
+            getattr(opts, 'forward_axis', '+Y'),
+            getattr(opts, 'up_axis',      '+Z'),
+            getattr(opts, 'neg_x',        False))
 
+        models = [_std_model_to_plain(StdModel[i])
+                  for i in range(StdModelCount)]
     finally:
         reset_globals()
         _reset_render_output()
+
+    return {
+        'name':   collection.name,
+        'opts':   dict(vars(opts)),
+        'models': models,
+    }
+
+
+def convert_snapshot(snapshot: dict, opts, stream=None):
+    """Strip-build and emit a snapshot taken by snapshot_collection()."""
+    def _fill() -> None:
+        global StdModel, StdModelCount
+        StdModel = [_std_model_from_plain(m) for m in snapshot['models']]
+        StdModelCount = len(StdModel)
+
+    return _run_conversion(opts, _fill, stream)
+
+
+def export_snapshot(snapshot: dict, out_path: str) -> dict:
+    """Convert *snapshot* and write it to *out_path*.
+
+    Entry point for Export All worker processes; never touches bpy.
+    Returns a plain status dict: name, ok, nbytes, touch_limit, error.
+    """
+    result = {'name': snapshot['name'], 'ok': False, 'nbytes': 0,
+              'touch_limit': TOUCH_COUNT_START, 'error': ''}
+
+    opts = NlcvOptions.defaults()
+    for key, val in snapshot['opts'].items():
+        setattr(opts, key, val)
+
+    try:
+        nbytes, touch_limit = convert_to_file(
+            lambda o, f: convert_snapshot(snapshot, o, f), opts, out_path)
+    except NlcvError as exc:
+        result['error'] = f"Export error ({snapshot['name']}): {exc}"
+        return result
+    except OSError as exc:
+        result['error'] = f"Could not write '{out_path}': {exc}"
+        return result
+    except Exception as exc:
+        result['error'] = f"Unexpected error ({snapshot['name']}): {exc}"
+        return result
+
+    result['touch_limit'] = touch_limit
+    if nbytes is None:
+        result['error'] = (f"'{snapshot['name']}': touch_count overflow persists "
+                           f"at max={TOUCH_COUNT_MAX}.")
+        return result
+
+    result['ok']     = True
+    result['nbytes'] = nbytes
+    return result
@@ -2,9 +2,12 @@ import bpy
 import struct
 import os
 import zlib
+import hashlib
+import numpy as np
 from io import BytesIO
 from mathutils import Vector, Matrix
-from .bl_pypvr import decode as pvrdecode
+from .bl_pypvr import decode as pvrdecode, pvr_file_info, pvr_folder_index
+from .NLexporter import index_naomi_bin, pack_layout_index, _NL2_VERTEX_DTYPES
 
 
 xVal = 0
@@ -985,6 +988,30 @@ def _is_naomi2_bin(nl_bytes: bytes) -> bool:
     return fmt == 0x100
 
 
+_NL2_NORMAL_SHIFTS = np.array([0, 8, 16], dtype=np.uint32)        # nx, ny, nz bytes
+_NL2_RGBA_SHIFTS   = np.array([16, 8, 0, 24], dtype=np.uint32)    # ARGB word --> R, G, B, A
+
+
+def _nl2_vertex_dtype(has_uv: bool, has_rgb: bool) -> np.dtype:
+    return _NL2_VERTEX_DTYPES[(has_uv, has_rgb)]
+
+
+def _nl2_strip_faces(n: int, vtx_base: int, is_fan: bool, cull_mode: int) -> np.ndarray:
+    """(n-2, 3) triangle indices for one strip or fan of n vertices at vtx_base.
+
+    Fan:   pivot vtx_base; cull_mode 2 (backface culled, CCW front) reverses
+           (p, i+2, i+1), otherwise (p, i+1, i+2).
+    Strip: strip_counter starts at -1 as in NAOMI1, so even j takes the "odd"
+           winding: cull 2 --> (i+1, i, i+2) on even j, (i, i+1, i+2) on odd j;
+           other cull modes the opposite way round."""
+    i = vtx_base + np.arange(n - 2)
+    if is_fan:
+        first, second = (i + 2, i + 1) if cull_mode == 2 else (i + 1, i + 2)
+        return np.stack([np.full_like(i, vtx_base), first, second], axis=1)
+    swap = (np.arange(n - 2) % 2 == 0) == (cull_mode == 2)
+    return np.stack([np.where(swap, i + 1, i), np.where(swap, i, i + 1), i + 2], axis=1)
+
+
 def parse_nl2(nl_bytes: bytes, orientation: str, NegScale_X: bool,
               debug: bool = False) -> list:
     """Parse a NAOMI2 object-tag binary (format_flag=0x100).
@@ -1274,46 +1301,38 @@ def parse_nl2(nl_bytes: bytes, orientation: str, NegScale_X: bool,
             has_rgb = bool((mdf >> 6) & 1)
             bytes_per_vtx = (24 if has_uv else 16) + (8 if has_rgb else 0)
 
-            def _unpack_flag_normal(flag_word):
-                def _b(byte_val):
-                    signed = byte_val if byte_val < 128 else byte_val - 256
-                    return signed / 128.0
-                nx_ = _b( flag_word        & 0xFF)
-                ny_ = _b((flag_word >>  8) & 0xFF)
-                nz_ = _b((flag_word >> 16) & 0xFF)
-                return (nx_, ny_, nz_)
-
             if f.tell() + strip_vtx_count * bytes_per_vtx > seg_end + 4:
                 # Corrupt or misaligned — stop
                 break
 
-            raw_verts = []   # (x, y, z, u, v, topo_byte, base_col_rgba, normal_or_None)
-
-            for _ in range(strip_vtx_count):
-                flag_word = ru32()
-                x  = rf32()
-                y  = rf32()
-                z  = rf32()
-                if has_uv:
-                    u_ = rf32()
-                    v_ = rf32()   # negated by exporter (v = -pi.v)
-                else:
-                    u_ = 0.0
-                    v_ = 0.0
-                if has_rgb:
-                    vtcl  = ru32()   # base colour: packed ARGB uint32
-                    vtcl2 = ru32()   # offset colour: packed ARGB uint32 (consumed, not used)
-                    base_col = (
-                        ((vtcl >> 16) & 0xFF) / 255.0,  # R
-                        ((vtcl >>  8) & 0xFF) / 255.0,  # G
-                        ( vtcl        & 0xFF) / 255.0,  # B
-                        ((vtcl >> 24) & 0xFF) / 255.0,  # A
-                    )
-                else:
-                    base_col = (1.0, 1.0, 1.0, 1.0)
-                packed_normal = _unpack_flag_normal(flag_word)
-                topo = (flag_word >> 24) & 0xFF
-                raw_verts.append((x, y, z, u_, v_, topo, base_col, packed_normal))
+            # Whole vertex block in one structured read; record layout per MDF.
+            block = np.frombuffer(nl_bytes, dtype=_nl2_vertex_dtype(has_uv, has_rgb),
+                                  count=strip_vtx_count, offset=f.tell())
+            f.seek(f.tell() + strip_vtx_count * bytes_per_vtx)
+
+            flags = block['flag']
+            topos = ((flags >> 24) & 0xFF).tolist()
+            # flag_word bits[23:0]: signed-byte normal, /128
+            nrm_bytes = (flags[:, None] >> _NL2_NORMAL_SHIFTS) & 0xFF
+            normals = (nrm_bytes.astype(np.uint8).view(np.int8) / 128.0).tolist()
+            if has_uv:
+                uvs_raw = zip(block['u'].tolist(), block['v'].tolist())   # v negated by exporter
+            else:
+                uvs_raw = [(0.0, 0.0)] * strip_vtx_count
+            if has_rgb:
+                # base colour: packed ARGB uint32 (offset colour is not used)
+                vtcl = block['base_rgb']
+                cols_raw = (((vtcl[:, None] >> _NL2_RGBA_SHIFTS) & 0xFF) / 255.0).tolist()
+            else:
+                cols_raw = [(1.0, 1.0, 1.0, 1.0)] * strip_vtx_count
+
+            # (x, y, z, u, v, topo_byte, base_col_rgba, normal)
+            raw_verts = [
+                (x, y, z, u_, v_, topo, tuple(col), tuple(nrm))
+                for x, y, z, (u_, v_), topo, col, nrm in zip(
+                    block['x'].tolist(), block['y'].tolist(), block['z'].tolist(),
+                    uvs_raw, topos, cols_raw, normals)
+            ]
 
             if debug:
                 _TOPO_NAMES = {
@@ -1335,16 +1354,10 @@ def parse_nl2(nl_bytes: bytes, orientation: str, NegScale_X: bool,
 
             # Split into sub-strips on V_END (topo & 0x80)
             # cull_mode: 2=backface culled (CCW front), 3=frontface culled, 0/1=double-sided
-            strips = []
-            current = []
-            for v in raw_verts:
-                current.append(v)
-                if v[5] & TOPO_V_END:
-                    if current:
-                        strips.append(current)
-                    current = []
-            if current:
-                strips.append(current)
+            _ends = (np.flatnonzero((flags >> 24) & TOPO_V_END) + 1).tolist()
+            if not _ends or _ends[-1] != strip_vtx_count:
+                _ends.append(strip_vtx_count)
+            strips = [raw_verts[_s:_e] for _s, _e in zip([0] + _ends[:-1], _ends) if _e > _s]
 
             if debug:
                 model_log += f"\n  ── strip splits --> {len(strips)} strip(s) ──\n"
@@ -1396,39 +1409,22 @@ def parse_nl2(nl_bytes: bytes, orientation: str, NegScale_X: bool,
                             f"  vtx_base={vtx_base}  cull_mode={cull_mode} ──\n"
                         )
 
-                    p = vtx_base   # pivot for fan, or base index for strip
-
-                    strip_counter = -1   # matches NAOMI1: strip_counter starts at -1 per strip
-                    for j in range(n - 2):
-                        i = vtx_base + j
-                        if is_fan:
-                            # Fan winding mirrors the strip convention:
-                            # cull_mode==2 (backface culled, CCW front) --> swap fan order.
-                            # cull_mode==3 (frontface culled, CW front) --> normal fan order.
-                            if cull_mode == 2:
-                                a, b, c = p, i + 2, i + 1
-                                _wind_reason = "fan  cull=2 --> reversed  (p, i+2, i+1)"
-                            else:
-                                a, b, c = p, i + 1, i + 2
-                                _wind_reason = "fan  cull≠2 --> normal    (p, i+1, i+2)"
-                        else:
-                            if strip_counter % 2 == 1:   # odd
-                                if cull_mode == 2:
-                                    a, b, c = i + 1, i, i + 2
-                                    _wind_reason = "strip odd  cull=2 --> swap    (i+1, i, i+2)"
-                                else:
-                                    a, b, c = i, i + 1, i + 2
-                                    _wind_reason = "strip odd  cull≠2 --> normal  (i, i+1, i+2)"
-                            else:                         # even
-                                if cull_mode == 2:
-                                    a, b, c = i, i + 1, i + 2
-                                    _wind_reason = "strip even cull=2 --> normal  (i, i+1, i+2)"
-                                else:
-                                    a, b, c = i + 1, i, i + 2
-                                    _wind_reason = "strip even cull≠2 --> swap    (i+1, i, i+2)"
-                        strip_counter += 1
-
-                        if debug:
+                    tris = _nl2_strip_faces(n, vtx_base, is_fan, cull_mode)
+
+                    if debug:
+                        for j, (a, b, c) in enumerate(tris.tolist()):
+                            strip_counter = j - 1   # NAOMI1: strip_counter starts at -1 per strip
+                            if is_fan:
+                                _wind_reason = ("fan  cull=2 --> reversed  (p, i+2, i+1)" if cull_mode == 2
+                                                else "fan  cull≠2 --> normal    (p, i+1, i+2)")
+                            elif strip_counter % 2 == 1:   # odd
+                                _wind_reason = ("strip odd  cull=2 --> swap    (i+1, i, i+2)" if cull_mode == 2
+                                                else "strip odd  cull≠2 --> normal  (i, i+1, i+2)")
+                            else:                          # even
+                                _wind_reason = ("strip even cull=2 --> normal  (i, i+1, i+2)" if cull_mode == 2
+                                                else "strip even cull≠2 --> swap    (i+1, i, i+2)")
+                            strip_counter += 1
+
                             # All vertices are still in the pre-orientation raw pts list
                             # relative to vtx_base.  Map global indices back to strip-local.
                             _la = a - vtx_base
@@ -1445,7 +1441,7 @@ def parse_nl2(nl_bytes: bytes, orientation: str, NegScale_X: bool,
                                 f"           C=[{c}] xyz=({_pc[0]:>9.4f}, {_pc[1]:>9.4f}, {_pc[2]:>9.4f})\n"
                             )
 
-                        faces_index.append([a, b, c])
+                    faces_index.extend(tris.tolist())
 
                 vtx_base += n
 
@@ -1603,6 +1599,10 @@ def calculate_crc32(filepath):
         for chunk in iter(lambda: f.read(8192), b''):
             crc = zlib.crc32(chunk, crc)
     return f"{crc & 0xffffffff:08x}"
+
+
+def crc32_of_bytes(data: bytes) -> str:
+    return f"{zlib.crc32(data) & 0xffffffff:08x}"
     
 
 def cleanup():
@@ -1631,11 +1631,116 @@ def find_existing_material(naomi_params_id):
     return None
 
 
+def remove_imported_collection(col):
+    """Delete an imported collection with its objects and now-unused meshes."""
+    meshes = {obj.data for obj in col.all_objects if obj.type == 'MESH'}
+    for obj in list(col.all_objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for child in list(col.children_recursive):
+        bpy.data.collections.remove(child)
+    bpy.data.collections.remove(col)
+    for mesh in meshes:
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+
+
+def _id_alive(id_block):
+    try:
+        id_block.name
+    except ReferenceError:
+        return False
+    return True
+
+
+def _count_naomi_collections():
+    scene_col = bpy.context.scene.collection
+    return sum(
+        1 for c in bpy.data.collections
+        if c is not scene_col and c.naomi_centroidData.naomi_assigned
+    )
+
+
+class ImportSession:
+    """Work shared by every file of one import run (multi-select, directory,
+    archive children): texture folders are decoded and scanned once, the
+    collection index is counted once, and identical meshes share datablocks."""
+
+    def __init__(self):
+        # Geometry digest --> (mesh, slot count, merge extras), see data2blender
+        self.shared_meshes = {}
+        # Normalized Textures dir --> first collection whose tex_list was built
+        self._tex_folders = {}
+        self._col_index = None
+        # Collections created by this session, in import order
+        self.collections = []
+
+    def add_collection(self, obj_col):
+        """Link obj_col to the scene; return its 0-based index among Naomi
+        collections (excludes root Scene Collection)."""
+        bpy.context.scene.collection.children.link(obj_col)
+        self.collections.append(obj_col)
+        if self._col_index is None:
+            self._col_index = _count_naomi_collections() - 1
+        else:
+            self._col_index += 1
+        return self._col_index
+
+    def attach_tex_folder(self, obj_col, filepath):
+        """Point obj_col's texture manager at the Textures folder next to filepath."""
+        tex_dir = os.path.join(os.path.dirname(filepath), 'Textures')
+        key = os.path.normcase(os.path.normpath(tex_dir))
+        first = self._tex_folders.get(key)
+        if first is False:          # no Textures folder, already checked
+            return
+        if first is None:
+            if not os.path.isdir(tex_dir):
+                self._tex_folders[key] = False
+                return
+            _decode_all_pvrs_in_folder(tex_dir)
+        obj_col.naomi_tm.tex_folder = tex_dir
+        # draw() cannot do RNA writes, so populate list here in operator context
+        if first is None:
+            from . import _rebuild_tex_list
+            _rebuild_tex_list(obj_col.naomi_tm, tex_dir)
+            self._tex_folders[key] = obj_col
+        else:
+            from . import _copy_tex_list
+            _copy_tex_list(first.naomi_tm, obj_col.naomi_tm)
+
+    def rollback(self, start: int = 0):
+        """Remove the collections created since self.collections[start] (all
+        by default) and forget cached state that pointed into them."""
+        removed = self.collections[start:]
+        del self.collections[start:]
+        for col in removed:
+            if _id_alive(col):
+                remove_imported_collection(col)
+        kept = {id(c) for c in self.collections}
+        self._tex_folders = {k: c for k, c in self._tex_folders.items()
+                             if c is False or id(c) in kept}
+        self.shared_meshes = {k: v for k, v in self.shared_meshes.items()
+                              if _id_alive(v[0])}
+        self._col_index = None
+        return len(removed)
+
+
+def _mesh_share_key(*parts) -> bytes:
+    h = hashlib.sha1()
+    for part in parts:
+        if isinstance(part, np.ndarray):
+            data = repr((part.dtype.str, part.shape)).encode() + part.tobytes()
+        else:
+            data = repr(part).encode()
+        h.update(len(data).to_bytes(8, 'little'))
+        h.update(data)
+    return h.digest()
+
+
 def data2blender(mesh_vertex: list, mesh_uvs: list, faces: list, meshes: list, meshColors: list, meshOffColors: list,
                  vertexColors: list, mesh_headers: list,
                  meshBackface: list, mesh_Centroid: list, parent_col: bpy.types.Collection, scale: float,
                  p_filepath: str, mesh_Env: list, orientation, NegScale_X: bool, col_index: int = 0, debug=False, weld: bool = False, import_normals: bool = True,
-                 meshTwoSided: list = None):
+                 meshTwoSided: list = None, session: ImportSession = None):
     if debug: print("meshes:", len(meshes))
 
     # Bump-mapped surfaces come in pairs: pass1 (base, PIX_BUMP_MAP or shading==-2)
@@ -1675,6 +1780,7 @@ def data2blender(mesh_vertex: list, mesh_uvs: list, faces: list, meshes: list, m
               f"overlay: {sorted(_bump_overlay_indices)}")
     # Map mesh index --> created Blender object, used to wire bump_partner_name links.
     _obj_by_index = {}
+    shared_meshes = session.shared_meshes if session is not None else {}
 
     for i, mesh in enumerate(meshes):
 
@@ -1729,135 +1835,178 @@ def data2blender(mesh_vertex: list, mesh_uvs: list, faces: list, meshes: list, m
                 if (cx*_ax + cy*_ay + cz*_az) < 0.0:
                     faces[i][fi] = list(reversed(face))
 
-        # Create new mesh
-        new_mesh = bpy.data.meshes.new(name=f"mesh_{i}")
-        new_mesh.uv_layers.new(do_init=True)
-        new_mesh.from_pydata(mesh_vertex[i], list(), faces[i])
-        # new_mesh.validate(verbose=True)
-
-        _nl_uv_map = {}
-        for p, polygon in enumerate(new_mesh.polygons):
-            for l, index in enumerate(polygon.loop_indices):
-                slot = faces[i][p][l]   # pre-merge binary slot index
-                u_hw = mesh_uvs[i][slot][xVal]
-                v_hw = mesh_uvs[i][slot][yVal]   # hardware V, converted below for Blender
-                _nl_uv_map[slot] = (u_hw, v_hw)  # store in hardware UV space for export
-                new_mesh.uv_layers[0].data[index].uv.x = u_hw
-                new_mesh.uv_layers[0].data[index].uv.y = 1 - v_hw
-
-        # Smooth shading for Gouraud meshes (l_param[11] = gouraud flag)
-        _is_gouraud = mesh_headers[i][0][11]
-        if _is_gouraud:
-            for _poly in new_mesh.polygons:
-                _poly.use_smooth = True
-
-        _n_unique = len(new_mesh.vertices)
-        if len(_vert_normals) < _n_unique:
-            _vert_normals.extend([(0.0, 0.0, 1.0)] * (_n_unique - len(_vert_normals)))
-
-        # Smooth shading must be on for custom split normals to render.
-        for _poly in new_mesh.polygons:
-            _poly.use_smooth = True
-
-        new_mesh.update()
+        # Identical chunks (repeated child models, instanced parts) become
+        # linked duplicates of the first mesh built for them in this batch.
+        # The material is part of the key because it lives on the mesh data.
+        _share_key = _mesh_share_key(
+            np.asarray(mesh_vertex[i], dtype=np.float64),
+            np.fromiter(map(len, faces[i]), dtype=np.int64),
+            np.fromiter((_v for _f in faces[i] for _v in _f), dtype=np.int64),
+            np.asarray(mesh_uvs[i], dtype=np.float64),
+            np.asarray(_vert_normals, dtype=np.float64),
+            np.asarray(vertexColors[i], dtype=np.float64),
+            mesh_Centroid[i], orientation, NegScale_X, weld, import_normals,
+            mesh_headers[i], meshColors[i], meshOffColors[i], meshBackface[i],
+            os.path.dirname(p_filepath), i in mesh_Env,
+            i in _bump_base_indices, i in _bump_overlay_indices,
+            mesh_headers[_bump_overlay_by_base[i]][4] if i in _bump_overlay_by_base else None,
+        )
+        _shared = shared_meshes.get(_share_key)
+        _vcol_name = 'NaomiCol'
+        _merge_extra = []
 
-        # Assign hardware normals as custom split normals.
-        # Dot-product check flips any per-loop discrepancies.
-        if import_normals:
-            _n_loops = len(new_mesh.loops)
-            _loop_normals = [(0.0, 0.0, 1.0)] * _n_loops
-            for _poly in new_mesh.polygons:
-                _gn = _poly.normal
-                for _loop_idx in _poly.loop_indices:
-                    _vi = new_mesh.loops[_loop_idx].vertex_index
-                    _vn = _vert_normals[_vi] if _vi < len(_vert_normals) else (0.0, 0.0, 1.0)
-                    if (_gn.x*_vn[0] + _gn.y*_vn[1] + _gn.z*_vn[2]) < 0.0:
-                        _vn = (-_vn[0], -_vn[1], -_vn[2])
-                    _loop_normals[_loop_idx] = _vn
-
-            # Blender 4.2+ / 5.x: use_auto_smooth and normals_split_custom_set
-            # were removed. Custom normals are now stored as a 'custom_normal'
-            # FLOAT_VECTOR CORNER attribute.
-            if hasattr(new_mesh, 'use_auto_smooth'):
-                # Blender < 4.2 legacy path
-                new_mesh.use_auto_smooth = True
-                new_mesh.normals_split_custom_set(_loop_normals)
-            else:
-                # Blender 4.2+ / 5.x path
-                if "custom_normal" in new_mesh.attributes:
-                    new_mesh.attributes.remove(new_mesh.attributes["custom_normal"])
-                attr = new_mesh.attributes.new(
-                    name="custom_normal", type='FLOAT_VECTOR', domain='CORNER')
-                flat = [c for n in _loop_normals for c in n]
-                attr.data.foreach_set("vector", flat)
+        if _shared is not None:
+            new_mesh, _n_slots, _merge_extra = _shared
+            if debug: print(f"[NaomiLib] mesh {i}: sharing {new_mesh.name}")
         else:
-            # Recalculate normals automatically (hardware normals discarded)
-            import bmesh as _bmesh_n
-            _bm_n = _bmesh_n.new()
-            _bm_n.from_mesh(new_mesh)
-            _bmesh_n.ops.recalc_face_normals(_bm_n, faces=_bm_n.faces)
-            _bm_n.to_mesh(new_mesh)
-            _bm_n.free()
-            new_mesh.update()
-
-        # Weld runs after custom normals are set (they survive the bmesh round-trip).
-        import bmesh as _bmesh
-
-        _pre_positions = [v.co.copy() for v in new_mesh.vertices]
+            # Create new mesh
+            new_mesh = bpy.data.meshes.new(name=f"mesh_{i}")
+            new_mesh.uv_layers.new(do_init=True)
+            new_mesh.from_pydata(mesh_vertex[i], list(), faces[i])
+            # new_mesh.validate(verbose=True)
+
+            _nl_uv_map = {}
+            for p, polygon in enumerate(new_mesh.polygons):
+                for l, index in enumerate(polygon.loop_indices):
+                    slot = faces[i][p][l]   # pre-merge binary slot index
+                    u_hw = mesh_uvs[i][slot][xVal]
+                    v_hw = mesh_uvs[i][slot][yVal]   # hardware V, converted below for Blender
+                    _nl_uv_map[slot] = (u_hw, v_hw)  # store in hardware UV space for export
+                    new_mesh.uv_layers[0].data[index].uv.x = u_hw
+                    new_mesh.uv_layers[0].data[index].uv.y = 1 - v_hw
+
+            # Smooth shading for Gouraud meshes (l_param[11] = gouraud flag)
+            _is_gouraud = mesh_headers[i][0][11]
+            if _is_gouraud:
+                for _poly in new_mesh.polygons:
+                    _poly.use_smooth = True
+
+            _n_unique = len(new_mesh.vertices)
+            if len(_vert_normals) < _n_unique:
+                _vert_normals.extend([(0.0, 0.0, 1.0)] * (_n_unique - len(_vert_normals)))
+
+            # Smooth shading must be on for custom split normals to render.
+            for _poly in new_mesh.polygons:
+                _poly.use_smooth = True
 
-        if weld:
-            _bm = _bmesh.new()
-            _bm.from_mesh(new_mesh)
-            _bmesh.ops.remove_doubles(_bm, verts=_bm.verts, dist=0.0)
-            _bm.to_mesh(new_mesh)
-            _bm.free()
             new_mesh.update()
 
-            def _co_key(co):
-                return (round(co.x, 6), round(co.y, 6), round(co.z, 6))
-
-            _post_lookup = {_co_key(v.co): v.index for v in new_mesh.vertices}
-
-            def _nearest_post(co):
-                best_idx, best_d2 = 0, float('inf')
-                for _idx, _pco in enumerate(new_mesh.vertices):
-                    _d2 = (co.x - _pco.co.x)**2 + (co.y - _pco.co.y)**2 + (co.z - _pco.co.z)**2
-                    if _d2 < best_d2:
-                        best_d2, best_idx = _d2, _idx
-                return best_idx
-
-            _merge_map = []
-            for _co in _pre_positions:
-                _key = _co_key(_co)
-                _merge_map.append(_post_lookup[_key] if _key in _post_lookup
-                                  else _nearest_post(_co))
-        else:
-            _merge_map = list(range(len(_pre_positions)))
-
-        # Vertex colours: indexed by pre-merge vertex ID via faces[i][p][l]
-        if vertexColors[i]:
-            _vcol_name = 'NaomiCol'
-            if hasattr(new_mesh, 'color_attributes'):
-                color_layer = new_mesh.color_attributes.new(
-                    name=_vcol_name, type='BYTE_COLOR', domain='CORNER')
+            # Assign hardware normals as custom split normals.
+            # Dot-product check flips any per-loop discrepancies.
+            if import_normals:
+                _n_loops = len(new_mesh.loops)
+                _loop_normals = [(0.0, 0.0, 1.0)] * _n_loops
+                for _poly in new_mesh.polygons:
+                    _gn = _poly.normal
+                    for _loop_idx in _poly.loop_indices:
+                        _vi = new_mesh.loops[_loop_idx].vertex_index
+                        _vn = _vert_normals[_vi] if _vi < len(_vert_normals) else (0.0, 0.0, 1.0)
+                        if (_gn.x*_vn[0] + _gn.y*_vn[1] + _gn.z*_vn[2]) < 0.0:
+                            _vn = (-_vn[0], -_vn[1], -_vn[2])
+                        _loop_normals[_loop_idx] = _vn
+
+                # Blender 4.2+ / 5.x: use_auto_smooth and normals_split_custom_set
+                # were removed. Custom normals are now stored as a 'custom_normal'
+                # FLOAT_VECTOR CORNER attribute.
+                if hasattr(new_mesh, 'use_auto_smooth'):
+                    # Blender < 4.2 legacy path
+                    new_mesh.use_auto_smooth = True
+                    new_mesh.normals_split_custom_set(_loop_normals)
+                else:
+                    # Blender 4.2+ / 5.x path
+                    if "custom_normal" in new_mesh.attributes:
+                        new_mesh.attributes.remove(new_mesh.attributes["custom_normal"])
+                    attr = new_mesh.attributes.new(
+                        name="custom_normal", type='FLOAT_VECTOR', domain='CORNER')
+                    flat = [c for n in _loop_normals for c in n]
+                    attr.data.foreach_set("vector", flat)
             else:
-                color_layer = new_mesh.vertex_colors.new(name=_vcol_name)
-            for _p, _polygon in enumerate(new_mesh.polygons):
-                for _l, _index in enumerate(_polygon.loop_indices):
-                    color_layer.data[_index].color = vertexColors[i][faces[i][_p][_l]]
+                # Recalculate normals automatically (hardware normals discarded)
+                import bmesh as _bmesh_n
+                _bm_n = _bmesh_n.new()
+                _bm_n.from_mesh(new_mesh)
+                _bmesh_n.ops.recalc_face_normals(_bm_n, faces=_bm_n.faces)
+                _bm_n.to_mesh(new_mesh)
+                _bm_n.free()
+                new_mesh.update()
+
+            # Binary slot tables for the exporter (NLexporter.nl_slot_maps), as
+            # typed attributes.  Slots are the pre-weld vertices: unwelded meshes
+            # keep hardware UVs per point; welding loses that one-to-one mapping,
+            # so each corner records its slot instead (corner data survives the weld).
+            _n_slots = len(new_mesh.vertices)
+            _slot_uv = np.zeros((_n_slots, 2), dtype=np.float32)
+            for _si, _uv in _nl_uv_map.items():
+                _slot_uv[_si] = _uv
+            if weld:
+                _loop_slot = np.empty(len(new_mesh.loops), dtype=np.int32)
+                new_mesh.loops.foreach_get('vertex_index', _loop_slot)
+                new_mesh.attributes.new('nl_slot', 'INT', 'CORNER').data.foreach_set('value', _loop_slot)
+                new_mesh.attributes.new('nl_uv_u', 'FLOAT', 'CORNER').data.foreach_set(
+                    'value', _slot_uv[_loop_slot, 0])
+                new_mesh.attributes.new('nl_uv_v', 'FLOAT', 'CORNER').data.foreach_set(
+                    'value', _slot_uv[_loop_slot, 1])
+            else:
+                new_mesh.attributes.new('nl_uv', 'FLOAT2', 'POINT').data.foreach_set(
+                    'vector', _slot_uv.ravel())
+
+            # Weld runs after custom normals are set (they survive the bmesh round-trip).
+            import bmesh as _bmesh
+
+            if weld:
+                _pre_positions = [v.co.copy() for v in new_mesh.vertices]
+                _bm = _bmesh.new()
+                _bm.from_mesh(new_mesh)
+                _bmesh.ops.remove_doubles(_bm, verts=_bm.verts, dist=0.0)
+                _bm.to_mesh(new_mesh)
+                _bm.free()
+                new_mesh.update()
+
+                def _co_key(co):
+                    return (round(co.x, 6), round(co.y, 6), round(co.z, 6))
+
+                _post_lookup = {_co_key(v.co): v.index for v in new_mesh.vertices}
+
+                def _nearest_post(co):
+                    best_idx, best_d2 = 0, float('inf')
+                    for _idx, _pco in enumerate(new_mesh.vertices):
+                        _d2 = (co.x - _pco.co.x)**2 + (co.y - _pco.co.y)**2 + (co.z - _pco.co.z)**2
+                        if _d2 < best_d2:
+                            best_d2, best_idx = _d2, _idx
+                    return best_idx
+
+                # Slots no face references can't be recovered from nl_slot;
+                # resolve those by position as before.
+                _unreferenced = np.ones(_n_slots, dtype=bool)
+                _unreferenced[_loop_slot] = False
+                for _si in np.flatnonzero(_unreferenced).tolist():
+                    _co = _pre_positions[_si]
+                    _key = _co_key(_co)
+                    _merge_extra += [_si, _post_lookup[_key] if _key in _post_lookup
+                                     else _nearest_post(_co)]
+
+            # Vertex colours: indexed by pre-merge vertex ID via faces[i][p][l]
+            if vertexColors[i]:
+                if hasattr(new_mesh, 'color_attributes'):
+                    color_layer = new_mesh.color_attributes.new(
+                        name=_vcol_name, type='BYTE_COLOR', domain='CORNER')
+                else:
+                    color_layer = new_mesh.vertex_colors.new(name=_vcol_name)
+                for _p, _polygon in enumerate(new_mesh.polygons):
+                    for _l, _index in enumerate(_polygon.loop_indices):
+                        color_layer.data[_index].color = vertexColors[i][faces[i][_p][_l]]
+
+            shared_meshes[_share_key] = (new_mesh, _n_slots, _merge_extra)
 
         new_object = bpy.data.objects.new(f"Obj{col_index}_{i}", new_mesh)
         _obj_by_index[i] = new_object
         new_object.scale = [scale] * 3
 
         new_object["nl_slot_index"] = i   # binary mesh slot order for export sorting
-        new_object["nl_merge_map"] = _merge_map
-        # Per-slot UV map stored as flat list [u0,v0,u1,v1,...]
-        _nl_uv_flat = []
-        for _si in range(len(_pre_positions)):
-            _uv = _nl_uv_map.get(_si, (0.0, 0.0))
-            _nl_uv_flat.extend([_uv[0], _uv[1]])
-        new_object["nl_uv_map"] = _nl_uv_flat
+        if weld:
+            new_object["nl_slot_count"] = _n_slots
+            if _merge_extra:
+                new_object["nl_merge_extra"] = _merge_extra
 
         # Store vertex-colour layer name so _full_rebuild can find it later
         if vertexColors[i]:
@@ -1994,10 +2143,13 @@ def data2blender(mesh_vertex: list, mesh_uvs: list, faces: list, meshes: list, m
         if debug: print(naomi_params_id)
 
         # Check if material with same naomi_params_id exists
-        existing_material = find_existing_material(str(naomi_params_id))
+        existing_material = None if _shared is not None else find_existing_material(str(naomi_params_id))
 
+        # Shared meshes already carry their material
+        if _shared is not None:
+            new_mat = None
         # if same and Vertex Colors not used
-        if existing_material and vertexColors[i] == []:
+        elif existing_material and vertexColors[i] == []:
             if debug: print('same!')
             new_mat = existing_material
         else:
@@ -2090,13 +2242,21 @@ def data2blender(mesh_vertex: list, mesh_uvs: list, faces: list, meshes: list, m
                 base_tex_image      = base_tex_image,
             )
 
-        new_object.data.materials.append(new_mat)
+        if _shared is None:
+            new_object.data.materials.append(new_mat)
+        else:
+            # Per-object slot, so material edits on one instance stay local
+            # (the __init__ material helpers copy-on-write from here).
+            _slot = new_object.material_slots[0]
+            _slot.link = 'OBJECT'
+            _slot.material = new_mesh.materials[0]
 
         # link object to parent collection
         parent_col.objects.link(new_object)
 
         # Manually set the origin to the exact centroid coordinates
-        new_object.data.transform(Matrix.Translation((-mesh_centr_x, -mesh_centr_y, -mesh_centr_z)))
+        if _shared is None:
+            new_object.data.transform(Matrix.Translation((-mesh_centr_x, -mesh_centr_y, -mesh_centr_z)))
         new_object.location = (mesh_centr_x * scale, mesh_centr_y * scale, mesh_centr_z * scale)
 
     # Wire bump_partner_name between base and overlay; rename base to '<overlay>_bump'
@@ -2128,12 +2288,15 @@ def data2blender(mesh_vertex: list, mesh_uvs: list, faces: list, meshes: list, m
 # MAIN functions
 ########################
 
-def main_function_import_file(self, filepath: str, scaling: float, debug: bool, orientation, NegScale_X: bool, weld: bool = False, import_normals: bool = True, forward_axis: str = '-Y', up_axis: str = '+Z'):
+def main_function_import_file(self, filepath: str, scaling: float, debug: bool, orientation, NegScale_X: bool, weld: bool = False, import_normals: bool = True, forward_axis: str = '-Y', up_axis: str = '+Z', data: bytes = None, session: ImportSession = None):
     global model_log
 
-    with open(filepath, "rb") as f:
-        NL = f.read(-1)
-        size = len(NL)
+    # Callers that already read the file (e.g. to compare CRCs) pass its bytes
+    if data is None:
+        with open(filepath, "rb") as f:
+            data = f.read(-1)
+    NL = data
+    size = len(NL)
 
     if size >= 0xd8:
         if debug: print(filepath)
@@ -2168,10 +2331,20 @@ def main_function_import_file(self, filepath: str, scaling: float, debug: bool,
 
         # create own collection for each imported file
         obj_col = bpy.data.collections.new(filename)
+        _crc32 = crc32_of_bytes(NL)
         obj_col.naomi_import_meta.source_filepath    = filepath
-        obj_col.naomi_import_meta.source_crc32       = calculate_crc32(filepath)
+        obj_col.naomi_import_meta.source_crc32       = _crc32
         obj_col.naomi_import_meta.import_forward_axis = forward_axis
         obj_col.naomi_import_meta.import_up_axis      = up_axis
+        if not _is_naomi2_bin(NL):
+            # Record where every vertex record lives so Update Model File can
+            # patch without re-walking the strips.  A layout the walker cannot
+            # follow leaves the index empty; Update Model File then walks the file.
+            try:
+                obj_col.naomi_import_meta.layout_index = pack_layout_index(index_naomi_bin(NL))
+                obj_col.naomi_import_meta.layout_crc32 = _crc32
+            except (struct.error, ValueError) as e:
+                print(f"[NaomiLib] layout index skipped for {filename}: {e}")
 
         obj_col.gp0.objFormat = str(g_headers[0])
         obj_col.gp1.skp1stSrcOp = g_headers[1]
@@ -2220,32 +2393,20 @@ def main_function_import_file(self, filepath: str, scaling: float, debug: bool,
 
         obj_col.naomi_centroidData.naomi_assigned = True
 
-        bpy.context.scene.collection.children.link(obj_col)
-
-        tex_dir = os.path.join(os.path.dirname(filepath), 'Textures')
-        if os.path.isdir(tex_dir):
-            _decode_all_pvrs_in_folder(tex_dir)
-            obj_col.naomi_tm.tex_folder = tex_dir
-            # draw() cannot do RNA writes, so populate list here in operator context
-            from . import _rebuild_tex_list
-            _rebuild_tex_list(obj_col.naomi_tm, tex_dir)
-
-        # 0-based collection index (excludes root Scene Collection)
-        scene_col = bpy.context.scene.collection
-        col_index = sum(
-            1 for c in bpy.data.collections
-            if c is not scene_col and c.naomi_centroidData.naomi_assigned
-        ) - 1
+        if session is None:
+            session = ImportSession()
+        col_index = session.add_collection(obj_col)
+        session.attach_tex_folder(obj_col, filepath)
 
         return data2blender(mesh_vertex, mesh_uvs, faces, meshes, meshColors=mesh_colors, meshOffColors=mesh_offcolors,
                             vertexColors=mesh_vertcol, mesh_headers=mesh_header_s, meshBackface=m_backface,
                             mesh_Env=m_env, mesh_Centroid=m_centroid,
                             parent_col=obj_col, scale=scaling, p_filepath=filepath,
                             orientation=orientation, NegScale_X=NegScale_X, col_index=col_index, debug=debug, weld=weld, import_normals=import_normals,
-                            meshTwoSided=m_two_sided)
+                            meshTwoSided=m_two_sided, session=session)
 
 
-def main_function_import_archive(self, filepath: str, scaling: float, debug: bool, orientation, NegScale_X: bool, weld: bool = False, import_normals: bool = True, forward_axis: str = '-Y', up_axis: str = '+Z'):
+def main_function_import_archive(self, filepath: str, scaling: float, debug: bool, orientation, NegScale_X: bool, weld: bool = False, import_normals: bool = True, forward_axis: str = '-Y', up_axis: str = '+Z', data: bytes = None, session: ImportSession = None):
     global model_log
 
     def swap_endianness(data: bytes) -> bytes:
@@ -2261,8 +2422,15 @@ def main_function_import_archive(self, filepath: str, scaling: float, debug: boo
         return bytes(swapped_data)
 
     filename = filepath.split(os.sep)[-1]
+    if session is None:
+        session = ImportSession()
+
+    if data is None:
+        with open(filepath, "rb") as f:
+            data = f.read(-1)
+    _archive_crc32 = crc32_of_bytes(data)
 
-    with open(filepath, "rb") as f:
+    with BytesIO(data) as f:
         read_uint32_buff = lambda: struct.unpack("<I", f.read(0x4))[0]
         read_uint16_buff = lambda: struct.unpack("<H", f.read(0x2))[0]
 
@@ -2324,6 +2492,9 @@ def main_function_import_archive(self, filepath: str, scaling: float, debug: boo
                 print(f'Model log saved to {log_file}')
 
             obj_col = bpy.data.collections.new(filename)
+            # Children are not standalone files, so source_filepath stays empty
+            obj_col.naomi_import_meta.archive_filepath = filepath
+            obj_col.naomi_import_meta.archive_crc32    = _archive_crc32
 
             obj_col.gp0.objFormat = str(g_headers[0])
             obj_col.gp1.skp1stSrcOp = g_headers[1]
@@ -2333,22 +2504,8 @@ def main_function_import_archive(self, filepath: str, scaling: float, debug: boo
 
             obj_col.naomi_centroidData.naomi_assigned = True
 
-            bpy.context.scene.collection.children.link(obj_col)
-
-            tex_dir = os.path.join(os.path.dirname(filepath), 'Textures')
-            if os.path.isdir(tex_dir):
-                _decode_all_pvrs_in_folder(tex_dir)
-                obj_col.naomi_tm.tex_folder = tex_dir
-                # draw() cannot do RNA writes, so populate list here in operator context
-                from . import _rebuild_tex_list
-                _rebuild_tex_list(obj_col.naomi_tm, tex_dir)
-
-            # 0-based collection index (excludes root Scene Collection)
-            scene_col = bpy.context.scene.collection
-            col_index = sum(
-                1 for c in bpy.data.collections
-                if c is not scene_col and c.naomi_centroidData.naomi_assigned
-            ) - 1
+            col_index = session.add_collection(obj_col)
+            session.attach_tex_folder(obj_col, filepath)
 
             if not data2blender(mesh_vertex, mesh_uvs, faces, meshes, meshColors=mesh_colors,
                                 meshOffColors=mesh_offcolors,
@@ -2357,7 +2514,7 @@ def main_function_import_archive(self, filepath: str, scaling: float, debug: boo
                                 parent_col=obj_col, scale=scaling, p_filepath=filepath,
                                 orientation=orientation, NegScale_X=NegScale_X,
                                 col_index=col_index, debug=debug, weld=weld, import_normals=import_normals,
-                                meshTwoSided=m_two_sided): return False
+                                meshTwoSided=m_two_sided, session=session): return False
             f.seek(st_p)
             start_offset = end_offset
 
@@ -2368,30 +2525,14 @@ def main_function_import_archive(self, filepath: str, scaling: float, debug: boo
 
 def _is_bump_map_pvr(pvr_path):
     """Return True if the PVR file has the bump-map pixel format (px_byte == 4)."""
-    try:
-        with open(pvr_path, 'rb') as f:
-            data = f.read(0x20)
-        offset = data.find(b"PVRT")
-        if offset == -1:
-            return False
-        px_byte = data[offset + 0x8]
-        return px_byte == 4  # 4 == Bump Map pixel format
-    except Exception:
-        return False
+    info = pvr_file_info(pvr_path)
+    return info is not None and info['px_format'] == 4  # 4 == Bump Map pixel format
 
 
 def _is_palettized_pvr(pvr_path):
     """Return True if PVR uses palettized pixel format (px_byte 8=PAL-4, 9=PAL-8)."""
-    try:
-        with open(pvr_path, 'rb') as f:
-            data = f.read(0x20)
-        offset = data.find(b"PVRT")
-        if offset == -1:
-            return False
-        px_byte = data[offset + 0x8]
-        return px_byte in (8, 9)  # 8 = PAL-4, 9 = PAL-8
-    except Exception:
-        return False
+    info = pvr_file_info(pvr_path)
+    return info is not None and info['px_format'] in (8, 9)  # 8 = PAL-4, 9 = PAL-8
 
 
 def _find_palette_file(pvr_path):
@@ -2414,6 +2555,7 @@ def _decode_all_pvrs_in_folder(tex_dir):
     pvr_normal     = []
     pvr_bump       = []
     pvr_palettized = []
+    pvr_index      = pvr_folder_index(tex_dir)
     for fname in sorted(os.listdir(tex_dir)):
         base, ext = os.path.splitext(fname)
         if ext.upper() != '.PVR':
@@ -2424,9 +2566,10 @@ def _decode_all_pvrs_in_folder(tex_dir):
         png_path = os.path.join(tex_dir, base + '.png')
         if not os.path.exists(bmp_path) and not os.path.exists(png_path):
             pvr_full = os.path.normpath(os.path.join(tex_dir, fname))
-            if _is_bump_map_pvr(pvr_full):
+            px_format = pvr_index[base]['px_format'] if base in pvr_index else None
+            if px_format == 4:
                 pvr_bump.append(pvr_full)
-            elif _is_palettized_pvr(pvr_full):
+            elif px_format in (8, 9):
                 pvr_palettized.append(pvr_full)
             else:
                 pvr_normal.append(pvr_full)
@@ -16,6 +16,7 @@ import json
 import os
 import time
 import shutil
+from collections import OrderedDict
 
 try:
     import bl_previews as _previews_mod  # Blender 5.x+
@@ -333,6 +334,60 @@ def _rebuild_tex_shading_nodes(mat, tex_shading_idx: int, alpha_tex_op: str = '0
             links.new(math_a.outputs['Value'], bsdf.inputs['Alpha'])
 
 
+# Material ID-property keys recording the last build_naomi_material() result.
+_NAOMI_SPEC_KEY        = '_naomi_spec'
+_NAOMI_SPEC_VALUES_KEY = '_naomi_spec_values'
+
+
+def _naomi_image_key(image):
+    return image.name_full if image is not None else None
+
+
+def _naomi_spec_stamp(spec, tree):
+    # Node/link counts catch trees edited by hand since the last build.
+    return f"{spec}|{len(tree.nodes)}|{len(tree.links)}"
+
+
+def _patch_naomi_material_values(mat, mesh_color, mesh_offset_color, ambient_factor,
+                                 tex_shading, mh_tex_id, is_bump_base, blend_key):
+    """
+    Write the colour-driven defaults of a tree previously built by
+    build_naomi_material() without touching its nodes or links.  Mirrors
+    every place the builder copies mesh_color / mesh_offset_color / ambient
+    into a socket, so the result matches a full rebuild.
+    """
+    nodes = mat.node_tree.nodes
+    bsdf  = nodes.get('Principled BSDF')
+
+    bsdf.inputs['Base Color'].default_value = mesh_color
+    bsdf.inputs['Alpha'].default_value      = mesh_color[3]
+    if 'Specular Tint' in bsdf.inputs:
+        bsdf.inputs['Specular Tint'].default_value = mesh_offset_color
+
+    col_rgb = tuple(bsdf.inputs['Base Color'].default_value)[:3] + (1.0,)
+    col_a   = bsdf.inputs['Alpha'].default_value
+    for node in nodes:
+        if node.get('_naomi_tex_shading'):
+            if node.bl_idname == 'ShaderNodeMixRGB':
+                node.inputs[1].default_value = col_rgb
+            elif node.bl_idname == 'ShaderNodeMath':
+                node.inputs[0].default_value = col_a
+        elif (node.get('_naomi_blend') and blend_key == (5, 1)
+              and node.bl_idname == 'ShaderNodeMixShader'):
+            node.inputs['Fac'].default_value = max(0.0, min(1.0, 1.0 - col_a))
+
+    target = (bsdf.inputs['Emission Color']
+              if 'Emission Color' in bsdf.inputs
+              else bsdf.inputs.get('Emission'))
+    use_ambient = ambient_factor > 0.0 and not is_bump_base
+    if target is not None:
+        if ((use_ambient and not bsdf.inputs['Base Color'].is_linked)
+                or (mh_tex_id == -1 and tex_shading == -1)):
+            target.default_value = mesh_color
+    if use_ambient and 'Emission Strength' in bsdf.inputs:
+        bsdf.inputs['Emission Strength'].default_value = ambient_factor
+
+
 def build_naomi_material(
     mat,
     mesh_color,
@@ -365,6 +420,9 @@ def build_naomi_material(
       is_bump_overlay — pass 2: semi-transparent textured polygon composited on top
     Neither flag → legacy NormalMap wiring (backwards compat).
 
+    The node-graph spec of each build is stamped on mat; when a later call
+    asks for the same graph only the colour inputs are rewritten.
+
     Returns the ShaderNodeTexImage node, or None.
     """
     if mat is None:
@@ -381,6 +439,38 @@ def build_naomi_material(
     if bsdf is None:
         return None
 
+    ambient_factor = float(m_tex_amb) if m_tex_amb is not None else 0.333329975605011
+    ambient_factor = max(0.0, min(1.0, ambient_factor))
+
+    # Bump base wires its own blend nodes later; skip early override here
+    _blend_src = tsp_src_alpha
+    if tex_shading == -2 and not is_bump_base:
+        _blend_dst = 1 if not is_bump_overlay else tsp_dst_alpha
+    else:
+        _blend_dst = tsp_dst_alpha
+
+    # Everything that decides which nodes/links exist; colours are patched
+    spec = repr((
+        tex_shading, tsp_src_alpha, tsp_dst_alpha, list_type, flip_uv, clamp,
+        alpha_tex_op, mh_tex_id, _naomi_image_key(tex_image), is_env_map,
+        vertex_col_layer, ambient_factor > 0.0, tsp_filter,
+        is_bump_base, is_bump_overlay, _naomi_image_key(base_tex_image),
+    ))
+    values = repr((tuple(mesh_color), tuple(mesh_offset_color), ambient_factor))
+
+    if mat.get(_NAOMI_SPEC_KEY) == _naomi_spec_stamp(spec, tree):
+        if mat.get(_NAOMI_SPEC_VALUES_KEY) != values:
+            _patch_naomi_material_values(
+                mat, mesh_color, mesh_offset_color, ambient_factor,
+                tex_shading, mh_tex_id, is_bump_base, (_blend_src, _blend_dst))
+            mat[_NAOMI_SPEC_VALUES_KEY] = values
+        if mh_tex_id >= 0 and tex_image is not None:
+            return next((n for n in nodes if n.bl_idname == 'ShaderNodeTexImage'), None)
+        return None
+
+    if _NAOMI_SPEC_KEY in mat:
+        del mat[_NAOMI_SPEC_KEY]
+
     # Full node tree teardown — always start from a clean slate
     keep = {bsdf, nodes.get('Material Output')}
     for node in list(nodes):
@@ -405,13 +495,6 @@ def build_naomi_material(
     mat.roughness = spec_val
     mat.metallic   = 0.0
 
-    # Bump base wires its own blend nodes later; skip early override here
-    _blend_src = tsp_src_alpha
-    if tex_shading == -2 and not is_bump_base:
-        _blend_dst = 1 if not is_bump_overlay else tsp_dst_alpha
-    else:
-        _blend_dst = tsp_dst_alpha
-
     _apply_blend_method(mat, _blend_method_for(_blend_src, _blend_dst, list_type))
     _rebuild_blend_nodes(mat, _blend_src, _blend_dst)
 
@@ -736,9 +819,6 @@ def build_naomi_material(
     if tex_shading >= 0 and not is_bump_base and not is_bump_overlay:
         _rebuild_tex_shading_nodes(mat, tex_shading, alpha_tex_op=alpha_tex_op)
 
-    ambient_factor = float(m_tex_amb) if m_tex_amb is not None else 0.333329975605011
-    ambient_factor = max(0.0, min(1.0, ambient_factor))
-
     # Bump base already wired base-mesh texture into Emission; don't overwrite
     if ambient_factor > 0.0 and not is_bump_base:
         base_color_input   = bsdf.inputs['Base Color']
@@ -762,6 +842,8 @@ def build_naomi_material(
         if 'Emission Strength' in bsdf.inputs:
             bsdf.inputs['Emission Strength'].default_value = ambient_factor
 
+    mat[_NAOMI_SPEC_KEY]        = _naomi_spec_stamp(spec, tree)
+    mat[_NAOMI_SPEC_VALUES_KEY] = values
     return texture_node
 
 
@@ -846,19 +928,32 @@ def _build_kwargs_from_object(obj):
 
 
 # ---------------------------------------------------------------------------
-# Property-update callbacks — all funnel through build_naomi_material
+# Property-update callbacks — all funnel through build_naomi_material,
+# debounced via _queue_full_rebuild so slider drags coalesce
 # ---------------------------------------------------------------------------
 
-def _update_blend_mode(self, context): _full_rebuild(getattr(bpy.context, "active_object", None))
-def _update_tex_shading(self, context):  _full_rebuild(getattr(bpy.context, "active_object", None))
-def _update_uv(self, context):           _full_rebuild(getattr(bpy.context, "active_object", None))
+def _prop_owner(self):
+    """Object owning property group self; falls back to the active object."""
+    obj = getattr(self, "id_data", None)
+    if isinstance(obj, bpy.types.Object):
+        return obj
+    return getattr(bpy.context, "active_object", None)
+
+
+def _update_blend_mode(self, context): _queue_full_rebuild(_prop_owner(self))
+def _update_tex_shading(self, context):  _queue_full_rebuild(_prop_owner(self))
+def _update_uv(self, context):           _queue_full_rebuild(_prop_owner(self))
 
 
 def _update_filter(self, context):
     """Point Sampled ('0') → Closest; anything else → Linear."""
-    obj = getattr(bpy.context, "active_object", None)
+    obj = _prop_owner(self)
     if obj is None:
         return
+    if _NAOMI_BATCH is not None:
+        _NAOMI_BATCH.request(obj)
+        return
+    _unshare_materials(obj)
     for slot in obj.material_slots:
         mat = slot.material
         if mat is None or not mat.use_nodes:
@@ -880,18 +975,121 @@ _NlcvError   = NLe.NlcvError
 _NLCV_ERR_CONVERT  = -3  # touch_count overflow / strip failure
 _NLCV_ERR_OUTPUT   = -4  # binary output failure
 _NLCV_ERR_INTERNAL = -5  # unexpected internal error
-def import_nl(self, context, filepath: str, bCleanup: bool, bArchive: bool, fScaling: float, bDebug: bool, bOrientation, bNegScale_X: bool, bWeld: bool = False, bImportNormals: bool = True, bForwardAxis: str = '-Y', bUpAxis: str = '+Z'):
+def import_nl(self, context, filepath: str, bCleanup: bool, bArchive: bool, fScaling: float, bDebug: bool, bOrientation, bNegScale_X: bool, bWeld: bool = False, bImportNormals: bool = True, bForwardAxis: str = '-Y', bUpAxis: str = '+Z', data: bytes = None, session=None):
 
     ret = False
 
     if bArchive:
-        ret = NLi.main_function_import_archive(self, filepath=filepath, scaling=fScaling, debug=bDebug, orientation=bOrientation, NegScale_X=bNegScale_X, weld=bWeld, import_normals=bImportNormals, forward_axis=bForwardAxis, up_axis=bUpAxis)
+        ret = NLi.main_function_import_archive(self, filepath=filepath, scaling=fScaling, debug=bDebug, orientation=bOrientation, NegScale_X=bNegScale_X, weld=bWeld, import_normals=bImportNormals, forward_axis=bForwardAxis, up_axis=bUpAxis, data=data, session=session)
     else:
-        ret = NLi.main_function_import_file(self, filepath=filepath, scaling=fScaling, debug=bDebug, orientation=bOrientation, NegScale_X=bNegScale_X, weld=bWeld, import_normals=bImportNormals, forward_axis=bForwardAxis, up_axis=bUpAxis)
+        ret = NLi.main_function_import_file(self, filepath=filepath, scaling=fScaling, debug=bDebug, orientation=bOrientation, NegScale_X=bNegScale_X, weld=bWeld, import_normals=bImportNormals, forward_axis=bForwardAxis, up_axis=bUpAxis, data=data, session=session)
 
     return ret
 
-class ImportNL(bpy.types.Operator, ImportHelper):
+
+def _source_key(path):
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _imported_collections_by_source():
+    """Map source file --> [(collection, stored CRC32)] for imported collections."""
+    by_source = {}
+    for col in bpy.data.collections:
+        meta = col.naomi_import_meta
+        if meta.source_filepath:
+            path, crc = meta.source_filepath, meta.source_crc32
+        elif meta.archive_filepath:
+            path, crc = meta.archive_filepath, meta.archive_crc32
+        else:
+            continue
+        by_source.setdefault(_source_key(path), []).append((col, crc))
+    return by_source
+
+
+class _ModalBatchOperator:
+    """Mixin for operators that work through a batch one unit per timer tick,
+    with cursor progress and Esc to cancel.
+
+    The operator queues its work, sets self._batch_done = 0 and returns
+    self._batch_run(context, total, label).  Subclasses implement
+    _batch_tick(context, block) -> True once the batch is complete,
+    _batch_finish(context) -> operator result, and _batch_cancel(context).
+    Without a window (scripts, background mode) or for a single unit the
+    batch runs inline with block=True.
+
+    While running, only view navigation reaches the rest of the UI: undo,
+    deletes or a file load would invalidate the ID references the batch holds.
+    """
+    _BATCH_TICK = 0.01
+    _BATCH_PASS_EVENTS = {
+        'MOUSEMOVE', 'INBETWEEN_MOUSEMOVE', 'MIDDLEMOUSE',
+        'WHEELUPMOUSE', 'WHEELDOWNMOUSE', 'WHEELINMOUSE', 'WHEELOUTMOUSE',
+        'TRACKPADPAN', 'TRACKPADZOOM', 'MOUSEROTATE', 'MOUSESMARTZOOM',
+        'NDOF_MOTION', 'WINDOW_DEACTIVATE',
+    }
+
+    def _batch_run(self, context, total, label):
+        self._batch_total = total
+        self._batch_label = label
+        if total <= 1 or bpy.app.background or context.window is None:
+            done = total == 0
+            while not done:
+                done = self._batch_tick(context, True)
+            return self._batch_finish(context)
+
+        wm = context.window_manager
+        wm.progress_begin(0, total)
+        self._batch_timer = wm.event_timer_add(self._BATCH_TICK, window=context.window)
+        wm.modal_handler_add(self)
+        self._batch_status(context)
+        return {'RUNNING_MODAL'}
+
+    def _batch_status(self, context):
+        context.window_manager.progress_update(self._batch_done)
+        if context.workspace is not None:
+            context.workspace.status_text_set(
+                f"{self._batch_label} {self._batch_done}/{self._batch_total}"
+                f" — Esc to cancel")
+
+    def _batch_end(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self._batch_timer)
+        wm.progress_end()
+        if context.workspace is not None:
+            context.workspace.status_text_set(None)
+
+    def modal(self, context, event):
+        if event.type == 'ESC' and event.value == 'PRESS':
+            self._batch_end(context)
+            self._batch_cancel(context)
+            return {'CANCELLED'}
+        if event.type in self._BATCH_PASS_EVENTS:
+            return {'PASS_THROUGH'}
+        if event.type != 'TIMER' or event.timer is not self._batch_timer:
+            return {'RUNNING_MODAL'}
+
+        try:
+            done = self._batch_tick(context, False)
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            self.report({'ERROR'}, f"{self._batch_label} failed: {e}")
+            self._batch_end(context)
+            self._batch_cancel(context)
+            return {'CANCELLED'}
+
+        if not done:
+            self._batch_status(context)
+            return {'RUNNING_MODAL'}
+        self._batch_end(context)
+        return self._batch_finish(context)
+
+    def cancel(self, context):
+        # Blender dropped the handler (file load, window closed)
+        self._batch_end(context)
+        self._batch_cancel(context)
+
+class ImportNL(bpy.types.Operator, ImportHelper, _ModalBatchOperator):
     """Import a NaomiLib file"""
 
     bl_idname = "import_scene.naomilib"
@@ -905,6 +1103,13 @@ class ImportNL(bpy.types.Operator, ImportHelper):
         default=False,
     )
 
+    setting_changed_only: BoolProperty(
+        name="Reimport changed only",
+        description="With Import directory: keep collections whose source file is unchanged "
+                    "(same CRC32) and rebuild only the ones that changed. Ignores Clear scene",
+        default=False,
+    )
+
     filter_glob: StringProperty(
         default="*.bin;*.lz_p",
         options={'HIDDEN'},
@@ -1001,6 +1206,9 @@ class ImportNL(bpy.types.Operator, ImportHelper):
             body.use_property_decorate = False
             body.prop(self, "setting_cleanup")
             body.prop(self, "load_directory")
+            row = body.row()
+            row.active = self.load_directory
+            row.prop(self, "setting_changed_only")
             body.prop(self, "setting_weld")
             body.prop(self, "setting_import_normals")
             body.separator()
@@ -1027,18 +1235,27 @@ class ImportNL(bpy.types.Operator, ImportHelper):
         else:
             _orient, _neg_x = _pair
 
+        self._import_args = dict(
+            fScaling=self.setting_scaling, bDebug=self.setting_debug,
+            bOrientation=_orient, bNegScale_X=_neg_x, bWeld=_do_weld,
+            bImportNormals=_do_normals, bForwardAxis=_fwd, bUpAxis=_up)
+        # Shared by every file of this run: texture folders, collection index
+        # and identical meshes (across files and archive children).
+        self._session = NLi.ImportSession()
+        self._changed_only = self.load_directory and self.setting_changed_only
+
         if self.load_directory:
-            if self.setting_cleanup:
+            if self._changed_only:
+                self._existing = _imported_collections_by_source()
+                self._skipped = self._reimported = 0
+                # (old collections, their replacements, file name) per changed file
+                self._replaced = []
+            elif self.setting_cleanup:
                 NLi.cleanup()
             folder_path = os.path.dirname(self.filepath)
-            for filename in os.listdir(folder_path):
-                if filename.endswith(".bin") or filename.lower().endswith(".lz_p"):
-                    file_path = os.path.join(folder_path, filename)
-                    _is_archive = filename.lower().endswith('.lz_p')
-                    import_nl(self, context, filepath=file_path, bCleanup=self.setting_cleanup,
-                              bArchive=_is_archive, fScaling=self.setting_scaling, bDebug=self.setting_debug,
-                              bOrientation=_orient, bNegScale_X=_neg_x, bWeld=_do_weld,
-                              bImportNormals=_do_normals, bForwardAxis=_fwd, bUpAxis=_up)
+            file_paths = [os.path.join(folder_path, filename)
+                          for filename in os.listdir(folder_path)
+                          if filename.endswith(".bin") or filename.lower().endswith(".lz_p")]
         else:
             # Build file list — multi-select or single file
             folder = os.path.dirname(self.filepath)
@@ -1055,27 +1272,84 @@ class ImportNL(bpy.types.Operator, ImportHelper):
             if self.setting_cleanup:
                 NLi.cleanup()
 
-            _last_col = None
-            for file_path in file_paths:
-                _cols_before = set(bpy.data.collections)
-                _is_archive = file_path.lower().endswith('.lz_p')
-                import_nl(self, context, filepath=file_path, bCleanup=False,
-                          bArchive=_is_archive, fScaling=self.setting_scaling, bDebug=self.setting_debug,
-                          bOrientation=_orient, bNegScale_X=_neg_x, bWeld=_do_weld,
-                          bImportNormals=_do_normals, bForwardAxis=_fwd, bUpAxis=_up)
-                _new_cols = [c for c in bpy.data.collections if c not in _cols_before]
-                if _new_cols:
-                    _last_col = _new_cols[-1]
-
-            # Set active collection to the last imported one
-            if _last_col is not None:
-                for lc in context.view_layer.layer_collection.children:
-                    if lc.collection is _last_col:
-                        context.view_layer.active_layer_collection = lc
-                        break
+        # One file per timer tick; Esc removes everything this run imported
+        self._file_paths = file_paths
+        self._batch_done = 0
+        return self._batch_run(context, len(file_paths), "Importing")
+
+    def _batch_tick(self, context, block):
+        file_path = self._file_paths[self._batch_done]
+        self._batch_done += 1
+        self._import_one(context, file_path)
+        return self._batch_done >= len(self._file_paths)
 
+    def _import_one(self, context, file_path):
+        _is_archive = file_path.lower().endswith('.lz_p')
+        _n_cols = len(self._session.collections)
+        try:
+            _data = None
+            _old = []
+            if self._changed_only:
+                # Read once: the same bytes feed the CRC and the parse
+                with open(file_path, 'rb') as f:
+                    _data = f.read()
+                _crc32 = NLi.crc32_of_bytes(_data)
+                _old = self._existing.get(_source_key(file_path), [])
+                if _old and all(crc == _crc32 for _col, crc in _old):
+                    self._skipped += 1
+                    return
+
+            ret = import_nl(self, context, filepath=file_path,
+                            bCleanup=self.setting_cleanup and self.load_directory,
+                            bArchive=_is_archive, data=_data, session=self._session,
+                            **self._import_args)
+            if ret is False:
+                self._session.rollback(_n_cols)
+                self.report({'ERROR'}, f"Could not import '{os.path.basename(file_path)}'")
+                return
+            if self._changed_only:
+                self._reimported += 1
+                if _old:
+                    # The old model goes only once the whole batch has succeeded
+                    self._replaced.append(([c for c, _crc in _old],
+                                           self._session.collections[_n_cols:],
+                                           os.path.basename(file_path)))
+        except Exception as e:
+            # Don't leave a half-built collection behind; carry on with the rest
+            import traceback
+            traceback.print_exc()
+            self._session.rollback(_n_cols)
+            self.report({'ERROR'}, f"Could not import '{os.path.basename(file_path)}': {e}")
+
+    def _batch_finish(self, context):
+        if self._changed_only:
+            for old_cols, new_cols, filename in self._replaced:
+                for col in old_cols:
+                    NLi.remove_imported_collection(col)
+                # Take back the plain name the old collection was holding
+                for col in new_cols:
+                    col.name = filename
+            self.report({'INFO'}, f"Reimported {self._reimported} changed file(s), "
+                                  f"kept {self._skipped} unchanged")
+
+        # Set active collection to the last imported one
+        _cols = self._session.collections
+        _last_col = _cols[-1] if _cols else None
+        if _last_col is not None:
+            for lc in context.view_layer.layer_collection.children:
+                if lc.collection is _last_col:
+                    context.view_layer.active_layer_collection = lc
+                    break
+        self._session = None
         return {'FINISHED'}
 
+    def _batch_cancel(self, context):
+        removed = self._session.rollback()
+        self._session = None
+        self.report({'WARNING'},
+            f"Import cancelled after {self._batch_done} of {self._batch_total} "
+            f"file(s) — removed {removed} imported collection(s)")
+
 
 class Naomi_GlobalParam_0(bpy.types.PropertyGroup):
     objFormat : bpy.props.EnumProperty(
@@ -1122,6 +1396,13 @@ class Naomi_Import_Meta(bpy.types.PropertyGroup):
     source_crc32: bpy.props.StringProperty(name="Source CRC32")
     import_forward_axis: bpy.props.StringProperty(name="Import Forward Axis", default="-Y")
     import_up_axis: bpy.props.StringProperty(name="Import Up Axis", default="+Z")
+    # Set on .lz_p children instead of source_filepath
+    archive_filepath: bpy.props.StringProperty(name="Source Archive Path")
+    archive_crc32: bpy.props.StringProperty(name="Source Archive CRC32")
+    # Packed vertex/pointer offsets of the source file (see
+    # NLexporter.pack_layout_index); only trusted while layout_crc32 matches.
+    layout_index: bpy.props.StringProperty(name="Layout Index", options={'HIDDEN'})
+    layout_crc32: bpy.props.StringProperty(name="Layout CRC32", options={'HIDDEN'})
 
 
 
@@ -1146,7 +1427,7 @@ def _qs_update(qs_prop_name):
     """Return an update callback for a quick-setting override property."""
     tsp_field = _QS_TSP_MAP[qs_prop_name]
     def _cb(self, context):
-        obj = getattr(bpy.context, 'active_object', None)
+        obj = _prop_owner(self)
         if obj is None:
             return
         tsp = getattr(obj, 'naomi_tsp', None)
@@ -1157,11 +1438,11 @@ def _qs_update(qs_prop_name):
             # Forced: write chosen value straight into the TSP field so both
             # Quick Settings and Advanced always show the same value.
             setattr(tsp, tsp_field, val)
-            _full_rebuild(obj)
+            _queue_full_rebuild(obj)
         else:
             # AUTO: restore the TSP field to the preset default, then rebuild.
             _qs_reset_to_preset_default(obj, tsp_field)
-            _full_rebuild(obj)
+            _queue_full_rebuild(obj)
     return _cb
 
 def _qs_reset_to_preset_default(obj, tsp_field):
@@ -1211,6 +1492,7 @@ def _full_rebuild(obj):
     kwargs = _build_kwargs_from_object(obj)
     if kwargs is None:
         return
+    _unshare_materials(obj)
     global _material_rebuild_in_progress
     _material_rebuild_in_progress = True
     try:
@@ -1225,26 +1507,70 @@ def _full_rebuild(obj):
         area.tag_redraw()
 
 
-def update_mesh_ambient(self, context): _full_rebuild(getattr(bpy.context, "active_object", None))
+# Names of objects waiting for a debounced _full_rebuild, in request order;
+# cleared by _on_load_post.
+_MAT_REBUILD_QUEUE = OrderedDict()
+_MAT_REBUILD_DELAY = 0.05   # seconds; updates inside one window share a rebuild
+
+
+def _queue_full_rebuild(obj):
+    """Schedule _full_rebuild(obj) on a short timer, coalescing repeat requests.
+    Inside a _NaomiBatch the rebuild is left to the batch flush instead; in
+    background mode it runs immediately."""
+    if obj is None or obj.type != 'MESH':
+        return
+    if _NAOMI_BATCH is not None:
+        _NAOMI_BATCH.request(obj)
+        return
+    if bpy.app.background:
+        # Timers never fire under `blender -b`; scripts need the rebuild now
+        _full_rebuild(obj)
+        return
+    _MAT_REBUILD_QUEUE[obj.name] = None
+    if not bpy.app.timers.is_registered(_mat_rebuild_tick):
+        bpy.app.timers.register(_mat_rebuild_tick, first_interval=_MAT_REBUILD_DELAY)
+
+
+def _mat_rebuild_tick():
+    """Timer: rebuild every queued object's materials once, then redraw."""
+    names = list(_MAT_REBUILD_QUEUE)
+    _MAT_REBUILD_QUEUE.clear()
+    for name in names:
+        obj = bpy.data.objects.get(name)
+        if obj is not None:
+            _full_rebuild(obj)
+    wm = bpy.context.window_manager
+    for window in (wm.windows if wm else ()):
+        for area in window.screen.areas:
+            if area.type in {'PROPERTIES', 'VIEW_3D', 'NODE_EDITOR'}:
+                area.tag_redraw()
+    return None
+
+
+def update_mesh_ambient(self, context): _queue_full_rebuild(_prop_owner(self))
 
 
 def update_mesh_color(self, context):
-    obj = getattr(bpy.context, "active_object", None)
+    obj = _prop_owner(self)
     # Also keep the viewport / material diffuse color in sync (cheap, no node work).
     if obj is not None and obj.material_slots:
+        _unshare_materials(obj)
         mat = obj.material_slots[0].material
         if mat:
             mat.diffuse_color = self.meshColor
         if hasattr(obj, "color") and len(obj.color) >= 4:
             obj.color = self.meshColor
-    _full_rebuild(obj)
+    _queue_full_rebuild(obj)
 
 
-def update_mesh_offsetcolor(self, context): _full_rebuild(getattr(bpy.context, "active_object", None))
+def update_mesh_offsetcolor(self, context): _queue_full_rebuild(_prop_owner(self))
 
 
 def _sync_collection_flags(obj):
     """Drive gp1.bumpMap / gp1.envMap from mesh flags across the collection."""
+    if _NAOMI_BATCH is not None:
+        _NAOMI_BATCH.sync_flags(obj)
+        return
     col = _get_col_for_obj(obj)
     if col is None:
         return
@@ -1266,22 +1592,22 @@ def _sync_collection_flags(obj):
 
 
 def _update_flag_bump(self, context):
-    obj = getattr(bpy.context, "active_object", None)
+    obj = _prop_owner(self)
     if obj:
         _sync_collection_flags(obj)
 
 
 def _update_flag_env_map(self, context):
     # Also triggers full rebuild so env-map UV wiring applies immediately
-    obj = getattr(bpy.context, "active_object", None)
+    obj = _prop_owner(self)
     if obj:
         _sync_collection_flags(obj)
-        _full_rebuild(obj)
+        _queue_full_rebuild(obj)
 
 
 def _update_flag_two_sided(self, context):
     # 1 = Cull if Small (two-sided), 2 = Cull if Negative (one-sided)
-    obj = getattr(bpy.context, "active_object", None)
+    obj = _prop_owner(self)
     if obj is None:
         return
     it = getattr(obj, "naomi_isp_tsp", None)
@@ -1292,10 +1618,12 @@ def _update_flag_two_sided(self, context):
     # 1 = Cull if Small (NAOMI two-sided), 2 = Cull if Negative (one-sided)
     it.culling = '1' if two_sided else '2'
     # Mirror to Blender material so the viewport shows it
-    if obj.data and obj.data.materials:
-        blmat = obj.data.materials[0]
-        if blmat:
-            blmat.use_backface_culling = not two_sided
+    _unshare_materials(obj)
+    if _NAOMI_BATCH is not None:
+        _NAOMI_BATCH.set_backface(obj, not two_sided)
+    blmat = _slot_material(obj)
+    if blmat:
+        blmat.use_backface_culling = not two_sided
 
 
 def _apply_texture_params(obj, has_texture: bool):
@@ -1392,13 +1720,9 @@ def _apply_texctrl_from_slot(obj, item):
         folder = bpy.path.abspath(tm.tex_folder) if (tm and tm.tex_folder) else None
         if folder:
             pvr_path = os.path.join(folder, f"TexID_{item.tex_id:03d}.PVR")
-            if os.path.isfile(pvr_path):
-                try:
-                    with open(pvr_path, 'rb') as _f:
-                        _pvr_data = _f.read(0x20)
-                    w, h = _pvr_dims_from_bytes(_pvr_data)
-                except Exception:
-                    pass
+            _hdr = pypvr.pvr_file_info(pvr_path)
+            if _hdr is not None:
+                w, h = _hdr['width'], _hdr['height']
         if (w == 0 or h == 0) and item.filepath:
             fp = bpy.path.abspath(item.filepath)
             if os.path.isfile(fp):
@@ -1527,6 +1851,14 @@ def update_texture(self, context):
         # mh_tex_id == -1 → no texture; clear the image reference too.
         kwargs['tex_image'] = None
 
+    if _NAOMI_BATCH is not None:
+        _NAOMI_BATCH.request(obj, kwargs)
+        partner = _get_bump_partner(obj)
+        if partner is not None and partner.type == 'MESH' and partner.material_slots:
+            _NAOMI_BATCH.request(partner)
+        return
+
+    _unshare_materials(obj)
     _material_rebuild_in_progress = True
     try:
         for slot in obj.material_slots:
@@ -1539,6 +1871,7 @@ def update_texture(self, context):
         if partner is not None and partner.type == 'MESH' and partner.material_slots:
             partner_kwargs = _build_kwargs_from_object(partner)
             if partner_kwargs is not None:
+                _unshare_materials(partner)
                 for pslot in partner.material_slots:
                     pmat = pslot.material
                     if pmat:
@@ -1627,77 +1960,101 @@ def _px_items_callback(self, context):
     return _valid_px_items_for(self.tex_mode)
 
 
-def _infer_format_from_image(filepath):
-    """Infer (tex_key, px_key) from image analysis, mirroring PyPVR auto_format logic.
-    Returns (tex_key, px_key) or None on failure."""
-    if not filepath or not os.path.isfile(filepath):
-        return None
-    try:
-        import numpy as _np
-        name = "__pvr_infer_tmp__"
-        if name in bpy.data.images:
-            bpy.data.images.remove(bpy.data.images[name])
-        img = bpy.data.images.load(os.path.realpath(filepath))
-        img.name = name
-        try:
-            img.colorspace_settings.name = 'Non-Color'
-        except TypeError:
-            pass
-        w, h = img.size
-        if w == 0 or h == 0:
-            bpy.data.images.remove(img)
-            return None
-        px = _np.empty(w * h * 4, dtype=_np.float32)
-        img.pixels.foreach_get(px)
-        bpy.data.images.remove(img)
-        # alpha channel is index 3 in each RGBA group
-        alpha = px[3::4]
+# _infer_format_from_image results: (normcase path, size, mtime_ns) and
+# (size, crc32 of contents) -> (tex_key, px_key), so unchanged or copied
+# artwork is classified only once per session.
+_INFER_FORMAT_CACHE = {}
 
-        def _is_pow2(n):
-            return n > 0 and (n & (n - 1)) == 0
 
-        is_square    = _is_pow2(w) and _is_pow2(h) and w == h
-        is_rectangle = _is_pow2(w) and _is_pow2(h) and w != h
+def _classify_alpha(alpha, w, h):
+    """(tex_key, px_key) from image size and a flat uint8 alpha plane (None = opaque)."""
+    import numpy as _np
 
-        # tex_mode — prefer twiddled, never stride/palette/yuv420
-        tex_key = 'tw' if (is_square or not is_rectangle) else 'twre'
+    def _is_pow2(n):
+        return n > 0 and (n & (n - 1)) == 0
 
-        # px_mode — inspect alpha channel
-        min_a = float(alpha.min())
-        if min_a >= (254.5 / 255.0):   # fully opaque
-            px_key = '565'
-        else:
-            unique_a = set(_np.round(alpha * 255).astype(_np.uint8).tolist())
-            px_key = '1555' if unique_a <= {0, 255} else '4444'
+    is_square    = _is_pow2(w) and _is_pow2(h) and w == h
+    is_rectangle = _is_pow2(w) and _is_pow2(h) and w != h
 
-        return (tex_key, px_key)
-    except Exception:
+    # tex_mode — prefer twiddled, never stride/palette/yuv420
+    tex_key = 'tw' if (is_square or not is_rectangle) else 'twre'
+
+    # px_mode — inspect alpha channel
+    counts = None if alpha is None else _np.bincount(alpha, minlength=256)
+    if counts is None or not counts[:255].any():   # fully opaque
+        px_key = '565'
+    else:
+        px_key = '1555' if not counts[1:255].any() else '4444'
+    return (tex_key, px_key)
+
+
+def _alpha_from_bpy(filepath):
+    """Full bpy load for formats read_image_alpha() does not handle."""
+    import numpy as _np
+    name = "__pvr_infer_tmp__"
+    if name in bpy.data.images:
+        bpy.data.images.remove(bpy.data.images[name])
+    img = bpy.data.images.load(os.path.realpath(filepath))
+    img.name = name
+    try:
+        img.colorspace_settings.name = 'Non-Color'
+    except TypeError:
+        pass
+    w, h = img.size
+    if w == 0 or h == 0:
+        bpy.data.images.remove(img)
         return None
+    px = _np.empty(w * h * 4, dtype=_np.float32)
+    img.pixels.foreach_get(px)
+    bpy.data.images.remove(img)
+    # alpha channel is index 3 in each RGBA group
+    alpha = _np.round(px[3::4] * 255).astype(_np.uint8)
+    return alpha, w, h
 
 
-def _read_pvr_header(folder, tex_id):
-    """Return (tex_key, px_key, has_mips) by reading TexID_NNN.PVR header, or None."""
-    import struct, io as _io
-    pvr_path = os.path.join(folder, f"TexID_{tex_id:03d}.PVR")
-    if not os.path.isfile(pvr_path):
+def _infer_format_from_image(filepath):
+    """Infer (tex_key, px_key) from image analysis, mirroring PyPVR auto_format logic.
+    Returns (tex_key, px_key) or None on failure."""
+    import struct, zlib
+    try:
+        st = os.stat(filepath)
+    except (OSError, TypeError, ValueError):
         return None
+    stat_key = (os.path.normcase(filepath), st.st_size, st.st_mtime_ns)
+    if stat_key in _INFER_FORMAT_CACHE:
+        return _INFER_FORMAT_CACHE[stat_key]
     try:
-        with open(pvr_path, 'rb') as f:
-            data = f.read(0x20)
-        offset = data.find(b"PVRT")
-        if offset == -1:
-            return None
-        buf = _io.BytesIO(data)
-        buf.seek(offset + 0x8)
-        px_byte  = struct.unpack('B', buf.read(1))[0]
-        tex_byte = struct.unpack('B', buf.read(1))[0]
-        tex_key = _PVR_TEX_BYTE_TO_KEY.get(tex_byte)
-        px_key  = _PVR_PX_BYTE_TO_KEY.get(px_byte)
-        has_mips = tex_byte in _MM_TEX_BYTES
-        if tex_key and px_key:
-            return (tex_key, px_key, has_mips)
+        with open(filepath, 'rb') as f:
+            data = f.read()
+        hash_key = (len(data), zlib.crc32(data))
+        result = _INFER_FORMAT_CACHE.get(hash_key)
+        if result is None:
+            try:
+                alpha, w, h = pypvr.read_image_alpha(data)
+            except (ValueError, IndexError, KeyError, struct.error, zlib.error):
+                loaded = _alpha_from_bpy(filepath)
+                if loaded is None:
+                    return None
+                alpha, w, h = loaded
+            result = _INFER_FORMAT_CACHE[hash_key] = _classify_alpha(alpha, w, h)
+        _INFER_FORMAT_CACHE[stat_key] = result
+        return result
     except Exception:
-        pass
+        return None
+
+
+def _read_pvr_header(folder, tex_id, index=None):
+    """Return (tex_key, px_key, has_mips) for TexID_NNN.PVR from the folder's PVR index, or None.
+    Pass *index* (pypvr.pvr_folder_index) when looking up several slots of one folder."""
+    if index is None:
+        index = pypvr.pvr_folder_index(folder)
+    info = index.get(f"TexID_{tex_id:03d}")
+    if info is None:
+        return None
+    tex_key = _PVR_TEX_BYTE_TO_KEY.get(info['tex_format'])
+    px_key  = _PVR_PX_BYTE_TO_KEY.get(info['px_format'])
+    if tex_key and px_key:
+        return (tex_key, px_key, info['mips'])
     return None
 
 
@@ -2293,30 +2650,216 @@ def _reset_collection_props(col):
     col.naomi_centroidData.collection_bound_radius = 1.0
 
 
+def _slot_material(obj, index=0):
+    """Material obj shows in slot index, whether object- or mesh-linked."""
+    slots = obj.material_slots
+    return slots[index].material if len(slots) > index else None
+
+
+def _set_slot_material(obj, mat, index=0):
+    """Assign mat to obj's slot index.  Linked duplicates (mesh shared with
+    other objects) get an object-linked slot so the other users keep theirs."""
+    mesh = obj.data
+    if len(obj.material_slots) <= index:
+        mesh.materials.append(mat if mesh.users <= 1 else None)
+    slot = obj.material_slots[index]
+    if mesh.users > 1:
+        slot.link = 'OBJECT'
+    slot.material = mat
+
+
+def _material_shared(obj, slot):
+    """True if editing slot's material in place would also change other objects."""
+    if obj.data.users > 1:
+        return slot.link == 'DATA' or slot.material.users > 1
+    return slot.material.users > 1
+
+
 def _ensure_material(obj, name_suffix):
     """Ensure obj has an exclusive material on slot 0 with use_nodes=True."""
-    if not obj.data.materials:
+    mat = _slot_material(obj)
+    if mat is None:
         mat = bpy.data.materials.new(name=f"{obj.name}_{name_suffix}")
         mat.use_nodes = True
         mat.use_backface_culling = True
-        obj.data.materials.append(mat)
-    else:
-        mat = obj.data.materials[0]
-        if mat is None:
-            mat = bpy.data.materials.new(name=f"{obj.name}_{name_suffix}")
-            mat.use_nodes = True
-            mat.use_backface_culling = True
-            obj.data.materials[0] = mat
-        elif mat.users > 1:
-            # Material is shared — make an exclusive copy for this object.
-            mat = mat.copy()
-            mat.name = f"{obj.name}_{name_suffix}"
-            obj.data.materials[0] = mat
-        if not mat.use_nodes:
-            mat.use_nodes = True
+        _set_slot_material(obj, mat)
+    elif _material_shared(obj, obj.material_slots[0]):
+        # Material is shared — make an exclusive copy for this object.
+        mat = mat.copy()
+        mat.name = f"{obj.name}_{name_suffix}"
+        _set_slot_material(obj, mat)
+    if not mat.use_nodes:
+        mat.use_nodes = True
     return mat
 
 
+def _unshare_materials(obj):
+    """Give obj its own copy of any material it shares with other objects:
+    ones a _NaomiBatch shared, and the mesh materials of a linked duplicate."""
+    linked_dup = obj.data.users > 1
+    for index, slot in enumerate(obj.material_slots):
+        mat = slot.material
+        if mat is None:
+            continue
+        if not linked_dup:
+            if not mat.get(_NAOMI_SHARED_KEY):
+                continue
+            if mat.users <= 1:
+                del mat[_NAOMI_SHARED_KEY]
+                continue
+        elif not _material_shared(obj, slot):
+            continue
+        own = mat.copy()
+        if _NAOMI_SHARED_KEY in own:
+            del own[_NAOMI_SHARED_KEY]
+        own.name = f"{obj.name}_Naomi"
+        _set_slot_material(obj, own, index)
+
+
+def _build_preset_material(obj, name_suffix, **kwargs):
+    """_ensure_material + build_naomi_material; deferred while a batch is open."""
+    if _NAOMI_BATCH is not None:
+        _NAOMI_BATCH.request(obj, kwargs, name_suffix)
+        return
+    mat = _ensure_material(obj, name_suffix)
+    build_naomi_material(mat=mat, **kwargs)
+
+
+def _naomi_build_key(kwargs):
+    return repr(sorted(
+        (k, v.name_full if isinstance(v, bpy.types.ID) else v)
+        for k, v in kwargs.items()
+    ))
+
+
+# Marks a material a _NaomiBatch assigned to several objects; edits through
+# the property callbacks copy it first (_unshare_materials).
+_NAOMI_SHARED_KEY = '_naomi_shared'
+# The open _NaomiBatch, if any.
+_NAOMI_BATCH = None
+
+
+class _NaomiBatch:
+    """
+    Apply Naomi properties to many objects as one unit.
+
+    While open, property callbacks record which objects need a material build
+    instead of rebuilding, and collection flag syncs are deferred.  On exit
+    every touched object is built once; objects whose final build arguments
+    are identical share a single material datablock.  Nested batches join
+    the outer one.
+    """
+
+    def __init__(self):
+        self._outer = None
+        # as_pointer() -> [obj, explicit kwargs or None, name_suffix, from_props]
+        self.builds = OrderedDict()
+        self.flag_objs = OrderedDict()
+
+    def __enter__(self):
+        global _NAOMI_BATCH
+        self._outer = _NAOMI_BATCH
+        if self._outer is None:
+            _NAOMI_BATCH = self
+        return _NAOMI_BATCH
+
+    def __exit__(self, exc_type, exc, tb):
+        global _NAOMI_BATCH
+        if self._outer is None:
+            _NAOMI_BATCH = None
+            if exc_type is None:
+                self.flush()
+        return False
+
+    def request(self, obj, kwargs=None, name_suffix='Naomi'):
+        """Queue obj for a build: with kwargs as given, or from its properties."""
+        if obj is None or obj.type != 'MESH':
+            return
+        key = obj.as_pointer()
+        entry = self.builds.get(key)
+        if kwargs is not None:
+            self.builds[key] = [obj, dict(kwargs), name_suffix, False]
+        elif entry is None:
+            self.builds[key] = [obj, None, name_suffix, True]
+        else:
+            entry[3] = True
+
+    def set_backface(self, obj, value):
+        entry = self.builds.get(obj.as_pointer())
+        if entry is not None and entry[1] is not None:
+            entry[1]['use_backface_culling'] = value
+
+    def sync_flags(self, obj):
+        col = _get_col_for_obj(obj)
+        if col is not None:
+            self.flag_objs[col.name] = obj
+
+    def _resolve(self, obj, explicit, from_props):
+        if not from_props:
+            return explicit
+        if not obj.material_slots and explicit is None:
+            return None
+        kwargs = _build_kwargs_from_object(obj)
+        if kwargs is None:
+            return explicit
+        if explicit is not None:
+            # The explicit build would have run first; props can't see its
+            # texture/culling yet since the old material is still in place.
+            kwargs['tex_image']            = explicit['tex_image']
+            kwargs['use_backface_culling'] = explicit['use_backface_culling']
+        return kwargs
+
+    def flush(self):
+        global _material_rebuild_in_progress
+        shared = {}
+        _material_rebuild_in_progress = True
+        try:
+            for obj, explicit, name_suffix, from_props in self.builds.values():
+                kwargs = self._resolve(obj, explicit, from_props)
+                if kwargs is None:
+                    continue
+                key = _naomi_build_key(kwargs)
+                mat = shared.get(key)
+                if mat is None:
+                    mat = _ensure_material(obj, name_suffix)
+                    build_naomi_material(mat=mat, **kwargs)
+                    shared[key] = mat
+                else:
+                    old = _slot_material(obj)
+                    if old is not mat:
+                        mat[_NAOMI_SHARED_KEY] = True
+                        _set_slot_material(obj, mat)
+                        if old is not None and old.users == 0:
+                            bpy.data.materials.remove(old)
+                for slot in obj.material_slots[1:]:
+                    if slot.material and slot.material is not mat:
+                        build_naomi_material(mat=slot.material, **kwargs)
+        finally:
+            _material_rebuild_in_progress = False
+        for obj in self.flag_objs.values():
+            _sync_collection_flags(obj)
+
+
+def _mark_collection_assigned(obj):
+    for col in bpy.data.collections:
+        if obj.name in col.objects and not col.naomi_centroidData.naomi_assigned:
+            col.naomi_centroidData.naomi_assigned = True
+            break
+
+
+def _assign_preset_to_selection(context, apply_fn):
+    """Run a preset helper over the selected meshes (or the active object) as one batch."""
+    targets = [o for o in context.selected_objects if o.type == 'MESH'] \
+              or ([context.active_object] if context.active_object else [])
+    with _NaomiBatch():
+        for obj in targets:
+            tex_image = _snapshot_tex_image(obj)
+            apply_fn(obj, tex_image=tex_image)
+            _mark_collection_assigned(obj)
+            _sync_collection_flags(obj)
+    return targets
+
+
 def _snapshot_tex_image(obj):
     """Return the bpy.data.Image currently wired in obj's first material, or None."""
     if not obj or not obj.material_slots:
@@ -2396,9 +2939,8 @@ def _apply_lambert_preset(obj, tex_image=None):
     t.texUSize         = '0'
     t.texVSize         = '0'
 
-    mat = _ensure_material(obj, 'Naomi')
-    build_naomi_material(
-        mat                  = mat,
+    _build_preset_material(
+        obj, 'Naomi',
         mesh_color           = tuple(p.meshColor),
         mesh_offset_color    = tuple(p.meshOffsetColor),
         tex_shading          = int(p.m_tex_shading),
@@ -2477,9 +3019,8 @@ def _apply_flat_preset(obj, tex_image=None):
     t.texUSize         = '0'
     t.texVSize         = '0'
 
-    mat = _ensure_material(obj, 'Naomi')
-    build_naomi_material(
-        mat                  = mat,
+    _build_preset_material(
+        obj, 'Naomi',
         mesh_color           = tuple(p.meshColor),
         mesh_offset_color    = tuple(p.meshOffsetColor),
         tex_shading          = int(p.m_tex_shading),
@@ -2591,9 +3132,8 @@ def _apply_vertex_color_preset(obj, tex_image=None):
     for _poly in obj.data.polygons:
         _poly.use_smooth = True
 
-    mat = _ensure_material(obj, 'NaomiVCol')
-    build_naomi_material(
-        mat                  = mat,
+    _build_preset_material(
+        obj, 'NaomiVCol',
         mesh_color           = tuple(p.meshColor),
         mesh_offset_color    = tuple(p.meshOffsetColor),
         tex_shading          = int(p.m_tex_shading),
@@ -2728,9 +3268,8 @@ def _apply_bump_mesh_params(bump_obj, tex_image=None):
     except Exception:
         pass
 
-    mat = _ensure_material(bump_obj, 'Naomi_Bump')
-    build_naomi_material(
-        mat                  = mat,
+    _build_preset_material(
+        bump_obj, 'Naomi_Bump',
         mesh_color           = tuple(p.meshColor),
         mesh_offset_color    = tuple(p.meshOffsetColor),
         tex_shading          = -2,
@@ -2814,9 +3353,8 @@ def _apply_plain_mesh_params(obj, tex_image=None):
     except Exception:
         pass
 
-    mat = _ensure_material(obj, 'Naomi_BumpPlain')
-    build_naomi_material(
-        mat                  = mat,
+    _build_preset_material(
+        obj, 'Naomi_BumpPlain',
         mesh_color           = tuple(p.meshColor),
         mesh_offset_color    = tuple(p.meshOffsetColor),
         tex_shading          = 0,
@@ -2885,12 +3423,11 @@ sa=4, da=5).  Both objects use the same _bump.pvr texture (assigned later)."""
 
         # Detach materials so both objects are independent
         bump_obj.data.materials.clear()
-        if base_obj.data.materials:
-            orig_mat = base_obj.data.materials[0]
-            if orig_mat is not None and orig_mat.users > 1:
-                base_copy = orig_mat.copy()
-                base_copy.name = f"{base_obj.name}_Naomi"
-                base_obj.data.materials[0] = base_copy
+        orig_mat = _slot_material(base_obj)
+        if orig_mat is not None and _material_shared(base_obj, base_obj.material_slots[0]):
+            base_copy = orig_mat.copy()
+            base_copy.name = f"{base_obj.name}_Naomi"
+            _set_slot_material(base_obj, base_copy)
 
         # Apply pass-1 params to bump_obj
         _apply_bump_mesh_params(bump_obj, tex_image=None)
@@ -3004,7 +3541,7 @@ and add it to the Texture Manager.  Skips if identical content already exists.""
         return int(regular_obj.naomi_param.mh_texID) >= 0
 
     def execute(self, context):
-        import hashlib, math
+        import hashlib
         obj      = context.active_object
         bump_obj = obj if _is_bump_mesh(obj) else _get_bump_partner(obj)
         base = bump_obj  # alias kept for rest of function
@@ -3056,54 +3593,35 @@ and add it to the Texture Manager.  Skips if identical content already exists.""
             self.report({'ERROR'}, "Base texture has zero size.")
             return {'CANCELLED'}
 
-        # Build greyscale height map from base texture pixels.
-        raw = list(base_img.pixels)
-
-        def lum(idx):
-            """Luminance of pixel at flat RGBA index idx (already *4)."""
-            r = raw[idx];  g = raw[idx+1];  b = raw[idx+2]
-            # Rec.709 luminance
-            return 0.2126*r + 0.7152*g + 0.0722*b
-
-        # Sobel height→normal conversion.
-        scale = self.strength
-        out   = [0.0] * (W * H * 4)
-
-        for y in range(H):
-            for x in range(W):
-                # Clamp-to-edge neighbours
-                xm = max(x-1, 0);   xp = min(x+1, W-1)
-                ym = max(y-1, 0);   yp = min(y+1, H-1)
-
-                # Sample height values (8 neighbours + centre unused in Sobel)
-                tl = lum((ym*W + xm)*4);  tc = lum((ym*W + x )*4);  tr = lum((ym*W + xp)*4)
-                ml = lum(( y*W + xm)*4);                              mr = lum(( y*W + xp)*4)
-                bl = lum((yp*W + xm)*4);  bc = lum((yp*W + x )*4);  br = lum((yp*W + xp)*4)
-
-                # Sobel kernels
-                dx = (tr + 2*mr + br) - (tl + 2*ml + bl)
-                dy = (bl + 2*bc + br) - (tl + 2*tc + tr)
-
-                # Surface normal (unnormalised)
-                nx = -dx * scale
-                ny = -dy * scale
-                nz = 1.0
-
-                # Normalise
-                length = math.sqrt(nx*nx + ny*ny + nz*nz)
-                if length > 0:
-                    nx /= length;  ny /= length;  nz /= length
-
-                # Encode to 0-1 range (normal map convention)
-                base_i = (y*W + x)*4
-                out[base_i  ] = nx * 0.5 + 0.5   # R
-                out[base_i+1] = ny * 0.5 + 0.5   # G
-                out[base_i+2] = nz * 0.5 + 0.5   # B
-                out[base_i+3] = 1.0               # A
+        # Build greyscale height map from base texture pixels (Rec.709 luminance).
+        import numpy as _np
+        px = _np.empty(W * H * 4, dtype=_np.float32)
+        base_img.pixels.foreach_get(px)
+        rgba   = px.reshape(H, W, 4).astype(_np.float64)
+        height = 0.2126*rgba[:, :, 0] + 0.7152*rgba[:, :, 1] + 0.0722*rgba[:, :, 2]
+        height = _np.pad(height, 1, mode='edge')
+
+        # Sobel height→normal conversion on the clamp-to-edge padded field.
+        tl, tc, tr = height[:-2, :-2], height[:-2, 1:-1], height[:-2, 2:]
+        ml,     mr = height[1:-1, :-2],                   height[1:-1, 2:]
+        bl, bc, br = height[2:, :-2],  height[2:, 1:-1],  height[2:, 2:]
+        dx = (tr + 2*mr + br) - (tl + 2*ml + bl)
+        dy = (bl + 2*bc + br) - (tl + 2*tc + tr)
+
+        scale  = self.strength
+        normal = _np.stack([-dx * scale, -dy * scale, _np.ones_like(dx)], axis=-1)
+        normal /= _np.linalg.norm(normal, axis=-1, keepdims=True)
+
+        # Encode to 0-1 range (normal map convention), opaque alpha
+        out = _np.ones((H, W, 4), dtype=_np.float64)
+        out[:, :, :3] = normal * 0.5 + 0.5
+
+        def _quantise(values):
+            """8-bit bytes used for duplicate detection (truncating, as int())."""
+            return _np.clip(values * 255, 0, 255).astype(_np.uint8).tobytes()
 
         # Deduplication: compare MD5 against existing folder images
-        raw_bytes = bytes(min(255, max(0, int(v * 255))) for v in out)
-        new_hash  = hashlib.md5(raw_bytes).hexdigest()
+        new_hash = hashlib.md5(_quantise(out)).hexdigest()
 
         existing_id = None
         for fname in os.listdir(folder):
@@ -3117,10 +3635,12 @@ and add it to the Texture Manager.  Skips if identical content already exists.""
             try:
                 cand_img = bpy.data.images.load(
                     os.path.join(folder, fname), check_existing=True)
-                cand_img.pixels[0]  # force load
-                cand_bytes = bytes(
-                    min(255, max(0, int(v * 255))) for v in cand_img.pixels)
-                if hashlib.md5(cand_bytes).hexdigest() == new_hash:
+                cw, ch = cand_img.size
+                if cw * ch != W * H:
+                    continue  # different byte length — cannot hash-match
+                cand_px = _np.empty(cw * ch * 4, dtype=_np.float32)
+                cand_img.pixels.foreach_get(cand_px)
+                if hashlib.md5(_quantise(cand_px.astype(_np.float64))).hexdigest() == new_hash:
                     existing_id = candidate_id
                     break
             except Exception:
@@ -3149,7 +3669,7 @@ and add it to the Texture Manager.  Skips if identical content already exists.""
 
         new_img = bpy.data.images.new(
             f"TexID_{new_id:03d}", width=W, height=H, alpha=True, float_buffer=False)
-        new_img.pixels = out
+        new_img.pixels.foreach_set(out.astype(_np.float32).ravel())
         new_img.filepath_raw = new_path
         new_img.file_format  = 'BMP'
         new_img.save()
@@ -3181,16 +3701,7 @@ class NAOMI_OT_assign_object_material(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        targets = [o for o in context.selected_objects if o.type == 'MESH'] \
-                  or ([context.active_object] if context.active_object else [])
-        for obj in targets:
-            tex_image = _snapshot_tex_image(obj)
-            _apply_lambert_preset(obj, tex_image=tex_image)   # default: Lambert
-            for col in bpy.data.collections:
-                if obj.name in col.objects and not col.naomi_centroidData.naomi_assigned:
-                    col.naomi_centroidData.naomi_assigned = True
-                    break
-            _sync_collection_flags(obj)
+        _assign_preset_to_selection(context, _apply_lambert_preset)   # default: Lambert
         return {'FINISHED'}
 
 
@@ -3201,16 +3712,7 @@ class NAOMI_OT_assign_preset_lambert(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        targets = [o for o in context.selected_objects if o.type == 'MESH'] \
-                  or ([context.active_object] if context.active_object else [])
-        for obj in targets:
-            tex_image = _snapshot_tex_image(obj)
-            _apply_lambert_preset(obj, tex_image=tex_image)
-            for col in bpy.data.collections:
-                if obj.name in col.objects and not col.naomi_centroidData.naomi_assigned:
-                    col.naomi_centroidData.naomi_assigned = True
-                    break
-            _sync_collection_flags(obj)
+        _assign_preset_to_selection(context, _apply_lambert_preset)
         return {'FINISHED'}
 
 
@@ -3221,16 +3723,7 @@ class NAOMI_OT_assign_preset_flat(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        targets = [o for o in context.selected_objects if o.type == 'MESH'] \
-                  or ([context.active_object] if context.active_object else [])
-        for obj in targets:
-            tex_image = _snapshot_tex_image(obj)
-            _apply_flat_preset(obj, tex_image=tex_image)
-            for col in bpy.data.collections:
-                if obj.name in col.objects and not col.naomi_centroidData.naomi_assigned:
-                    col.naomi_centroidData.naomi_assigned = True
-                    break
-            _sync_collection_flags(obj)
+        _assign_preset_to_selection(context, _apply_flat_preset)
         return {'FINISHED'}
 
 
@@ -3241,16 +3734,7 @@ class NAOMI_OT_assign_preset_vertex_colors(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        targets = [o for o in context.selected_objects if o.type == 'MESH'] \
-                  or ([context.active_object] if context.active_object else [])
-        for obj in targets:
-            tex_image = _snapshot_tex_image(obj)
-            _apply_vertex_color_preset(obj, tex_image=tex_image)
-            for col in bpy.data.collections:
-                if obj.name in col.objects and not col.naomi_centroidData.naomi_assigned:
-                    col.naomi_centroidData.naomi_assigned = True
-                    break
-            _sync_collection_flags(obj)
+        _assign_preset_to_selection(context, _apply_vertex_color_preset)
         return {'FINISHED'}
 
 
@@ -3262,16 +3746,7 @@ Preserves any texture already assigned via the Texture Manager."""
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        targets = [o for o in context.selected_objects if o.type == 'MESH'] \
-                  or ([context.active_object] if context.active_object else [])
-        for obj in targets:
-            tex_image = _snapshot_tex_image(obj)
-            _apply_env_map_preset(obj, tex_image=tex_image)
-            for col in bpy.data.collections:
-                if obj.name in col.objects and not col.naomi_centroidData.naomi_assigned:
-                    col.naomi_centroidData.naomi_assigned = True
-                    break
-            _sync_collection_flags(obj)
+        _assign_preset_to_selection(context, _apply_env_map_preset)
         return {'FINISHED'}
 
 
@@ -3293,16 +3768,7 @@ class NAOMI_OT_assign_preset_palette(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        targets = [o for o in context.selected_objects if o.type == 'MESH'] \
-                  or ([context.active_object] if context.active_object else [])
-        for obj in targets:
-            tex_image = _snapshot_tex_image(obj)
-            _apply_palette_preset(obj, tex_image=tex_image)
-            for col in bpy.data.collections:
-                if obj.name in col.objects and not col.naomi_centroidData.naomi_assigned:
-                    col.naomi_centroidData.naomi_assigned = True
-                    break
-            _sync_collection_flags(obj)
+        _assign_preset_to_selection(context, _apply_palette_preset)
         return {'FINISHED'}
 
 
@@ -3434,23 +3900,24 @@ class NAOMI_OT_paste_object_props(bpy.types.Operator):
             preset_fn = _apply_lambert_preset
 
         global _material_rebuild_in_progress
-        _material_rebuild_in_progress = True
-        try:
-            for obj in targets:
-                preset_fn(obj)
-                _dict_to_object_props(obj, _naomi_props_clipboard)
-                if new_id >= 0:
-                    _, tm = _get_col_tm(obj)
-                    if tm is not None:
-                        for item in tm.tex_list:
-                            if item.tex_id == new_id and not item.is_empty:
-                                _apply_texctrl_from_slot(obj, item)
-                                break
-        finally:
-            _material_rebuild_in_progress = False
+        with _NaomiBatch():
+            _material_rebuild_in_progress = True
+            try:
+                for obj in targets:
+                    preset_fn(obj)
+                    _dict_to_object_props(obj, _naomi_props_clipboard)
+                    if new_id >= 0:
+                        _, tm = _get_col_tm(obj)
+                        if tm is not None:
+                            for item in tm.tex_list:
+                                if item.tex_id == new_id and not item.is_empty:
+                                    _apply_texctrl_from_slot(obj, item)
+                                    break
+            finally:
+                _material_rebuild_in_progress = False
 
-        for obj in targets:
-            update_texture(obj.naomi_param, context)
+            for obj in targets:
+                update_texture(obj.naomi_param, context)
 
         self.report({'INFO'}, f"Pasted Naomi properties to {len(targets)} object(s).")
         return {'FINISHED'}
@@ -4172,9 +4639,9 @@ Only available for collections imported via the NaomiLib importer."""
 
         filepath = selected_collection.naomi_import_meta.source_filepath
         try:
-            NLe.update_naomi_bin(filepath, selected_collection,
-                                 update_centroids=self.recalculate_centroid)
-            selected_collection.naomi_import_meta.source_crc32 = NLe.calculate_crc32(filepath)
+            selected_collection.naomi_import_meta.source_crc32 = NLe.update_naomi_bin(
+                filepath, selected_collection,
+                update_centroids=self.recalculate_centroid)
             self.report({'INFO'}, f"Updated {filepath}")
         except Exception as e:
             self.report({'ERROR'}, str(e))
@@ -4201,12 +4668,7 @@ class NAOMI_UL_texture_list(bpy.types.UIList):
 
         icon_id = 0
         if _TM_PREVIEWS is not None and key:
-            if key in _TM_PREVIEWS:
-                icon_id = _TM_PREVIEWS[key].icon_id
-            elif abs_fp and os.path.isfile(abs_fp):
-                icon_id = _tm_previews_load(abs_fp)
-                if context and context.area:
-                    context.area.tag_redraw()
+            icon_id = _tm_previews_get(abs_fp)
 
         row = layout.row(align=False)
 
@@ -4434,14 +4896,18 @@ def _get_col_tm(obj):
     return None, None
 
 
-def _get_tex_folder(obj):
+def _get_tex_folder(obj, cached=False):
     """Return the texture folder from obj's parent Naomi collection.
-    Falls back to inferring from loaded images if no folder is set on the collection."""
+    Falls back to inferring from loaded images if no folder is set on the collection.
+    cached=True answers the is-it-a-directory check from the folder watcher
+    where it can, so hot paths don't stat network shares."""
     col, tm = _get_col_tm(obj)
     if tm is not None:
         folder = tm.tex_folder
-        if folder and os.path.isdir(bpy.path.abspath(folder)):
-            return bpy.path.abspath(folder)
+        if folder:
+            folder = bpy.path.abspath(folder)
+            if _tex_folder_isdir(folder) if cached else os.path.isdir(folder):
+                return folder
     # Legacy / inference fallback — scan object's material slots
     for ms in obj.material_slots:
         mat = ms.material
@@ -4464,8 +4930,25 @@ _FILTER_GLOB_IMAGES = "*.bmp;*.png;*.jpg;*.jpeg;*.gif;*.tga;*.tif;*.tiff;*.exr;*
 
 
 def _scan_tex_folder(folder):
-    """Return list of (tex_id, filepath_or_None) for every TexID_NNN image in folder."""
-    if not folder or not os.path.isdir(folder):
+    """Return list of (tex_id, filepath_or_None) for every TexID_NNN image in folder.
+    Refreshes the watcher's state for folder when it is being watched."""
+    if not folder:
+        return []
+    entry = _TEX_FOLDERS.get(_tex_folder_key(folder))
+    if entry is not None:
+        try:
+            cur = os.stat(folder).st_mtime_ns
+        except OSError:
+            cur = None
+        if cur != entry[1]:
+            entry[1], entry[3] = cur, False
+        entry[2] = _scan_tex_folder_now(folder)
+        return list(entry[2])
+    return _scan_tex_folder_now(folder)
+
+
+def _scan_tex_folder_now(folder):
+    if not os.path.isdir(folder):
         return []
     pattern_map = {}
     for fname in os.listdir(folder):
@@ -4484,6 +4967,108 @@ def _scan_tex_folder(folder):
     return [(i, pattern_map.get(i)) for i in range(max_id + 1)]
 
 
+# ---------------------------------------------------------------------------
+# Texture folder watcher
+# ---------------------------------------------------------------------------
+# Directory mtime changes whenever an entry is added, removed or renamed, so a
+# stat per folder every _TEX_FOLDER_POLL seconds replaces rescanning on each
+# selection change.  normcase(abs folder) -> [folder, dir mtime_ns or None,
+# slots from _scan_tex_folder (None until first scan), settled].  An mtime is
+# settled once a tick one poll later still sees it: network shares store
+# mtimes at 1-2 s resolution, so a change is rescanned once more before the
+# folder is trusted again.  Only recorded mtimes are compared, never the local
+# clock, so server clock skew does not matter.
+_TEX_FOLDERS = {}
+_TEX_FOLDER_POLL = 2.0
+
+
+def _tex_folder_key(folder):
+    return os.path.normcase(os.path.normpath(bpy.path.abspath(folder)))
+
+
+def _tex_folder_watch(folder):
+    """Start watching folder; the first scan happens on the next timer tick."""
+    key = _tex_folder_key(folder)
+    if key in _TEX_FOLDERS:
+        return
+    _TEX_FOLDERS[key] = [bpy.path.abspath(folder), None, None, False]
+    if bpy.app.timers.is_registered(_tex_folder_tick):
+        bpy.app.timers.unregister(_tex_folder_tick)
+    # Persistent: folders watched while File > Open/New runs keep their timer;
+    # _on_load_post drops the previous file's folders.
+    bpy.app.timers.register(_tex_folder_tick, first_interval=0.0, persistent=True)
+
+
+def _tex_folder_cached(folder):
+    """Last known slots for folder, or None (and start watching) if never scanned."""
+    entry = _TEX_FOLDERS.get(_tex_folder_key(folder))
+    if entry is None:
+        _tex_folder_watch(folder)
+        return None
+    return entry[2]
+
+
+def _tex_folder_isdir(folder):
+    entry = _TEX_FOLDERS.get(_tex_folder_key(folder))
+    if entry is None or entry[2] is None:
+        return os.path.isdir(folder)
+    return entry[1] is not None
+
+
+def _tex_list_matches(tex_list, slots):
+    if len(slots) != len(tex_list):
+        return False
+    for (d_id, d_fp), item in zip(slots, tex_list):
+        d_fp_norm = os.path.normcase(d_fp) if d_fp else ""
+        i_fp_norm = os.path.normcase(item.filepath) if item.filepath else ""
+        if item.tex_id != d_id or i_fp_norm != d_fp_norm:
+            return False
+    return True
+
+
+def _sync_tex_lists(keys):
+    """Rebuild the TM list of every Naomi collection whose folder is in keys
+    and no longer matches the watcher's slots."""
+    for col in bpy.data.collections:
+        cd = getattr(col, 'naomi_centroidData', None)
+        if not (cd and cd.naomi_assigned):
+            continue
+        tm = col.naomi_tm
+        if not tm.tex_folder:
+            continue
+        key = _tex_folder_key(tm.tex_folder)
+        if key not in keys:
+            continue
+        if not _tex_list_matches(tm.tex_list, _TEX_FOLDERS[key][2]):
+            _rebuild_tex_list(tm, bpy.path.abspath(tm.tex_folder), col=col)
+            if tm.tex_list_index >= len(tm.tex_list):
+                tm.tex_list_index = max(0, len(tm.tex_list) - 1)
+
+
+def _tex_folder_tick():
+    """Timer: rescan watched folders whose directory mtime moved, then sync lists."""
+    changed = set()
+    for key, entry in list(_TEX_FOLDERS.items()):
+        folder, mtime, slots, settled = entry
+        try:
+            cur = os.stat(folder).st_mtime_ns
+        except OSError:
+            cur = None
+        if slots is not None and cur == mtime and settled:
+            continue
+        if _scan_tex_folder(folder) != slots:
+            changed.add(key)
+        entry[3] = slots is not None and entry[1] == mtime
+    if changed:
+        _sync_tex_lists(changed)
+        wm = bpy.context.window_manager
+        for window in (wm.windows if wm else ()):
+            for area in window.screen.areas:
+                if area.type in {'PROPERTIES', 'VIEW_3D'}:
+                    area.tag_redraw()
+    return _TEX_FOLDER_POLL if _TEX_FOLDERS else None
+
+
 def _next_tex_id(folder):
     """Return the next available TexID number (max existing + 1, or 0)."""
     slots = _scan_tex_folder(folder)
@@ -4512,32 +5097,26 @@ def _rebuild_tex_list(tm, folder, col=None):
                 tex_id = int(getattr(p, 'mh_texID', -1))
                 if tex_id >= 0:
                     bump_ids.add(tex_id)
-    _tm_previews_clear()
     tm.tex_list.clear()
     abs_folder = bpy.path.abspath(folder) if folder else folder
+    pvr_index = pypvr.pvr_folder_index(abs_folder) if abs_folder else {}
     for tex_id, filepath in _scan_tex_folder(folder):
         item = tm.tex_list.add()
         item.tex_id = tex_id
         item.filepath = filepath or ""
         item.is_empty = (filepath is None)
         # Auto-read .PVR header for tex_mode / px_mode; fall back to image analysis
-        pvr_info = _read_pvr_header(abs_folder, tex_id) if abs_folder else None
+        pvr_info = _read_pvr_header(abs_folder, tex_id, pvr_index) if abs_folder else None
         if pvr_info:
             item.tex_mode = pvr_info[0]
             item.px_mode  = pvr_info[1]
             item.use_mips = pvr_info[2]
             item.pvr_detected = True
-            # Read dimensions from PVR file directly (bl_pypvr writes them at PVRT+0x0A/C)
-            pvr_path = os.path.join(abs_folder, f"TexID_{tex_id:03d}.PVR")
-            try:
-                with open(pvr_path, 'rb') as _f:
-                    _pvr_data = _f.read(0x20)
-                _w, _h = _pvr_dims_from_bytes(_pvr_data)
-                if _w > 0 and _h > 0:
-                    item.tex_width  = _w
-                    item.tex_height = _h
-            except Exception:
-                pass
+            # Dimensions come from the same index entry (PVRT+0x0C/E)
+            _hdr = pvr_index[f"TexID_{tex_id:03d}"]
+            if _hdr['width'] > 0 and _hdr['height'] > 0:
+                item.tex_width  = _hdr['width']
+                item.tex_height = _hdr['height']
         else:
             # No .PVR — infer best format from image content (PyPVR auto_format logic)
             inferred = _infer_format_from_image(bpy.path.abspath(filepath)) if filepath else None
@@ -4552,8 +5131,21 @@ def _rebuild_tex_list(tm, folder, col=None):
         if tex_id in bump_ids:
             item.px_mode = 'bump'
         if filepath:
-            abs_fp = bpy.path.abspath(filepath)
-            _tm_previews_load(abs_fp)  # load into PreviewCollection now
+            # Revalidated on the preview timer; unchanged thumbnails are kept.
+            _tm_previews_request(bpy.path.abspath(filepath))
+
+
+_TEX_SLOT_FIELDS = ('tex_id', 'filepath', 'is_empty', 'pvr_detected',
+                    'tex_mode', 'px_mode', 'use_mips', 'tex_width', 'tex_height')
+
+
+def _copy_tex_list(src_tm, dst_tm):
+    """Give dst_tm the list already built for the same folder on src_tm."""
+    dst_tm.tex_list.clear()
+    for src in src_tm.tex_list:
+        item = dst_tm.tex_list.add()
+        for name in _TEX_SLOT_FIELDS:
+            setattr(item, name, getattr(src, name))
 
 
 def _refresh_shared_folder_objects(changed_obj, folder):
@@ -4943,6 +5535,7 @@ def _update_pvr_log_from_folder(folder):
     try:
         log_entries  = _pvr_log_read(folder)
         active_stems = set()
+        pvr_index    = pypvr.pvr_folder_index(folder)
 
         for fname in sorted(os.listdir(folder)):
             base, ext = os.path.splitext(fname)
@@ -4968,7 +5561,7 @@ def _update_pvr_log_from_folder(folder):
                 continue
 
             if base not in log_entries:
-                pvr_info = _read_pvr_header(folder, tid)
+                pvr_info = _read_pvr_header(folder, tid, pvr_index)
                 if pvr_info:
                     class _FakeItem:
                         pass
@@ -5005,8 +5598,8 @@ def _pvr_dims_from_bytes(pvr_bytes):
     if offset == -1 or offset + 0x10 > len(pvr_bytes):
         return (0, 0)
     try:
-        w = struct.unpack_from('<H', pvr_bytes, offset + 0x0A)[0]
-        h = struct.unpack_from('<H', pvr_bytes, offset + 0x0C)[0]
+        w = struct.unpack_from('<H', pvr_bytes, offset + 0x0C)[0]
+        h = struct.unpack_from('<H', pvr_bytes, offset + 0x0E)[0]
         return (w, h)
     except struct.error:
         return (0, 0)
@@ -5382,28 +5975,45 @@ class NAOMI_OT_tm_view_images(bpy.types.Operator):
         col = _get_col_for_obj(obj)
         label = col.name if col else obj.name
         self.__class__.bl_label = f"{label} — Image Viewer"
+
+        # Scan once here; draw() only reads these.  Slots without a loaded
+        # image get their thumbnail from the TM preview timer, so the popup
+        # opens at once and fills in as the thumbnails arrive.
+        folder = _get_tex_folder(obj)
+        self._folder = folder
+        self._slots  = [(tid, fp) for tid, fp in _scan_tex_folder(folder) if fp] if folder else []
+        wanted = {os.path.normcase(fp) for _tid, fp in self._slots}
+        self._images = {}
+        for img in bpy.data.images:
+            if img.filepath:
+                key = os.path.normcase(bpy.path.abspath(img.filepath))
+                if key in wanted:
+                    self._images.setdefault(key, img)
+        if _TM_PREVIEWS is not None:
+            for _tid, fp in self._slots:
+                _tm_previews_request(fp)
         return context.window_manager.invoke_popup(self, width=480)
 
+    def _icon_for(self, filepath):
+        img = self._images.get(os.path.normcase(filepath))
+        if img is not None and img.preview is not None:
+            return img.preview.icon_id
+        return _tm_previews_get(filepath) if _TM_PREVIEWS is not None else 0
+
     def draw(self, context):
         layout = self.layout
-        obj = context.active_object
 
         # Draw header title manually (invoke_popup has no built-in header)
         header = layout.row()
         header.label(text=self.__class__.bl_label, icon='IMAGE_DATA')
         layout.separator()
 
-        if not obj:
+        if not hasattr(self, "_slots"):
             return
-
-        folder = _get_tex_folder(obj)
-        if not folder:
+        if not self._folder:
             layout.label(text="No texture folder set.", icon='ERROR')
             return
-
-        slots = [(tid, fp) for tid, fp in _scan_tex_folder(folder) if fp and os.path.exists(fp)]
-
-        if not slots:
+        if not self._slots:
             layout.label(text="No images found in folder.", icon='INFO')
             return
 
@@ -5412,24 +6022,15 @@ class NAOMI_OT_tm_view_images(bpy.types.Operator):
             row_major=True, columns=4,
             even_columns=True, even_rows=True, align=True,
         )
-        for tex_id, filepath in slots:
+        for tex_id, filepath in self._slots:
             cell = grid.box()
-            # Load / find image
-            img = None
-            for bpy_img in bpy.data.images:
-                if os.path.normcase(bpy.path.abspath(bpy_img.filepath)) == os.path.normcase(filepath):
-                    img = bpy_img
-                    break
-            if img is None:
-                try:
-                    img = bpy.data.images.load(filepath, check_existing=True)
-                except Exception:
-                    img = None
-
-            if img:
-                cell.template_icon(icon_value=img.preview_ensure().icon_id, scale=5.0)
-            else:
+            icon_id = self._icon_for(filepath)
+            if icon_id:
+                cell.template_icon(icon_value=icon_id, scale=5.0)
+            elif os.path.normcase(filepath) in _TM_PREVIEW_STAMPS:
                 cell.label(text="(error)", icon='ERROR')
+            else:
+                cell.label(text="Loading…", icon='IMAGE_DATA')
             cell.label(text=f"TexID_{tex_id:03d}")
 
     def execute(self, context):
@@ -5718,11 +6319,24 @@ def _apply_preset_to_op(self, context):
         pass
 
 
+class _ExportWorkerEntry:
+    """Picklable handle to NLexporter.export_snapshot for Export All workers.
+
+    Workers are spawned without bpy, so they cannot import this package.
+    The handle unpickles in the worker as the function of a top-level
+    NLexporter, loaded from the addon folder that the pool initializer put
+    on the worker's sys.path; the main process keeps using NLe only.
+    """
+    def __reduce__(self):
+        import pkgutil
+        return (pkgutil.resolve_name, ("NLexporter:export_snapshot",))
+
+
 # ---------------------------------------------------------------------------
 # Export operator — direct Blender → .bin  (File > Export menu)
 # ---------------------------------------------------------------------------
 
-class ExportNaomiHrb(bpy.types.Operator, ExportHelper):
+class ExportNaomiHrb(bpy.types.Operator, ExportHelper, _ModalBatchOperator):
     """Export the active NaomiLib collection directly to .bin format"""
     bl_idname    = "export_scene.naomi_bin"
     bl_label     = "Export"
@@ -5849,6 +6463,18 @@ class ExportNaomiHrb(bpy.types.Operator, ExportHelper):
                     "in the file browser",
         default=False,
     )
+    opt_strip_cache: bpy.props.BoolProperty(
+        name="Reuse Strips",
+        description="Reuse strip-search results of meshes that are unchanged since "
+                    "the previous export in this session",
+        default=True,
+    )
+    opt_export_workers: bpy.props.IntProperty(
+        name="Workers",
+        description="Export All: number of worker processes used for strip building "
+                    "(0 = one per CPU core, 1 = main thread only)",
+        default=0, min=0, max=64,
+    )
     opt_naomi2: bpy.props.BoolProperty(
         name="Naomi2",
         description="Export in NAOMI2 (NL2) format. "
@@ -5928,6 +6554,9 @@ class ExportNaomiHrb(bpy.types.Operator, ExportHelper):
         row = box.row()
         row.prop(self, "opt_encode_pvrs")
         row.prop(self, "opt_export_all")
+        box.prop(self, "opt_strip_cache")
+        if self.opt_export_all:
+            box.prop(self, "opt_export_workers")
         box.prop(self, "opt_naomi2")
 
     def _resolve_collection(self, context):
@@ -5981,6 +6610,7 @@ class ExportNaomiHrb(bpy.types.Operator, ExportHelper):
         opts.sph_envmap = bool(col_env_map)
 
         opts.remesh = bool(self.opt_remesh)
+        opts.strip_cache = bool(self.opt_strip_cache)
 
         opts.naomi2hg = bool(self.opt_naomi2)
         if opts.naomi2hg:
@@ -6002,16 +6632,15 @@ class ExportNaomiHrb(bpy.types.Operator, ExportHelper):
 
         return opts
 
-    def _export_one_collection(self, context, col, out_path):
-        """Export a single collection to *out_path*.
-        Returns True on success, False on failure (errors reported via self.report)."""
-        import traceback
-
+    def _prepare_collection(self, context, col, out_path):
+        """Validate *col*, encode its PVRs if requested and build its options.
+        Returns (opts, mesh_count, super_index), or None on failure
+        (errors reported via self.report)."""
         mesh_objects = [o for o in col.objects if o.type == 'MESH']
         if not mesh_objects:
             self.report({'WARNING'},
                 f"Collection '{col.name}' has no mesh objects — skipped.")
-            return False
+            return None
 
         # Validate that every mesh has a Naomi preset assigned.
         unassigned = [
@@ -6022,7 +6651,7 @@ class ExportNaomiHrb(bpy.types.Operator, ExportHelper):
             names = ", ".join(unassigned)
             self.report({'ERROR'},
                 f"Assign a Naomi preset to: {names}")
-            return False
+            return None
 
         super_index = (col.gp0.objFormat == '1')
 
@@ -6059,65 +6688,226 @@ class ExportNaomiHrb(bpy.types.Operator, ExportHelper):
                 else:
                     self.report({'INFO'}, summary)
 
-        _NLdirect = NLe
         base_name = os.path.splitext(os.path.basename(out_path))[0]
-        _TOUCH_COUNT_START = 3
-        _TOUCH_COUNT_MAX   = 32
-        try:
-            col_env_map = any(
-                o.type == 'MESH' and
-                getattr(o, 'naomi_param', None) is not None and
-                o.naomi_param.naomi_assigned and
-                o.naomi_param.naomi_flag_env_map
-                for o in col.objects
-            )
-            col.gp1.envMap = col_env_map
-            opts = self._build_opts(col, super_index, base_name,
-                                    col_env_map=col_env_map)
+        col_env_map = any(
+            o.type == 'MESH' and
+            getattr(o, 'naomi_param', None) is not None and
+            o.naomi_param.naomi_assigned and
+            o.naomi_param.naomi_flag_env_map
+            for o in col.objects
+        )
+        col.gp1.envMap = col_env_map
+        opts = self._build_opts(col, super_index, base_name,
+                                col_env_map=col_env_map)
+        return opts, len(mesh_objects), super_index
 
-            touch_limit = _TOUCH_COUNT_START
-            bin_bytes   = None
+    def _report_exported(self, out_path, nbytes, super_index, mesh_count):
+        idx_mode = "Super Index" if super_index else "Beta Index"
+        self.report({'INFO'},
+            f"Exported {nbytes} bytes → {out_path} "
+            f"[{idx_mode}] ({mesh_count} mesh(es))")
 
-            while touch_limit <= _TOUCH_COUNT_MAX:
-                opts.touch_count_max = touch_limit
-                try:
-                    bin_bytes = _NLdirect.convert_collection(col, opts)
-                    if touch_limit > _TOUCH_COUNT_START:
-                        self.report(
-                            {'WARNING'},
-                            f"'{col.name}': touch_count overflow — retried with "
-                            f"touch_count_max={touch_limit}.")
-                    break
-                except _NlcvError as exc:
-                    if exc.code == _NLCV_ERR_CONVERT:
-                        next_limit = 5 if touch_limit == 3 else touch_limit + 1
-                        touch_limit = next_limit
-                        continue
-                    self.report({'ERROR'}, f"Export error ({col.name}): {exc}")
-                    return False
+    def _export_one_collection(self, context, col, out_path):
+        """Export a single collection to *out_path*.
+        Returns True on success, False on failure (errors reported via self.report)."""
+        import traceback
+
+        try:
+            prepared = self._prepare_collection(context, col, out_path)
+            if prepared is None:
+                return False
+            opts, mesh_count, super_index = prepared
+
+            try:
+                nbytes, touch_limit = NLe.convert_to_file(
+                    lambda o, f: NLe.convert_collection(col, o, f),
+                    opts, out_path)
+            except _NlcvError as exc:
+                self.report({'ERROR'}, f"Export error ({col.name}): {exc}")
+                return False
+            except OSError as e:
+                self.report({'ERROR'}, f"Could not write '{out_path}': {e}")
+                return False
 
-            if bin_bytes is None:
+            if nbytes is None:
                 self.report({'ERROR'},
-                    f"'{col.name}': touch_count overflow persists at max={_TOUCH_COUNT_MAX}.")
+                    f"'{col.name}': touch_count overflow persists at max={NLe.TOUCH_COUNT_MAX}.")
                 return False
+            if opts.strip_cache:
+                print(f"[NaomiLib] Strip cache ({col.name}): "
+                      f"{NLe.strip_cache_hits} reused, "
+                      f"{NLe.strip_cache_misses} searched")
+            if touch_limit > NLe.TOUCH_COUNT_START:
+                self.report(
+                    {'WARNING'},
+                    f"'{col.name}': touch_count overflow — retried with "
+                    f"touch_count_max={touch_limit}.")
 
         except Exception as e:
             self.report({'ERROR'}, f"Unexpected error ({col.name}): {e}")
             traceback.print_exc()
             return False
 
+        self._report_exported(out_path, nbytes, super_index, mesh_count)
+        return True
+
+    def _snapshot_collection(self, context, col, out_path):
+        """Export All phase 1 (main thread): snapshot *col* for a worker.
+        Returns a job dict, or None on failure (errors reported via self.report)."""
+        import traceback
+
         try:
-            with open(out_path, 'wb') as f:
-                f.write(bin_bytes)
+            prepared = self._prepare_collection(context, col, out_path)
+            if prepared is None:
+                return None
+            opts, mesh_count, super_index = prepared
+            snapshot = NLe.snapshot_collection(col, opts)
         except Exception as e:
-            self.report({'ERROR'}, f"Could not write '{out_path}': {e}")
-            return False
+            self.report({'ERROR'}, f"Unexpected error ({col.name}): {e}")
+            traceback.print_exc()
+            return None
 
-        idx_mode = "Super Index" if super_index else "Beta Index"
-        self.report({'INFO'},
-            f"Exported {len(bin_bytes)} bytes → {out_path} "
-            f"[{idx_mode}] ({len(mesh_objects)} mesh(es))")
-        return True
+        return {'snapshot': snapshot, 'out_path': out_path,
+                'mesh_count': mesh_count, 'super_index': super_index}
+
+    def _handle_export_result(self, job, result):
+        self._batch_done += 1
+        name = result['name']
+        if result['ok']:
+            self._ok_count += 1
+            print(f"[NaomiLib] Export All [{self._batch_done}/{self._batch_total}] {name}: "
+                  f"{result['nbytes']} bytes")
+            if result['touch_limit'] > NLe.TOUCH_COUNT_START:
+                self.report(
+                    {'WARNING'},
+                    f"'{name}': touch_count overflow — retried with "
+                    f"touch_count_max={result['touch_limit']}.")
+            self._report_exported(job['out_path'], result['nbytes'],
+                                  job['super_index'], job['mesh_count'])
+        else:
+            self._fail_count += 1
+            print(f"[NaomiLib] Export All [{self._batch_done}/{self._batch_total}] {name}: FAILED")
+            self.report({'ERROR'}, result['error'])
+
+    def _pool_failed(self, exc):
+        """Pool could not start or a worker died — finish in-process."""
+        import traceback
+        self.report({'WARNING'},
+            f"Export All: worker processes unavailable ({exc}) — "
+            f"exporting remaining collections on the main thread.")
+        traceback.print_exc()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
+        self._local_jobs.extend(self._futures.values())
+        self._futures = {}
+
+    def _poll_export_futures(self, block):
+        import concurrent.futures
+        if block:
+            concurrent.futures.wait(self._futures,
+                                    return_when=concurrent.futures.FIRST_COMPLETED)
+        for fut in [f for f in self._futures if f.done()]:
+            try:
+                result = fut.result()
+            except Exception as e:
+                self._pool_failed(e)
+                return
+            job = self._futures.pop(fut)
+            self._handle_export_result(job, result)
+            job['snapshot'] = None
+
+    def _start_export_all(self, naomi_cols, out_dir):
+        """Queue every collection for Export All; strip building goes to a
+        process pool when more than one worker is available."""
+        import concurrent.futures
+        import multiprocessing
+        import site
+
+        self._to_snapshot = []
+        for col in naomi_cols:
+            col_name = col.name
+            if col_name.lower().endswith(".bin"):
+                col_path = os.path.join(out_dir, col_name)
+            else:
+                col_path = os.path.join(out_dir, col_name + ".bin")
+            self._to_snapshot.append((col, col_path))
+        self._local_jobs = []
+        self._futures    = {}
+        self._ok_count   = self._fail_count = self._batch_done = 0
+
+        n_workers = self.opt_export_workers or max(1, (os.cpu_count() or 1) - 1)
+        n_workers = min(n_workers, len(naomi_cols))
+        self._pool = None
+        if n_workers > 1:
+            try:
+                self._pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=n_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=site.addsitedir, initargs=(_ADDON_DIR,))
+            except Exception as e:
+                self._pool = None
+                self.report({'WARNING'},
+                    f"Export All: worker processes unavailable ({e}) — "
+                    f"exporting on the main thread.")
+
+    def _batch_tick(self, context, block):
+        """Export All: one unit of work — export a queued snapshot in-process,
+        or snapshot the next collection on the main thread, or collect
+        finished workers."""
+        if self._futures:
+            self._poll_export_futures(block=False)
+
+        if self._local_jobs:
+            job = self._local_jobs.pop(0)
+            self._handle_export_result(
+                job, NLe.export_snapshot(job['snapshot'], job['out_path']))
+        elif self._to_snapshot:
+            col, col_path = self._to_snapshot.pop(0)
+            job = self._snapshot_collection(context, col, col_path)
+            if job is None:
+                self._fail_count += 1
+                self._batch_done += 1
+            elif self._pool is not None:
+                try:
+                    fut = self._pool.submit(_ExportWorkerEntry(),
+                                            job['snapshot'], job['out_path'])
+                except Exception as e:
+                    self._local_jobs.append(job)
+                    self._pool_failed(e)
+                else:
+                    self._futures[fut] = job
+            else:
+                self._local_jobs.append(job)
+        elif self._futures and block:
+            self._poll_export_futures(block=True)
+
+        return not (self._to_snapshot or self._local_jobs or self._futures)
+
+    def _batch_finish(self, context):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+        # Run rebuild script once at the end (if selected)
+        self._run_rebuild_script(context)
+
+        summary = f"Export All: {self._ok_count} exported"
+        if self._fail_count:
+            summary += f", {self._fail_count} failed"
+            self.report({'WARNING'}, summary)
+        else:
+            self.report({'INFO'}, summary)
+        return {'FINISHED'}
+
+    def _batch_cancel(self, context):
+        # Files are replaced atomically (NLe.convert_to_file), so nothing is
+        # left half-written; workers already running finish their file.
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        self.report({'WARNING'},
+            f"Export All cancelled: {self._ok_count} exported, "
+            f"{self._batch_total - self._batch_done} not exported")
 
     def execute(self, context):
         if self.opt_export_all:
@@ -6138,29 +6928,10 @@ class ExportNaomiHrb(bpy.types.Operator, ExportHelper):
                     "No NaomiLib collections found in the scene.")
                 return {'CANCELLED'}
 
-            ok_count = 0
-            fail_count = 0
-            for col in naomi_cols:
-                col_name = col.name
-                if col_name.lower().endswith(".bin"):
-                    col_path = os.path.join(out_dir, col_name)
-                else:
-                    col_path = os.path.join(out_dir, col_name + ".bin")
-                if self._export_one_collection(context, col, col_path):
-                    ok_count += 1
-                else:
-                    fail_count += 1
-
-            # Run rebuild script once at the end (if selected)
-            self._run_rebuild_script(context)
-
-            summary = f"Export All: {ok_count} exported"
-            if fail_count:
-                summary += f", {fail_count} failed"
-                self.report({'WARNING'}, summary)
-            else:
-                self.report({'INFO'}, summary)
-            return {'FINISHED'}
+            # Snapshots are taken on the main thread one collection per tick;
+            # strip building and binary emission run in worker processes.
+            self._start_export_all(naomi_cols, out_dir)
+            return self._batch_run(context, len(naomi_cols), "Exporting")
 
         col = self._resolve_collection(context)
         if col is None:
@@ -6209,36 +6980,29 @@ def menu_func_export(self, context):
 
 
 def _refresh_tex_list(obj):
-    """Rebuild tex_list for obj from its texture folder, skipping if already up-to-date."""
+    """Rebuild tex_list for obj from its texture folder, skipping if already up-to-date.
+    Compares against the folder watcher's cached slots; never lists the folder."""
     if not hasattr(obj, "naomi_param"):
         return
     p = obj.naomi_param
     if not p.naomi_assigned:
         return
+    folder = _get_tex_folder(obj, cached=True)
     # Auto-infer folder if not stored
-    if not p.tex_folder:
-        inferred = _get_tex_folder(obj)
-        if inferred:
-            p.tex_folder = inferred
-    folder = _get_tex_folder(obj)
+    if not p.tex_folder and folder:
+        p.tex_folder = folder
     if not folder:
         return
 
-    disk_slots = _scan_tex_folder(folder)
+    disk_slots = _tex_folder_cached(folder)
+    if disk_slots is None:
+        return  # first sighting — the watcher scans it and syncs the list
 
     col = _get_col_for_obj(obj)
     canonical_list = col.naomi_tm.tex_list if col is not None else p.tex_list
 
-    if len(disk_slots) == len(canonical_list):
-        match = True
-        for (d_id, d_fp), item in zip(disk_slots, canonical_list):
-            d_fp_norm = os.path.normcase(d_fp) if d_fp else ""
-            i_fp_norm = os.path.normcase(item.filepath) if item.filepath else ""
-            if item.tex_id != d_id or i_fp_norm != d_fp_norm:
-                match = False
-                break
-        if match:
-            return
+    if _tex_list_matches(canonical_list, disk_slots):
+        return
 
     if col is not None:
         _rebuild_tex_list(col.naomi_tm, folder, col=col)
@@ -6250,9 +7014,20 @@ def _refresh_tex_list(obj):
         p.tex_list_index = max(0, len(p.tex_list) - 1)
 
 
+@bpy.app.handlers.persistent
+def _on_load_post(*_args):
+    """File > Open / New: stop watching the previous file's texture folders and
+    drop queued material rebuilds (their non-persistent timer went with the
+    old file, and the names could match objects in the new one)."""
+    _TEX_FOLDERS.clear()
+    _MAT_REBUILD_QUEUE.clear()
+
+
 @bpy.app.handlers.persistent
 def _on_depsgraph_update(scene, depsgraph):
-    """Refresh texture list and sync TM selection when the active object changes."""
+    """Refresh texture list and sync TM selection when the active object changes.
+    Folder contents come from the watcher (_tex_folder_tick), so this does
+    no directory I/O."""
     if _material_rebuild_in_progress:
         return
     ctx = bpy.context
@@ -6278,12 +7053,11 @@ def _on_depsgraph_update(scene, depsgraph):
                         break
 
     # Rebuild collection tex_list if folder is set but list is still empty (post-import).
-    col = _get_col_for_obj(obj)
     if col is not None:
         tm = col.naomi_tm
         if tm.tex_folder and len(tm.tex_list) == 0:
             folder = bpy.path.abspath(tm.tex_folder)
-            if folder and os.path.isdir(folder):
+            if _tex_folder_cached(folder):
                 _rebuild_tex_list(tm, folder, col=col)
                 if tm.tex_list_index >= len(tm.tex_list):
                     tm.tex_list_index = max(0, len(tm.tex_list) - 1)
@@ -6296,24 +7070,90 @@ _naomi_tm_has_scroll = False
 
 # PreviewCollection owned by this addon; keys are normcase(abspath).
 _TM_PREVIEWS = None  # initialised in register()
+# key -> (mtime_ns, size) of the file each thumbnail was made from, in LRU order
+# (oldest first).  Entries past _TM_PREVIEW_MAX are evicted.
+_TM_PREVIEW_STAMPS = OrderedDict()
+_TM_PREVIEW_MAX    = 512
+# Paths waiting for the preview timer, keyed like _TM_PREVIEWS.
+_TM_PREVIEW_QUEUE  = OrderedDict()
+_TM_PREVIEW_BATCH  = 8       # thumbnails (re)loaded per timer tick
+_TM_PREVIEW_TICK   = 0.05    # seconds between ticks
+
+
+def _tm_file_stamp(abs_fp):
+    try:
+        st = os.stat(abs_fp)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _tm_previews_drop(key):
+    _TM_PREVIEW_STAMPS.pop(key, None)
+    if key in _TM_PREVIEWS:
+        del _TM_PREVIEWS[key]
 
 
 def _tm_previews_load(abs_fp):
-    """Load abs_fp into _TM_PREVIEWS if not already present. Returns icon_id."""
+    """Load abs_fp into _TM_PREVIEWS, reloading it if the file changed on disk. Returns icon_id."""
     key = os.path.normcase(abs_fp)
-    if key in _TM_PREVIEWS:
-        return _TM_PREVIEWS[key].icon_id
-    if os.path.exists(abs_fp):
+    stamp = _tm_file_stamp(abs_fp)
+    if key in _TM_PREVIEW_STAMPS and _TM_PREVIEW_STAMPS[key] == stamp:
+        _TM_PREVIEW_STAMPS.move_to_end(key)
+        return _TM_PREVIEWS[key].icon_id if key in _TM_PREVIEWS else 0
+    _tm_previews_drop(key)
+    icon_id = 0
+    if stamp is not None:
         try:
-            thumb = _TM_PREVIEWS.load(key, abs_fp, 'IMAGE')
-            return thumb.icon_id
+            icon_id = _TM_PREVIEWS.load(key, abs_fp, 'IMAGE', force_reload=True).icon_id
         except Exception:
             pass
-    return 0
+    # Failures are stamped too, so draw() does not re-queue them every redraw.
+    _TM_PREVIEW_STAMPS[key] = stamp
+    while len(_TM_PREVIEW_STAMPS) > _TM_PREVIEW_MAX:
+        _tm_previews_drop(next(iter(_TM_PREVIEW_STAMPS)))
+    return icon_id
+
+
+def _tm_previews_get(abs_fp):
+    """icon_id of abs_fp's thumbnail if cached, else queue it and return 0.
+    Safe to call from draw(): never touches the disk."""
+    key = os.path.normcase(abs_fp)
+    if key in _TM_PREVIEW_STAMPS:
+        _TM_PREVIEW_STAMPS.move_to_end(key)
+    elif key not in _TM_PREVIEW_QUEUE:
+        _tm_previews_request(abs_fp)
+    return _TM_PREVIEWS[key].icon_id if key in _TM_PREVIEWS else 0
+
+
+def _tm_previews_request(abs_fp):
+    """Queue abs_fp for (re)validation by the preview timer."""
+    _TM_PREVIEW_QUEUE[os.path.normcase(abs_fp)] = abs_fp
+    if not bpy.app.timers.is_registered(_tm_previews_tick):
+        # Persistent: queued keys survive a file load and are never re-requested
+        bpy.app.timers.register(_tm_previews_tick, first_interval=0.0, persistent=True)
+
+
+def _tm_previews_tick():
+    """Timer: check/load up to _TM_PREVIEW_BATCH queued thumbnails, then redraw."""
+    if _TM_PREVIEWS is None:
+        _TM_PREVIEW_QUEUE.clear()
+        return None
+    for _ in range(min(_TM_PREVIEW_BATCH, len(_TM_PREVIEW_QUEUE))):
+        _key, abs_fp = _TM_PREVIEW_QUEUE.popitem(last=False)
+        _tm_previews_load(abs_fp)
+    wm = bpy.context.window_manager
+    for window in (wm.windows if wm else ()):
+        for area in window.screen.areas:
+            if area.type in {'PROPERTIES', 'VIEW_3D'}:
+                area.tag_redraw()
+    return _TM_PREVIEW_TICK if _TM_PREVIEW_QUEUE else None
 
 
 def _tm_previews_clear():
-    """Remove all entries — called only by _rebuild_tex_list."""
+    """Drop every thumbnail — used on unregister; rebuilds revalidate instead."""
+    _TM_PREVIEW_QUEUE.clear()
+    _TM_PREVIEW_STAMPS.clear()
     _TM_PREVIEWS.clear()
 
 
@@ -6339,15 +7179,27 @@ def register():
     bpy.types.Collection.naomi_tm           = bpy.props.PointerProperty(type=Naomi_Collection_TM)
 
     bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    bpy.app.handlers.load_post.append(_on_load_post)
 
 
 def unregister():
     global _TM_PREVIEWS
+    if bpy.app.timers.is_registered(_tm_previews_tick):
+        bpy.app.timers.unregister(_tm_previews_tick)
+    if bpy.app.timers.is_registered(_mat_rebuild_tick):
+        bpy.app.timers.unregister(_mat_rebuild_tick)
+    _MAT_REBUILD_QUEUE.clear()
+    if bpy.app.timers.is_registered(_tex_folder_tick):
+        bpy.app.timers.unregister(_tex_folder_tick)
+    _TEX_FOLDERS.clear()
     if _TM_PREVIEWS is not None:
+        _tm_previews_clear()
         _previews_mod.remove(_TM_PREVIEWS)
         _TM_PREVIEWS = None
     if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
 
     bpy.utils.unregister_class(ImportNL)
     bpy.utils.unregister_class(ExportNaomiHrb)
@@ -28,6 +28,8 @@ import io
 import struct
 import numpy as np
 import zlib
+import json
+import hashlib
 
 class decode:
 
@@ -39,6 +41,7 @@ class decode:
         self.log = False  # Default value for log flag
         self.silent = False  # Default value for silent flag
         self.debug = False  # Default value for debug flag
+        self.png_level = self.PNG_LEVEL
 
         if len(files_lst)==0 or files_lst == '':
             print('No file specified!')
@@ -67,6 +70,8 @@ class decode:
                     self.debug = True
                 elif arg == '-silent':
                     self.silent = True
+                elif arg.startswith('-z') and arg[2:].isdigit():
+                    self.png_level = min(9, int(arg[2:]))
 
 
         self.px_modes = {
@@ -116,11 +121,11 @@ class decode:
         current_file = 0
 
         # create Extracted\ACT folders
-        if self.debug: print(os.path.join(out_dir, 'ACT'))
+        if self.debug: print(os.path.join(self.out_dir, 'ACT'))
 
         # create log file
         if self.log:
-            with open(f'{out_dir}/pvr_log.txt', 'w') as l:
+            with open(os.path.join(self.out_dir, 'pvr_log.txt'), 'w') as l:
                 l.write('')
 
         while current_file < selected_files:
@@ -234,6 +239,38 @@ class decode:
 
             return r0, g0, b0, r1, g1, b1
 
+    def read_col_array(self, px_format, color):
+        """Vectorised read_col for single-colour formats: an array of raw
+        texel values -> (N, 4) uint8 RGBA.  Returns None for YUV422 and any
+        format read_col does not decode."""
+        c = np.asarray(color, dtype=np.int64)
+
+        def scale(v, m):  # int(v * 0xff / m), as read_col
+            return (v * 0xff / m).astype(np.int64)
+
+        if px_format in (0, 5):  # ARGB1555 / RGB555
+            a = ((c >> 15) & 0x1) * 0xff if px_format == 0 else np.full_like(c, 0xff)
+            r = scale((c >> 10) & 0x1f, 0x1f)
+            g = scale((c >> 5) & 0x1f, 0x1f)
+            b = scale(c & 0x1f, 0x1f)
+        elif px_format in (1, 4):  # RGB565, and BUMP on the VQ path
+            a = np.full_like(c, 0xff)
+            r = scale((c >> 11) & 0x1f, 0x1f)
+            g = scale((c >> 5) & 0x3f, 0x3f)
+            b = scale(c & 0x1f, 0x1f)
+        elif px_format == 2:  # ARGB4444
+            a = ((c >> 12) & 0xf) * 0x11
+            r = ((c >> 8) & 0xf) * 0x11
+            g = ((c >> 4) & 0xf) * 0x11
+            b = (c & 0xf) * 0x11
+        elif px_format == 7:  # ARGB8888
+            a, r, g, b = (c >> 24) & 0xFF, (c >> 16) & 0xFF, (c >> 8) & 0xFF, c & 0xFF
+        elif px_format == 14:  # RGBA8888
+            r, g, b, a = (c >> 24) & 0xFF, (c >> 16) & 0xFF, (c >> 8) & 0xFF, c & 0xFF
+        else:
+            return None
+        return np.stack([r, g, b, a], axis=-1).astype(np.uint8)
+
     def read_pal(self,mode, color, act_buffer):
 
         if mode == 4444:
@@ -303,6 +340,14 @@ class decode:
         else:
             pixels_len = 1
 
+        if isinstance(data, np.ndarray):
+            img = data.reshape(h, w, -1)
+            if self.flip and 'v' in self.flip:
+                img = img[::-1]
+            if self.flip and 'h' in self.flip:
+                img = img[:, ::-1]
+            return np.ascontiguousarray(img).reshape(-1, img.shape[2])
+
         if self.flip and'v' in self.flip:
             data = (np.flipud((np.array(data)).reshape(h, w, -1)).flatten()).reshape(-1, pixels_len).tolist()
 
@@ -311,6 +356,9 @@ class decode:
 
         return data
 
+    def out_path(self, file_name, ext):
+        return os.path.join(self.out_dir, f"{file_name[:-4]}.{ext}")
+
     def save_image(self,file_name,data,bits,w,h,cmode,palette):
 
         if not os.path.exists(self.out_dir):
@@ -323,32 +371,55 @@ class decode:
         elif self.fmt == 'tga':
             self.save_tga(file_name,data,bits,w,h,cmode,palette )
 
-        if not self.silent:print(fr"{self.out_dir}\{file_name[:-4]}.{self.fmt}")
+        if not self.silent:print(self.out_path(file_name, self.fmt))
+
+    @staticmethod
+    def image_rows(data, bits, w, h, cmode):
+        """
+        Pixel data as a contiguous (h, row_bytes) uint8 array, top row first.
+
+        data is either an (N, C) / (h, w, C) uint8 array or the list forms
+        decode_pvr builds: RGB(A) tuples, or for PAL modes a one-element list
+        holding the packed index bytes (two 4-bit indices per byte for PAL16).
+        """
+        if 'PAL' in cmode:
+            if isinstance(data, np.ndarray):
+                idx = data
+            else:
+                idx = np.frombuffer(bytes(bytearray(v for sub in data for v in sub)), dtype=np.uint8)
+            row_bytes = w // 2 if cmode == 'RGB-PAL16' else w
+            return np.ascontiguousarray(idx, dtype=np.uint8).reshape(h, row_bytes)
+
+        nch = 3 if cmode == 'RGB' else 4
+        arr = np.asarray(data, dtype=np.uint8)
+        return np.ascontiguousarray(arr).reshape(h, w * nch)
 
-    # Incomplete! Not supporting palettized images!
     def save_tga(self, file_name,data,bits,w,h,cmode,palette=None):
         # Define TGA header
         tga_header = bytearray([0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, w & 255, (w >> 8) & 255,
                                 h & 255, (h >> 8) & 255, 32, 0])
 
-        # TGA is not reversed by default
-        pixel_data = bytearray()
-
-        # Iterate over the flattened array and append the pixel data
-        for pixel in data:
-            # Assuming pixel is in BGRA format
-            pixel_data.extend([pixel[2], pixel[1], pixel[0], pixel[3]])
-
-        # Combine the header and pixel data
-        tga_data = tga_header + pixel_data
-
-        # Save the TGA file
-        with open(fr'{self.out_dir}\{file_name[:-4]}.tga', "wb") as tga_file:
-            tga_file.write(tga_data)
+        # TGA is not reversed by default; pixels are stored BGRA.
+        # Palettised images are expanded through their palette.
+        rows = self.image_rows(data, bits, w, h, cmode)
+        if 'PAL' in cmode:
+            if cmode == 'RGB-PAL16':
+                rows = np.stack([rows >> 4, rows & 0x0F], axis=-1).reshape(h, w)
+            pal = np.zeros((256, 3), dtype=np.uint8)
+            pal[:len(palette)] = np.asarray([c[:3] for c in palette], dtype=np.uint8)[:256]
+            rgb = pal[rows]
+        else:
+            rgb = rows.reshape(h, w, -1)
+        bgra = np.full((h, w, 4), 0xFF, dtype=np.uint8)
+        bgra[..., :3] = rgb[..., 2::-1]
+        if rgb.shape[2] == 4:
+            bgra[..., 3] = rgb[..., 3]
 
+        with open(self.out_path(file_name, 'tga'), "wb") as tga_file:
+            tga_file.write(tga_header)
+            tga_file.write(bgra.tobytes())
 
     def save_bmp(self, file_name, data, bits, w, h, cmode, palette=None):
-        pixel_data = bytearray()
 
         # Define DIB header
         if cmode == 'RGB':
@@ -360,183 +431,101 @@ class decode:
 
         if 'PAL' in cmode:
             # Build palette table: BMP stores colours as BGRA
-            palette_data = bytearray()
-            for color in palette:
-                palette_data.extend([color[2], color[1], color[0], 0])
+            pal = np.zeros((len(palette), 4), dtype=np.uint8)
+            if len(palette):
+                pal[:, :3] = np.asarray([c[:3] for c in palette], dtype=np.uint8)[:, ::-1]
+            palette_data = pal.tobytes()
             n_colors = len(palette)
         else:
             palette_data = bytes()
-            palette     = bytes(0)
             n_colors    = 0
 
+        # Bmp default order is left-right, bottom-top, rows padded to 4 bytes
+        rows = self.image_rows(data, bits, w, h, cmode)
+        if 'PAL' not in cmode:
+            nch = 3 if cmode == 'RGB' else 4
+            px = rows.reshape(h, w, nch)
+            rows = np.concatenate([px[..., 2::-1], px[..., 3:]], axis=2).reshape(h, -1)
+        rows = rows[::-1]
+        pad = (-rows.shape[1]) % 4
+        if pad:
+            rows = np.pad(rows, ((0, 0), (0, pad)))
+        pixel_data = np.ascontiguousarray(rows).tobytes()
+
         # Pixel data starts after the 14-byte file header + 40-byte DIB header + palette
         pix_off = 14 + 40 + len(palette_data)
+        total_size = pix_off + len(pixel_data)
+
+        dib_header = struct.pack('<IiiHHIIiiII',
+                                 40,                 # DIB header size
+                                 w, h,               # Image width / height
+                                 1,                  # Color planes
+                                 bpp_var,            # Bits per pixel
+                                 0,                  # Compression method (0 for uncompressed)
+                                 0,                  # Image size (0 for uncompressed)
+                                 0, 0,               # Resolution (pixels per meter)
+                                 n_colors & 0xFFFF,  # Number of colors in the palette
+                                 0)                  # Number of important colors
+
+        # File header: 'BM' + file size + reserved + pixel data offset
+        file_header = b'BM' + struct.pack('<IiI', total_size, 0, pix_off)
+
+        with open(self.out_path(file_name, 'bmp'), "wb") as bmp_file:
+            bmp_file.write(file_header + dib_header + palette_data)
+            bmp_file.write(pixel_data)
+
+    PNG_LEVEL     = 1          # zlib level; override per instance with -z<0-9>
+    PNG_IDAT_SIZE = 1 << 18    # flush an IDAT chunk once this much is compressed
+    PNG_ROW_BLOCK = 1 << 20    # uncompressed bytes fed to zlib at a time
 
-        dib_header = bytearray([40, 0, 0, 0,  # DIB header size
-                                w & 255, (w >> 8) & 255, (w >> 16) & 255, (w >> 24) & 255,  # Image width
-                                h & 255, (h >> 8) & 255, (h >> 16) & 255, (h >> 24) & 255,  # Image height
-                                1, 0,  # Color planes
-                                bpp_var, 0,  # Bits per pixel
-                                0, 0, 0, 0,  # Compression method (0 for uncompressed)
-                                0, 0, 0, 0,  # Image size (0 for uncompressed)
-                                0, 0, 0, 0,  # Horizontal resolution (pixels per meter)
-                                0, 0, 0, 0,  # Vertical resolution (pixels per meter)
-                                n_colors & 255, (n_colors >> 8) & 255, 0, 0,  # Number of colors in the palette
-                                0, 0, 0, 0])  # Number of important colors
-
-        # File header: 'BM' + file size (filled after pixel_data is known) + reserved + pix_off
-        file_header = bytearray([66, 77,                                                    # 'BM'
-                                 0, 0, 0, 0,                                                # file size (filled below)
-                                 0, 0, 0, 0,                                                # reserved
-                                 pix_off & 255, (pix_off >> 8) & 255,
-                                 (pix_off >> 16) & 255, (pix_off >> 24) & 255])             # pixel data offset
-
-        # Combine headers and palette (pixel_data assembled below)
-        header = file_header + dib_header + palette_data
-
-        if 'PAL' in cmode:
-            data = [item for sublist in data for item in sublist]
-            # Calculate the length of each index sublist
-
-            if cmode == 'RGB-PAL16':
-                sublist_length = w//2
-            else:
-                sublist_length = w  #'RGB-PAL256'
-
-            sublists = [data[i:i + sublist_length] for i in range(0, len(data), sublist_length)]
-            reversed_sublists = sublists[::-1]
-            pixel_data = bytes([item for sublist in reversed_sublists for item in sublist])
-
-        else:
-            # Bmp default order is left-right, bottom-top
-            for y in range(h - 1, -1, -1):
-                for x in range(w):
-                    # Assuming pixel is in BGRA format
-                    pixel = data[y * w + x]
-                    if cmode == 'RGBA':
-                        pixel_data.extend([pixel[2], pixel[1], pixel[0], pixel[3]])
-                    elif cmode == 'RGB':
-                        pixel_data.extend([pixel[2], pixel[1], pixel[0]])
-
-        # Combine the header, palette (if any), and pixel data
-        bmp_data = header + pixel_data
-
-        # Patch the file size field (bytes 2-5) now that total size is known
-        total_size = len(bmp_data)
-        bmp_data[2] = total_size & 0xFF
-        bmp_data[3] = (total_size >> 8) & 0xFF
-        bmp_data[4] = (total_size >> 16) & 0xFF
-        bmp_data[5] = (total_size >> 24) & 0xFF
-
-        # Save the BMP file
-        with open(fr'{self.out_dir}\{file_name[:-4]}.bmp', "wb") as bmp_file:
-            bmp_file.write(bmp_data)
-
+    @staticmethod
+    def _png_chunk(out, tag, payload):
+        crc = zlib.crc32(payload, zlib.crc32(tag))
+        out.write(struct.pack('!I', len(payload)) + tag)
+        out.write(payload)
+        out.write(struct.pack('!I', crc))
 
     def save_png(self, file_name,data, bits, w, h, cmode, palette):
 
-        Pixel = None
-        #print(cmode)
-
-        if cmode == 'RGB':
-            Pixel = tuple[int, int, int]
-
-        elif cmode == 'RGBA':
-            Pixel = tuple[int, int, int, int]
-
-
-        image_data = list[list[Pixel]]
-
-        def encode_data(image_data: list[list[Pixel]]) -> list[int]:
-            ret = []
-
-            for row in image_data:
-                ret.extend([0] + [pixel for color in row for pixel in color])
-
-            return ret
-
-        def calculate_checksum(chunk_type: bytes, data: bytes) -> int:
-            checksum = zlib.crc32(chunk_type)
-            checksum = zlib.crc32(data, checksum)
-            return checksum
-
-        def palette_to_bytearray(palette):
-            # Ensure each RGB tuple has three components
-            palette = [tuple(rgb[:3]) for rgb in palette]
-
-            # Flatten the RGB tuples and pack them into a bytearray
-            byte_array = bytearray()
-            for rgb in palette:
-                byte_array.extend(struct.pack('BBB', *rgb))
-            return byte_array
-
-        color_type = 2  # truecolor by default
-
         if cmode == 'RGB':
             color_type = 2  # truecolor
         elif cmode == 'RGBA':
             color_type = 6  # truecolor with alpha
         elif 'PAL' in cmode:
             color_type = 3  # indexed color
-
-            # Convert palette to a bytearray
-            bytearray_palette = palette_to_bytearray(palette)
-
-        if 'PAL' in cmode:
-            # Create indexes
-            indexes = [item for sublist in data for item in sublist]
-            image_bytes = bytearray([0] + indexes)  # Filter type 0 for the first scanline
-
-            png_array = []
-
-            if cmode == 'RGB-PAL16':
-                row_lenght = (w // 2)
-            else:
-                row_lenght = (w)
-
-            for y in range(h):
-                png_array.append(0)  # Filter type 0 for each scanline
-                for x in range(row_lenght):
-                    png_array.append(x + y * row_lenght + 1)
-
-            # Rearrange indexes based on png_array order
-            image_data = bytearray([image_bytes[i] for i in png_array])
-
         else:
-            # Arrange image data into rows
-            image_data= bytearray(encode_data([data[i:i + w] for i in range(0, len(data), w)]))
+            color_type = 2  # truecolor by default
 
+        # Filter type 0 for every scanline, prepended in one go
+        rows = self.image_rows(data, bits, w, h, cmode)
+        scanlines = np.pad(rows, ((0, 0), (1, 0)))
+        block = max(1, self.PNG_ROW_BLOCK // max(1, scanlines.shape[1]))
 
-        # Compress image data using zlib with compression level 0
-        compressed_data = zlib.compress(image_data,level=1)
+        level = getattr(self, 'png_level', self.PNG_LEVEL)
+        comp = zlib.compressobj(level)
 
-        # Write PNG signature
-        signature = b'\x89PNG\r\n\x1a\n'
+        with open(self.out_path(file_name, 'png'), "wb") as out:
+            # Write PNG signature
+            out.write(b'\x89PNG\r\n\x1a\n')
 
-        with open(fr'{self.out_dir}\{file_name[:-4]}.png', "wb") as out:
-            out.write(signature)
-
-            # Write IHDR chunk
-            ihdr_chunk = struct.pack('!I', w) + struct.pack('!I', h) + bytes([bits, color_type, 0, 0, 0])
-            checksum = calculate_checksum(b'IHDR', ihdr_chunk)
-            out.write(struct.pack('!I', len(ihdr_chunk)) + b'IHDR' + ihdr_chunk + struct.pack('!I', checksum))
+            ihdr = struct.pack('!II', w, h) + bytes([bits, color_type, 0, 0, 0])
+            self._png_chunk(out, b'IHDR', ihdr)
 
             if 'PAL' in cmode:
-                # Write PLTE chunk
-                checksum = calculate_checksum(b'PLTE', bytearray_palette)
-                out.write(
-                    struct.pack('!I', len(bytearray_palette)) + b'PLTE' + bytearray_palette + struct.pack('!I',
-                                                                                                          checksum))
-
-            # Write IDAT chunk (compressed image data)
-            checksum = calculate_checksum(b'IDAT', compressed_data)
-            # print(struct.pack('!I', len(compressed_data)))
-            out.write(
-                struct.pack('!I', len(compressed_data)) + b'IDAT' + compressed_data + struct.pack('!I', checksum))
-
-            # Write IEND chunk
-            checksum = calculate_checksum(b'IEND', b'')
-            out.write(struct.pack('!I', 0) + b'IEND' + struct.pack('!I', checksum))
+                plte = bytes(bytearray(v for rgb in palette for v in tuple(rgb[:3])))
+                self._png_chunk(out, b'PLTE', plte)
+
+            # Stream IDAT chunks as the compressor produces output
+            pending = bytearray()
+            for y in range(0, h, block):
+                pending += comp.compress(scanlines[y:y + block].tobytes())
+                if len(pending) >= self.PNG_IDAT_SIZE:
+                    self._png_chunk(out, b'IDAT', bytes(pending))
+                    pending.clear()
+            pending += comp.flush()
+            self._png_chunk(out, b'IDAT', bytes(pending))
+
+            self._png_chunk(out, b'IEND', b'')
 
     def write_act(self,act_buffer, file_name):
         #print(act_buffer)
@@ -659,55 +648,29 @@ class decode:
             if tex_format in [7, 8]:  # 8bpp
                 palette_entries = 256
                 bits = 8
-                pixels = list(f.read(w * h))
-                data = [pixels[i] for i in arr]
+                pixels = np.frombuffer(f.read(w * h), dtype=np.uint8)
+                data = pixels[np.asarray(arr, dtype=np.int64)]
 
                 if self.flip != '':
-                    data = self.image_flip(data, w, h, cmode)
-                    # Flatten the nested list and convert each value to an integer
-                    data = [int(value) for sublist in data for value in sublist]
+                    data = self.image_flip(data, w, h, cmode).ravel()
 
                 # 4bpp, convert to 8bpp
             else:
                 palette_entries = 16
                 bits = 4
-                pixels = bytearray(f.read(w * h // 2))  # read only required amount of bytes
-
-                # Read 4bpp to 8bpp indexes
-                data = []
-                for i in range(len(pixels)):
-                    data.append(((pixels[i]) & 0x0f) * 0x11)  # last 4 bits
-                    data.append((((pixels[i]) & 0xf0) >> 4) * 0x11)  # first 4 bits
-
-                # Assuming 'data' contains the 8bpp indexes
-                new_pixels = bytearray(data)
+                pixels = np.frombuffer(f.read(w * h // 2), dtype=np.uint8)  # read only required amount of bytes
 
-                # Detwiddle 8bpp indexes
-                data = []
-                for num in arr:
-                    data.append(new_pixels[num])
+                # Read 4bpp to 8bpp indexes (low nibble is the first pixel)
+                # and detwiddle them
+                indexes = np.stack([pixels & 0x0f, pixels >> 4], axis=-1).ravel()
+                data = indexes[np.asarray(arr, dtype=np.int64)]
 
                 if self.flip != '':
-                    data = self.image_flip(data, w, h, cmode)
-
-                    # Flatten the nested list and convert each value to an integer
-                    data = [int(value) for sublist in data for value in sublist]
-
-                data = bytearray(data)  # 8bpp "twiddled data" back into "pixels" variable
-                # Convert back to 4bpp indexes with swapped upper and lower bits
-
-                converted_data = bytearray()
-                for i in range(0, len(data), 2):
-
-                    # Swap the position of upper and lower bits
-                    index1 = (data[i] // 0x11) << 4 | (data[i + 1] // 0x11)
-
-                    # Append the modified index to the converted data
-                    converted_data.append(index1)
-
-                data = converted_data
+                    data = self.image_flip(data, w, h, cmode).ravel()
 
-            data = [data]
+                # Back to packed 4bpp with the first pixel in the high nibble,
+                # as PNG and BMP store it
+                data = (data[0::2] << 4) | data[1::2]
 
             if palette_entries == 16:
                 if apply_palette == True:
@@ -754,36 +717,26 @@ class decode:
 
             # print(codebook_size)
 
-            codebook = []
+            # Codebook: 4 texels of 16 bits per entry, stored in column order
+            # (TL, BL, TR, BR).  Decoded to one tuple per texel.
+            words = np.frombuffer(f.read(codebook_size * 8), dtype='<u2')
+            if words.size < codebook_size * 4:
+                words = np.pad(words, (0, codebook_size * 4 - words.size))
 
             if px_format not in [3]:
                 cmode = 'RGBA'
-                for l in range(codebook_size):
-                    block = []
-                    for i in range(4):
-                        pixel = (int.from_bytes(f.read(2), 'little'))
-                        pix_col = self.read_col(px_format, pixel)
-                        block.append(pix_col)
-
-                    codebook.append(block)
+                texels = self.read_col_array(px_format, words)
+                if texels is None:
+                    texels = [self.read_col(px_format, pix) for pix in words.tolist()]
 
             # YUV422
-
             else:
                 cmode = 'RGB'
-                yuv_codebook = []
-                for l in range(codebook_size):
-                    block = []
-                    for i in range(4):
-                        pixel = (int.from_bytes(f.read(2), 'little'))
-                        block.append(pixel)
-
-                    r0, g0, b0, r1, g1, b1 = self.read_col(px_format, (block[0], block[3]))
-                    r2, g2, b2, r3, g3, b3 = self.read_col(px_format, (block[1], block[2]))
-
-                    yuv_codebook.append([(r0, g0, b0), (r2, g2, b2), (r3, g3, b3), (r1, g1, b1)])
-
-                codebook = yuv_codebook
+                # Words (0, 3) and (1, 2) are the YUV pairs; the decoded order
+                # 0, 3, 1, 2 is put back in column order.
+                pairs = words.reshape(-1, 4)[:, [0, 3, 1, 2]]
+                rgb = self.yuv422_array(pairs.ravel())
+                texels = rgb.reshape(-1, 4, 3)[:, [0, 2, 3, 1]].reshape(-1, 3)
 
             # VQ Mips!
             if tex_format in [4, 17]:
@@ -804,33 +757,24 @@ class decode:
                 f.seek(f.tell() + mip_sum)
                 # print(hex(f.tell()))
 
-            # Read pixel_index:
-            pixel_list = []
+            # Read pixel indices — each index covers a 2×2 block
             bytes_to_read = int((w * h) / 4)
+            pixel_list = np.frombuffer(f.read(bytes_to_read), dtype=np.uint8)
+            if pixel_list.size < bytes_to_read:
+                pixel_list = np.pad(pixel_list, (0, bytes_to_read - pixel_list.size))
 
-            # Each index stores 4 pixels
-            for i in range(bytes_to_read):
-                pixel_index = (int.from_bytes(f.read(1), 'little'))
-                pixel_list.append(int(pixel_index))
-
-            # Detwiddle image data indices, put them into arr list
+            # Detwiddle the index plane, then expand every index to its 2×2
+            # block: entry k covers (dy, dx) = (k & 1, k >> 1).
             arr = self.detwiddle(int(w / 2), int(h / 2))
-
-            # Create an empty 2D array to store pixel data
-            image_array = [[(0, 0, 0, 0) for _ in range(w)] for _ in range(h)]
-
-            # Iterate over the blocks and update the pixel values in the array
-            i = 0
-            for y in range(h//2):
-                for x in range(w//2):
-                    image_array[y * 2][x * 2] = codebook[pixel_list[arr[i]]][0]
-                    image_array[y * 2 + 1][x * 2] = codebook[pixel_list[arr[i]]][1]
-                    image_array[y * 2][x * 2 + 1] = codebook[pixel_list[arr[i]]][2]
-                    image_array[y * 2 + 1][x * 2 + 1] = codebook[pixel_list[arr[i]]][3]
-                    i += 1
-
-            # Flatten the 2D array to a 1D list for putdata
-            data = [pixel for row in image_array for pixel in row]
+            index = pixel_list[np.asarray(arr, dtype=np.int64)].reshape(h // 2, w // 2)
+            block = np.array([[0, 2], [1, 3]], dtype=np.int64)      # [dy][dx] -> k
+            texel = index.astype(np.int64)[:, None, :, None] * 4 + block[None, :, None, :]
+            if texel.size and int(texel.max()) >= len(texels):
+                raise IndexError("VQ index outside codebook")
+            if isinstance(texels, np.ndarray):
+                data = np.take(texels, texel.reshape(h * w), axis=0)    # (h*w, C)
+            else:
+                data = list(map(texels.__getitem__, texel.reshape(h * w).tolist()))
             if self.flip != '':
                 data = self.image_flip(data, w, h, cmode)
 
@@ -840,8 +784,10 @@ class decode:
 
         # BMP ABGR8888
         elif tex_format in [14, 15]:
-            pixels = [int.from_bytes(f.read(4), 'little') for _ in range(w * h)]
-            data = [(self.read_col(14, p)) for p in pixels]
+            pixels = np.frombuffer(f.read(w * h * 4), dtype='<u4')
+            if pixels.size < w * h:
+                pixels = np.pad(pixels, (0, w * h - pixels.size))
+            data = self.read_col_array(14, pixels)
 
             palette = ''
             cmode = 'RGBA'
@@ -869,8 +815,10 @@ class decode:
         elif px_format == 4:
             HALFPI   = math.pi / 2.0
             DOUBLEPI = math.pi * 2.0
-            pixels = [int.from_bytes(f.read(2), 'little') for _ in range(w * h)]
-            raw = np.array([pixels[i] for i in arr], dtype=np.uint16)
+            pixels = np.frombuffer(f.read(w * h * 2), dtype='<u2')
+            if pixels.size < w * h:
+                pixels = np.pad(pixels, (0, w * h - pixels.size))
+            raw = pixels[np.asarray(arr, dtype=np.int64)]
             S_b = (raw >> 8).astype(np.float64)
             R_b = (raw & 0xFF).astype(np.float64)
             S_angle = (1.0 - S_b / 255.0) * HALFPI
@@ -883,7 +831,7 @@ class decode:
             G8 = np.clip(np.round((Ny + 1.0) * 0.5 * 255.0), 0, 255).astype(np.uint8)
             B8 = np.clip(np.round(Nz * 255.0),               0, 255).astype(np.uint8)
             A8 = np.full_like(R8, 255)
-            data = list(zip(R8.tolist(), G8.tolist(), B8.tolist(), A8.tolist()))
+            data = np.stack([R8, G8, B8, A8], axis=-1)
 
             if self.flip != '':
                 data = self.image_flip(data, w, h, 'RGBA')
@@ -893,12 +841,16 @@ class decode:
         # ARGB modes
         elif px_format in [0, 1, 2, 5, 7, 18]:
 
-            pixels = [int.from_bytes(f.read(2), 'little') for _ in range(w * h)]
+            pixels = np.frombuffer(f.read(w * h * 2), dtype='<u2')
+            if pixels.size < w * h:
+                pixels = np.pad(pixels, (0, w * h - pixels.size))
 
             if tex_format not in [9, 10, 11, 12, 14, 15]:  # If Twiddled
-                data = [(self.read_col(px_format, p)) for p in (pixels[i] for i in arr)]
-            else:
-                data = [(self.read_col(px_format, p)) for p in pixels]
+                pixels = pixels[np.asarray(arr, dtype=np.int64)]
+
+            data = self.read_col_array(px_format, pixels)
+            if data is None:
+                data = [(self.read_col(px_format, p)) for p in pixels.tolist()]
 
             palette = ''
             cmode = 'RGBA'
@@ -911,8 +863,7 @@ class decode:
 
         # YUV420 modes
         elif px_format in [6]:
-            data = []
-            self.yuv420_to_rgb(f, w, h, data)
+            data = self.yuv420_array(f, w, h).reshape(-1, 3)
 
             palette = ''
             cmode = 'RGB'
@@ -926,37 +877,16 @@ class decode:
 
         # YUV422 modes
         elif px_format in [3]:
-            data = []
+            n_px = w * h
+            raw = np.frombuffer(f.read(n_px * 2), dtype='<u2')
+            if raw.size < n_px:
+                raw = np.pad(raw, (0, n_px - raw.size))
 
             # Twiddled
             if tex_format not in [9, 10, 11, 12, 14, 15]:
-                i = 0
-                offset = f.tell()
-
-                for y in range(h):
-                    for x in range(0, w, 2):
-                        f.seek(offset + (arr[i] * 2))
-                        yuv0 = int.from_bytes(f.read(2), 'little')
-                        i += 1
-                        f.seek(offset + (arr[i] * 2))
-                        yuv1 = int.from_bytes(f.read(2), 'little')
-                        r0, g0, b0, r1, g1, b1 = self.read_col(px_format, (yuv0, yuv1))
-                        data.append((r0, g0, b0))
-                        data.append((r1, g1, b1))
-                        i += 1
-
-
-
-            else:
-                for y in range(h):
-                    for x in range(0, w, 2):
-                        # Read yuv0 and yuv1 separately
-                        yuv0 = int.from_bytes(f.read(2), 'little')
-                        yuv1 = int.from_bytes(f.read(2), 'little')
-                        r0, g0, b0, r1, g1, b1 = self.read_col(px_format, (yuv0, yuv1))
-                        data.append((r0, g0, b0))
-                        data.append((r1, g1, b1))
+                raw = raw[np.asarray(arr[:n_px], dtype=np.int64)]
 
+            data = self.yuv422_array(raw)
 
             palette = ''
             cmode = 'RGB'
@@ -1044,7 +974,7 @@ class decode:
                         f"{f', GBIX2: {gbix_val2}' if gbix_val2 != '' else ', GBIX2: ---'}\n"
                     )
 
-                    with open(f'{self.out_dir}/pvr_log.txt', 'a') as l:
+                    with open(os.path.join(self.out_dir, 'pvr_log.txt'), 'a') as l:
                         l.write(log_content)
             else:
                 print("'PVRT' header not found!")
@@ -1121,80 +1051,223 @@ class decode:
     def cart_to_rgb(self,cval):
         return tuple(int(c * 255) for c in cval)
 
-    def yuv420_to_rgb(self,f, w, h, data):
+    def yuv420_array(self, f, w, h):
         # Credits to Egregiousguy for YUV420 --> YUV420P conversion
-        buffer = bytearray()
-
+        #
+        # Each 16×16 macroblock is stored as U(8×8), V(8×8), then the four
+        # 8×8 luma blocks top-left, top-right, bottom-left, bottom-right —
+        # 384 bytes, one macroblock after another in raster order.
         col = w // 16
         row = h // 16
+        n_bytes = row * col * 384
+
+        raw = np.frombuffer(f.read(n_bytes), dtype=np.uint8)
+        if raw.size < n_bytes:
+            raw = np.pad(raw, (0, n_bytes - raw.size))
+        mb = raw.reshape(row, col, 6, 8, 8)
+
+        U = mb[:, :, 0].transpose(0, 2, 1, 3).reshape(row * 8, col * 8)
+        V = mb[:, :, 1].transpose(0, 2, 1, 3).reshape(row * 8, col * 8)
+        Y = (mb[:, :, 2:].reshape(row, col, 2, 2, 8, 8)
+             .transpose(0, 2, 4, 1, 3, 5).reshape(row * 16, col * 16))
+
+        # Upsample chroma 2×2 and convert
+        y = Y.astype(np.float64)
+        u = U.repeat(2, axis=0).repeat(2, axis=1).astype(np.float64) - 128
+        v = V.repeat(2, axis=0).repeat(2, axis=1).astype(np.float64) - 128
+        r = np.clip(np.round(y + 1.402 * v), 0, 255)
+        g = np.clip(np.round(y - 0.344136 * u - 0.714136 * v), 0, 255)
+        b = np.clip(np.round(y + 1.772 * u), 0, 255)
+        return np.stack([r, g, b], axis=-1).astype(np.uint8)    # (h, w, 3)
 
-        U = [bytearray() for _ in range(8 * row)]
-        V = [bytearray() for _ in range(8 * row)]
-        Y01 = [bytearray() for _ in range(col)]
-        Y23 = [bytearray() for _ in range(col)]
-
-        for i in range(1, row + 1):
-            for n in range(8):
-                U[n + 8 * (i - 1)] = bytearray()
-
-            for n in range(col):
-                Y01[n] = bytearray()
-                Y23[n] = bytearray()
-
-            for _ in range(col):
-                for n in range(8):
-                    U[n + 8 * (i - 1)] += f.read(0x8)
-
-                for n in range(8):
-                    V[n + 8 * (i - 1)] += f.read(0x8)
-
-                for _ in range(2):
-                    for n in range(8):
-                        Y01[n] += f.read(0x8)
-
-                for _ in range(2):
-                    for n in range(8):
-                        Y23[n] += f.read(0x8)
-
-            for n in range(col):
-                buffer += Y01[n]
-
-            for n in range(col):
-                buffer += Y23[n]
-
-        for datauv in U + V:
-            buffer += datauv
-
-        # Extract Y, U, and V components from the buffer
-        Y = list(buffer[:int(w * h)])
-        U = list(buffer[int(w * h):int(w * h * 1.25)])
-        V = list(buffer[int(w * h * 1.25):])
-
-        # Reshape Y, U, and V components
-        Y = [Y[i:i + w] for i in range(0, len(Y), w)]
-        U = [U[i:i + w // 2] for i in range(0, len(U), w // 2)]
-        V = [V[i:i + w // 2] for i in range(0, len(V), w // 2)]
-
-        # Upsample U and V components
-        U = [item for sublist in U for item in [item for item in sublist] * 2]
-        V = [item for sublist in V for item in [item for item in sublist] * 2]
-
-        # Reshape U and V components after upsampling
-        U = [U[i:i + w] for i in range(0, len(U), w)]
-        V = [V[i:i + w] for i in range(0, len(V), w)]
-
-        # Convert YUV to RGB
-        for i in range(h):
-            for j in range(w):
-                i_UV = min(i // 2, len(U) - 1)
-                j_UV = min(j // 2, len(U[i_UV]) - 1)
-                y, u, v = Y[i][j], U[i_UV][j_UV], V[i_UV][j_UV]
-                r = int(max(0, min(255, round(y + 1.402 * (v - 128)))))
-                g = int(max(0, min(255, round(y - 0.344136 * (u - 128) - 0.714136 * (v - 128)))))
-                b = int(max(0, min(255, round(y + 1.772 * (u - 128)))))
-                data.append((r, g, b))
+    def yuv420_to_rgb(self,f, w, h, data):
+        """List form of yuv420_array(): appends (r, g, b) tuples to *data*."""
+        data.extend(map(tuple, self.yuv420_array(f, w, h).reshape(-1, 3).tolist()))
         return data
 
+    def yuv422_to_rgb(self, words):
+        """List form of yuv422_array(): a list of (r, g, b) tuples."""
+        return list(map(tuple, self.yuv422_array(words).tolist()))
+
+    def yuv422_array(self, words):
+        """Convert YUV422 words (Y << 8 | U for even pixels, Y << 8 | V for
+        odd ones) to an (N, 3) uint8 array, integer maths as read_col."""
+        words = np.asarray(words, dtype=np.int32)
+        yuv0, yuv1 = words[0::2], words[1::2]
+
+        c = (np.stack([yuv0, yuv1], axis=1) >> 8 & 0xFF) - 16   # (pairs, 2)
+        d = (yuv0 & 0xFF)[:, None] - 128
+        e = (yuv1 & 0xFF)[:, None] - 128
+
+        r = np.clip((298 * c + 409 * e + 128) >> 8, 0, 255)
+        g = np.clip((298 * c - 100 * d - 208 * e + 128) >> 8, 0, 255)
+        b = np.clip((298 * c + 516 * d + 128) >> 8, 0, 255)
+        return np.stack([r, g, b], axis=-1).reshape(-1, 3).astype(np.uint8)
+
+
+# =============================================================================
+#  PVR FOLDER INDEX
+#  Header metadata for every .PVR in a folder, gathered in one scandir pass
+#  and cached in memory and in a per-user cache file keyed by (size, mtime_ns)
+#  so texture folders are not re-opened file by file on every UI refresh.
+#  Nothing is written into the texture folder itself.
+# =============================================================================
+
+_PVR_INDEX_VER    = 1
+_PVR_INDEX_CACHE  = {}      # normcased folder -> {stem: info}
+_PVR_MIP_FORMATS  = frozenset({2, 4, 6, 8, 10, 12, 15, 17, 18})
+_PVR_PAL_EXTS     = ('.pvp', '.PVP', '.pal', '.PAL')
+_PVR_CRC_CHUNK    = 1 << 20
+
+
+def pvr_header_info(data):
+    """Parse the GBIX / PVRT header from the first bytes of a PVR.
+    Returns dict(px_format, tex_format, width, height, mips, gbix) or None."""
+    offset = data.find(b"PVRT")
+    if offset == -1 or offset + 0x10 > len(data):
+        return None
+    px_format, tex_format = data[offset + 0x8], data[offset + 0x9]
+    width, height = struct.unpack_from('<HH', data, offset + 0x0C)
+    gbix = None
+    g = data.find(b"GBIX", 0, offset)
+    if g != -1 and g + 0xC <= offset:
+        gbix = struct.unpack_from('<I', data, g + 0x8)[0]
+    return {
+        'px_format': px_format, 'tex_format': tex_format,
+        'width': width, 'height': height,
+        'mips': tex_format in _PVR_MIP_FORMATS, 'gbix': gbix,
+    }
+
+
+def _pvr_read_info(path):
+    """Read header and CRC32 of one PVR (CRC streamed, 8-digit lowercase hex)."""
+    crc = 0
+    with open(path, 'rb') as f:
+        head = f.read(0x20)
+        crc = zlib.crc32(head)
+        for chunk in iter(lambda: f.read(_PVR_CRC_CHUNK), b''):
+            crc = zlib.crc32(chunk, crc)
+    info = pvr_header_info(head)
+    if info is not None:
+        info['crc32'] = f"{crc & 0xffffffff:08x}"
+    return info
+
+
+def _pvr_index_dir():
+    """Per-user cache directory for folder indexes (never the game data folder)."""
+    base = (os.environ.get('LOCALAPPDATA') or os.environ.get('XDG_CACHE_HOME')
+            or os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(base, 'naomilib', 'pvr_index')
+
+
+def _pvr_index_path(key):
+    digest = hashlib.sha1(key.encode('utf-8', 'surrogatepass')).hexdigest()
+    return os.path.join(_pvr_index_dir(), digest + '.json')
+
+
+def _pvr_index_load(key):
+    try:
+        with open(_pvr_index_path(key), 'r', encoding='utf-8') as f:
+            raw = json.load(f)
+        if raw.get('version') == _PVR_INDEX_VER and raw.get('folder') == key:
+            return raw.get('files', {})
+    except (OSError, ValueError, AttributeError):
+        pass
+    return {}
+
+
+def _pvr_index_save(key, files):
+    path = _pvr_index_path(key)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'version': _PVR_INDEX_VER, 'folder': key, 'files': files}, f,
+                      indent=1, sort_keys=True)
+    except OSError:
+        pass  # no writable cache dir: the in-memory cache still applies
+
+
+def _pvr_index_cached(key):
+    cached = _PVR_INDEX_CACHE.get(key)
+    if cached is None:
+        cached = _PVR_INDEX_CACHE[key] = _pvr_index_load(key)
+    return cached
+
+
+def pvr_folder_index(folder):
+    """Return {stem: info} for every .PVR in folder.
+
+    info holds px_format, tex_format, width, height, mips, gbix, crc32,
+    size, mtime_ns, plus 'palette' (companion .pvp/.pal file name or None).
+    One os.scandir pass; only files whose (size, mtime_ns) changed since the
+    last call, or since the cache file was written, are opened."""
+    if not folder or not os.path.isdir(folder):
+        return {}
+    key = os.path.normcase(os.path.abspath(folder))
+    cached = _pvr_index_cached(key)
+
+    pvrs, names = [], set()
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                names.add(entry.name)
+                base, ext = os.path.splitext(entry.name)
+                if ext.upper() == '.PVR' and entry.is_file():
+                    pvrs.append((base, entry))
+    except OSError:
+        return {}
+
+    index, dirty = {}, False
+    for base, entry in sorted(pvrs, key=lambda p: p[1].name):
+        if base in index:
+            continue
+        st = entry.stat()
+        info = cached.get(base)
+        if (info is None or info.get('size') != st.st_size
+                or info.get('mtime_ns') != st.st_mtime_ns):
+            try:
+                info = _pvr_read_info(entry.path)
+            except OSError:
+                info = None
+            if info is None:
+                continue
+            info['size'], info['mtime_ns'] = st.st_size, st.st_mtime_ns
+            dirty = True
+        info['palette'] = next((base + e for e in _PVR_PAL_EXTS if base + e in names), None)
+        index[base] = info
+
+    if dirty or index.keys() != cached.keys():
+        _pvr_index_save(key, index)
+    _PVR_INDEX_CACHE[key] = index
+    return index
+
+
+def pvr_file_info(pvr_path):
+    """Index entry for a single .PVR, or None if missing / not a PVR.
+    Reuses the folder cache when the file is unchanged, without a folder scan."""
+    folder, name = os.path.split(os.path.abspath(pvr_path))
+    base = os.path.splitext(name)[0]
+    try:
+        st = os.stat(pvr_path)
+    except OSError:
+        return None
+    cached = _pvr_index_cached(os.path.normcase(folder))
+    info = cached.get(base)
+    if (info is not None and info.get('size') == st.st_size
+            and info.get('mtime_ns') == st.st_mtime_ns):
+        return info
+    try:
+        info = _pvr_read_info(pvr_path)
+    except OSError:
+        return None
+    if info is None:
+        return None
+    info['size'], info['mtime_ns'] = st.st_size, st.st_mtime_ns
+    info['palette'] = next((base + e for e in _PVR_PAL_EXTS
+                            if os.path.exists(os.path.join(folder, base + e))), None)
+    cached[base] = info
+    return info
+
 
 # =============================================================================
 #  PVR ENCODER
@@ -1309,6 +1382,31 @@ def _enc_twiddle_indices(w, h):
     return arr
 
 
+def _enc_mip_sizes(size):
+    """Mip level edge lengths for a size×size base, smallest first."""
+    sizes = []
+    while size >= 1:
+        sizes.append(size)
+        size //= 2
+    return sizes[::-1]
+
+
+_ENC_PYRAMID_TWIDDLE = {}
+
+def _enc_pyramid_twiddle(size):
+    """Twiddle permutation for a whole packed mip pyramid (see
+    encode._mip_pyramid): every level's indices, offset to its position."""
+    perm = _ENC_PYRAMID_TWIDDLE.get(size)
+    if perm is None:
+        parts, off = [], 0
+        for s in _enc_mip_sizes(size):
+            parts.append(np.asarray(_enc_twiddle_indices(s, s), dtype=np.int64) + off)
+            off += s * s
+        perm = np.concatenate(parts)
+        _ENC_PYRAMID_TWIDDLE[size] = perm
+    return perm
+
+
 # Image loading (PIL-based, no bpy) 
 
 def load_image_as_rgba(filepath):
@@ -1351,6 +1449,180 @@ def load_image_as_rgba(filepath):
         return arr, w, h
 
 
+def _png_unfilter_sweep(img, filters, first):
+    """Undo the Up / Average / Paeth rows of img from row *first* on, in place.
+    img is (h, w, channels) uint8 with Sub rows already decoded.  A byte needs
+    its left, upper and upper-left neighbours, so the rows are swept along
+    anti-diagonals x + y = d: each step decodes every pixel of one diagonal
+    with whole-array ops, w + h steps instead of a Python step per byte."""
+    h, w, chans = img.shape
+    stride = w + 1
+    pad = np.zeros((h + 1, stride, chans), np.int16)    # zero row / column = PNG edges
+    pad[1:, 1:] = img
+    flat = pad.reshape(-1, chans)
+    rows = np.flatnonzero(filters >= 2)
+    rows = rows[rows >= first]
+    kinds = filters[rows].astype(np.int16)[:, None]
+    for d in range(first, int(rows[-1]) + w):
+        lo = np.searchsorted(rows, d - w + 1)
+        hi = np.searchsorted(rows, d, 'right')
+        if lo == hi:
+            continue
+        ys = rows[lo:hi] + 1
+        at = ys * stride + (d + 2 - ys)                  # (y, x) in padded coordinates
+        a, b, c = flat[at - 1], flat[at - stride], flat[at - stride - 1]
+        pa, pb, pc = np.abs(b - c), np.abs(a - c), np.abs(a + b - 2 * c)
+        paeth = np.where((pa <= pb) & (pa <= pc), a, np.where(pb <= pc, b, c))
+        kind = kinds[lo:hi]
+        pred = np.where(kind == 2, b, np.where(kind == 3, (a + b) >> 1, paeth))
+        flat[at] = (flat[at] + pred) & 0xFF
+    img[...] = pad[1:, 1:]
+
+
+def _png_alpha(data):
+    """Alpha plane of an 8-bit, non-interlaced PNG (None when opaque by type).
+    Sub rows are decoded in one vectorised pass and leading Up rows row by row;
+    from the first Average / Paeth row on, _png_unfilter_sweep takes over."""
+    pos, ihdr, trns, idat = 8, None, None, []
+    while pos + 8 <= len(data):
+        length, tag = struct.unpack_from('>I4s', data, pos)
+        body = data[pos + 8:pos + 8 + length]
+        if tag == b'IHDR':
+            ihdr = struct.unpack('>IIBBBBB', body)
+        elif tag == b'tRNS':
+            trns = body
+        elif tag == b'IDAT':
+            idat.append(body)
+        elif tag == b'IEND':
+            break
+        pos += 12 + length
+    if ihdr is None:
+        raise ValueError("PNG without IHDR")
+    w, h, depth, ctype, _comp, _filt, interlace = ihdr
+    if ctype in (0, 2) and trns is None:
+        return None, w, h
+    if depth != 8 or interlace:
+        raise ValueError("unsupported PNG layout")
+    bpp = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}[ctype]
+    raw = np.frombuffer(zlib.decompress(b''.join(idat)), np.uint8)
+    rows = raw[:h * (w * bpp + 1)].reshape(h, w * bpp + 1)
+    filters, px = rows[:, 0], rows[:, 1:].astype(np.uint8)
+    if np.any(filters > 4):
+        raise ValueError("invalid PNG filter type")
+    sub = filters == 1
+    if sub.any():                       # Sub: running sum per channel, mod 256
+        s = px[sub].reshape(-1, w, bpp).astype(np.uint32).cumsum(axis=1)
+        px[sub] = (s & 0xFF).astype(np.uint8).reshape(-1, w * bpp)
+    deep = np.flatnonzero(filters >= 3)
+    first = int(deep[0]) if len(deep) else h
+    for y in np.flatnonzero(filters[:first] == 2):
+        if y:                           # Up: rows depend on the decoded row above
+            px[y] += px[y - 1]
+    px = px.reshape(h, w, bpp)
+    if first < h:                       # Average / Paeth: filters work per channel,
+        chans = px[:, :, -1:] if ctype in (4, 6) else px    # so only alpha is needed
+        _png_unfilter_sweep(chans, filters, first)
+    if ctype in (4, 6):
+        return px[:, :, -1], w, h
+    if ctype == 3:
+        table = np.full(256, 255, np.uint8)
+        table[:len(trns)] = np.frombuffer(trns, np.uint8)[:256]
+        return table[px[:, :, 0]], w, h
+    key = np.frombuffer(trns, '>u2')[:bpp].astype(np.uint8)   # 8-bit colour key
+    return np.where(np.all(px == key, axis=2), 0, 255).astype(np.uint8), w, h
+
+
+def _bmp_alpha(data):
+    off, = struct.unpack_from('<I', data, 0x0A)
+    hdr_size, w, h, _planes, bits, comp = struct.unpack_from('<IiiHHI', data, 0x0E)
+    h_abs = abs(h)
+    if bits != 32 or comp not in (0, 3, 6):
+        return None, w, h_abs
+    shift = 24
+    if comp in (3, 6):
+        mask = struct.unpack_from('<I', data, 0x0E + 0x34)[0] if hdr_size >= 56 else 0
+        if not mask:
+            return None, w, h_abs
+        shift = (mask & -mask).bit_length() - 1
+    words = np.frombuffer(data, '<u4', w * h_abs, off)
+    alpha = (words >> shift & 0xFF).astype(np.uint8)
+    if comp == 0 and not alpha.any():   # BI_RGB: an all-zero 4th byte is padding
+        return None, w, h_abs
+    return alpha, w, h_abs
+
+
+def _tga_alpha(data):
+    id_len, cmap_type, img_type = data[0], data[1], data[2]
+    cmap_len, cmap_bits = struct.unpack_from('<H', data, 5)[0], data[7]
+    w, h = struct.unpack_from('<HH', data, 12)
+    bits, alpha_bits = data[16], data[17] & 0x0F
+    if img_type in (1, 9):                  # colour-mapped: alpha lives in the palette
+        return _tga_palette_alpha(data, id_len, cmap_len, cmap_bits, bits, alpha_bits,
+                                  img_type, w, h)
+    if img_type in (3, 11) or bits not in (16, 32) or (bits == 16 and not alpha_bits):
+        return None, w, h
+    if img_type != 2:
+        raise ValueError("unsupported TGA type")  # RLE / colour-mapped with alpha
+    off = 18 + id_len + (cmap_len * ((cmap_bits + 7) // 8) if cmap_type else 0)
+    if bits == 32:
+        return np.frombuffer(data, np.uint8, w * h * 4, off)[3::4], w, h
+    words = np.frombuffer(data, '<u2', w * h, off)
+    return np.where(words & 0x8000, 255, 0).astype(np.uint8), w, h
+
+
+def _tga_palette_alpha(data, id_len, cmap_len, cmap_bits, bits, alpha_bits, img_type, w, h):
+    if cmap_bits not in (16, 32) or (cmap_bits == 16 and not alpha_bits):
+        return None, w, h                   # 15 / 24-bit palette: opaque
+    if img_type != 1 or bits != 8:
+        raise ValueError("unsupported TGA type")  # RLE / 16-bit indices with alpha
+    first = struct.unpack_from('<H', data, 3)[0]
+    pal_off = 18 + id_len
+    if cmap_bits == 32:
+        pal = np.frombuffer(data, np.uint8, cmap_len * 4, pal_off)[3::4]
+    else:
+        pal = np.where(np.frombuffer(data, '<u2', cmap_len, pal_off) & 0x8000,
+                       255, 0).astype(np.uint8)
+    table = np.full(256, 255, np.uint8)     # indices outside the map stay opaque
+    lo, hi = min(first, 256), min(first + cmap_len, 256)
+    table[lo:hi] = pal[:hi - lo]
+    idx = np.frombuffer(data, np.uint8, w * h, pal_off + cmap_len * cmap_bits // 8)
+    return table[idx], w, h
+
+
+def _jpeg_size(data):
+    pos = 2
+    while pos + 9 <= len(data):
+        if data[pos] != 0xFF:
+            break
+        marker, length = data[pos + 1], struct.unpack_from('>H', data, pos + 2)[0]
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            h, w = struct.unpack_from('>HH', data, pos + 5)
+            return w, h
+        pos += 2 + length
+    raise ValueError("JPEG without SOF")
+
+
+def read_image_alpha(data):
+    """
+    Return (alpha, w, h) for the image file contents *data* without a full
+    decode: alpha is a flat uint8 array, or None when the format / header
+    says the image is opaque.  Handles PNG, BMP, TGA and JPEG; anything
+    else (or a layout the fast paths skip) raises ValueError.
+    """
+    if data[:8] == b'\x89PNG\r\n\x1a\n':
+        alpha, w, h = _png_alpha(data)
+    elif data[:2] == b'BM':
+        alpha, w, h = _bmp_alpha(data)
+    elif data[:3] == b'\xff\xd8\xff':
+        (w, h), alpha = _jpeg_size(data), None
+    elif len(data) >= 18 and data[2] in (1, 2, 3, 9, 10, 11) and data[1] in (0, 1):
+        alpha, w, h = _tga_alpha(data)
+    else:
+        raise ValueError("unsupported image format")
+    if alpha is not None:
+        alpha = np.asarray(alpha).reshape(-1)
+    return alpha, w, h
+
 # =============================================================================
 
 class encode:
@@ -1472,8 +1744,37 @@ class encode:
     # Class-level cache — built once per process
     _SR_TABLE = None
 
+    # _to_sr works through the image in tiles so its temporaries stay under
+    # SR_MAX_BYTES whatever the image size; SR_THREADS > 1 splits the tiles
+    # across threads (NumPy releases the GIL), each with its own scratch.
+    SR_MAX_BYTES = 32 << 20
+    SR_THREADS   = 1
+    _SR_RADIUS   = 2     # search (2*RADIUS+1)^2 = 25 candidates around seed
+    _SR_BYTES_PER_PX = 1024   # scratch per pixel, rounded up from ~900
+    _SR_TILE_ALIGN   = 1024   # keeps SIMD lane alignment identical per tile
+
     @staticmethod
-    def _to_sr(flat):
+    def _sr_tile_size(n, max_bytes, threads):
+        per_thread = max(1, max_bytes // max(1, threads))
+        tile = per_thread // encode._SR_BYTES_PER_PX
+        tile = max(encode._SR_TILE_ALIGN,
+                   tile // encode._SR_TILE_ALIGN * encode._SR_TILE_ALIGN)
+        return min(tile, max(n, 1))
+
+    class _SRScratch:
+        """Reusable per-thread buffers for one _to_sr tile."""
+
+        def __init__(self, tile):
+            k = (2 * encode._SR_RADIUS + 1) ** 2
+            self.cands   = np.empty((tile, k), dtype=np.int32)
+            self.tmp     = np.empty((tile, k), dtype=np.int32)
+            self.xyz     = np.empty((tile, k, 3), dtype=np.float32)
+            self.dots    = np.empty((tile, k), dtype=np.float32)
+            self.best    = np.empty(tile, dtype=np.intp)
+            self.input   = np.empty((tile, 3), dtype=np.float32)
+
+    @staticmethod
+    def _to_sr(flat, max_bytes=None, threads=None):
         # PVR2 BUMP encoder: normal map -> SR texel.
         #
         # Two-stage seeded neighbourhood search — globally optimal in practice:
@@ -1491,15 +1792,49 @@ class encode:
         # match on random inputs; worst-case angular error < 0.36° (< 1 SR bin).
         # Runtime: ~0.14s for a 256×256 image vs ~26s for naive full search.
         #
+        # Pixels are independent, so the work is split into tiles of at most
+        # max_bytes of scratch (default SR_MAX_BYTES), optionally spread over
+        # `threads` workers.  Output is identical to a single whole-image pass.
+        #
         # Input: uint8 RGBA flat array — R,G bipolar [0,255], B unipolar [0,255].
-        HALFPI   = math.pi / 2.0
-        DOUBLEPI = math.pi * 2.0
-        RADIUS   = 2   # search (2*RADIUS+1)^2 = 25 candidates around seed
+        if max_bytes is None:
+            max_bytes = encode.SR_MAX_BYTES
+        if threads is None:
+            threads = encode.SR_THREADS
 
-        # Build or retrieve cached SR grid
+        # Build or retrieve cached SR grid, flattened for np.take
         if encode._SR_TABLE is None:
             encode._SR_TABLE = encode._build_sr_table()
-        table_grid = encode._SR_TABLE   # (256, 256, 3) float32
+        table_flat = encode._SR_TABLE.reshape(-1, 3)   # (65536, 3) float32
+
+        N    = flat.shape[0]
+        out  = np.empty(N, dtype=np.uint16)
+        tile = encode._sr_tile_size(N, max_bytes, threads)
+        starts = list(range(0, N, tile))
+
+        def run(chunk):
+            scratch = encode._SRScratch(tile)
+            for s in chunk:
+                e = min(s + tile, N)
+                encode._to_sr_tile(flat[s:e], table_flat, scratch, out[s:e])
+
+        threads = max(1, min(int(threads), len(starts)))
+        if threads == 1:
+            run(starts)
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                for f in [pool.submit(run, starts[i::threads]) for i in range(threads)]:
+                    f.result()
+        return out
+
+    @staticmethod
+    def _to_sr_tile(flat, table_flat, scratch, out):
+        """Encode one tile of _to_sr into *out* using *scratch* buffers."""
+        HALFPI   = math.pi / 2.0
+        DOUBLEPI = math.pi * 2.0
+        RADIUS   = encode._SR_RADIUS
+        n = flat.shape[0]
 
         # Input: flat[:,0]=R, flat[:,1]=G, flat[:,2]=B, all uint8
         # R,G bipolar [0,255] -> [-1,+1];  B unipolar [0,255] -> [0,+1]
@@ -1511,38 +1846,45 @@ class encode:
         # Normalise input vectors (guard zero-length)
         mag = np.sqrt(cx**2 + cy**2 + cz**2)
         mag = np.where(mag < 1e-9, 1.0, mag)
-        nx = (cx / mag).astype(np.float32)
-        ny = (cy / mag).astype(np.float32)
-        nz = (cz / mag).astype(np.float32)
-
-        # Stage 1: analytic seed 
-        polar   = np.arccos(np.clip(nz.astype(np.float64), -1.0, 1.0))
-        azimuth = np.arctan2(cy / mag, cx / mag)
+        input_xyz = scratch.input[:n]
+        np.divide(cx, mag, out=cx)
+        np.divide(cy, mag, out=cy)
+        input_xyz[:, 0] = cx
+        input_xyz[:, 1] = cy
+        input_xyz[:, 2] = cz / mag
+
+        # Stage 1: analytic seed
+        polar   = np.arccos(np.clip(input_xyz[:, 2].astype(np.float64), -1.0, 1.0))
+        azimuth = np.arctan2(cy, cx)
         S0 = np.clip(((HALFPI - polar) / HALFPI * 255.0 + 0.5).astype(np.int32), 0, 255)
         azimuth = np.where(azimuth < 0, azimuth + DOUBLEPI, azimuth)
         R0 = (azimuth / DOUBLEPI * 255.0 + 0.5).astype(np.int32) % 256
 
-        # Stage 2: neighbourhood search 
+        # Stage 2: neighbourhood search
         offsets = np.arange(-RADIUS, RADIUS + 1, dtype=np.int32)
         ds, dr  = np.meshgrid(offsets, offsets, indexing='ij')
         ds = ds.ravel(); dr = dr.ravel()          # (K,) K = 25
 
-        # Candidate (S, R) indices for every pixel: (N, K)
-        S_cands = np.clip(S0[:, None] + ds[None, :], 0, 255).astype(np.int32)
-        R_cands = ((R0[:, None] + dr[None, :]) % 256).astype(np.int32)
-
-        # Gather decoded normals from the grid: (N, K, 3) — one indexing call
-        cand_xyz = table_grid[S_cands, R_cands]   # float32
-
-        # Dot product vs input normal: (N, K)
-        input_xyz = np.stack([nx, ny, nz], axis=-1)           # (N, 3)
-        dots = np.einsum('nkc,nc->nk', cand_xyz, input_xyz)   # (N, K)
-
-        best_k = np.argmax(dots, axis=1)                       # (N,)
-        N      = flat.shape[0]
-        best_S = S_cands[np.arange(N), best_k].astype(np.uint16)
-        best_R = R_cands[np.arange(N), best_k].astype(np.uint16)
-        return (best_S << 8) | best_R
+        # Flat table index S*256 + R for every candidate: (n, K)
+        cands = scratch.cands[:n]
+        tmp   = scratch.tmp[:n]
+        np.add(S0[:, None], ds[None, :], out=cands)
+        np.clip(cands, 0, 255, out=cands)
+        np.left_shift(cands, 8, out=cands)
+        np.add(R0[:, None], dr[None, :], out=tmp)
+        np.remainder(tmp, 256, out=tmp)
+        np.bitwise_or(cands, tmp, out=cands)
+
+        # Gather decoded normals and score them against the input: (n, K)
+        cand_xyz = scratch.xyz[:n]
+        np.take(table_flat, cands, axis=0, out=cand_xyz)
+        dots = scratch.dots[:n]
+        np.einsum('nkc,nc->nk', cand_xyz, input_xyz, out=dots)
+
+        best_k = scratch.best[:n]
+        np.argmax(dots, axis=1, out=best_k)
+        # The winning candidate's flat index is S << 8 | R — the SR texel.
+        out[:] = np.take_along_axis(cands, best_k[:, None], axis=1)[:, 0]
 
     @staticmethod
     def _to_yuv422(flat, w, h):
@@ -1738,6 +2080,41 @@ class encode:
             codebook[i] = v.astype(np.uint16).view(np.uint8)
         return bytes(codebook.tobytes())
 
+    # label gather for VQ mipmaps, cached per width
+    _VQ_MIP_GATHER = {}
+
+    @classmethod
+    def _vq_mip_gather(cls, W):
+        """Index array mapping k-means labels of a VQ mipmap atlas straight to
+        the twiddled, smallest-first index stream."""
+        gather = cls._VQ_MIP_GATHER.get(W)
+        if gather is not None:
+            return gather
+
+        mip_level  = int(np.log2(W))
+        mip_height = np.zeros(mip_level, dtype=int)
+        mip_start  = np.zeros(mip_level, dtype=int)
+        start_off  = 0
+        for i in range(mip_level):
+            idx = mip_level - 1 - i
+            mh  = (W // 2) >> i
+            mip_height[idx] = mh
+            mip_start[idx] = start_off
+            start_off += (mh * mh << i)
+
+        gather = np.zeros(int(np.sum(mip_height ** 2)), dtype=np.int64)
+        mip_off = 0
+        for i in range(mip_level):
+            cmh  = int(mip_height[i])
+            step = W // 2 // cmh
+            j    = np.arange(cmh * cmh)
+            src  = int(mip_start[i]) + (j // cmh) * step * cmh + (j % cmh)
+            tw_idx = cls._twiddle_vq(cmh, cmh).ravel()
+            gather[mip_off + tw_idx] = src
+            mip_off += cmh * cmh
+        cls._VQ_MIP_GATHER[W] = gather
+        return gather
+
     # VQ compression 
     def _vq_compress(self, rgba, px_mode, tex_mode, cb_size, n_iter, seed,
                      orig_w, orig_h):
@@ -1763,34 +2140,7 @@ class encode:
         codebook = self._codebook_bytes(centroids, cb_size, px_mode)
 
         if has_mm:
-            mip_level  = int(np.log2(W))
-            mip_height = np.zeros(mip_level, dtype=int)
-            mip_start  = np.zeros(mip_level, dtype=int)
-            end_index  = np.zeros(mip_level, dtype=int)
-            start_off  = 0
-            for i in range(mip_level):
-                idx = mip_level - 1 - i
-                mh  = (W // 2) >> i
-                mip_height[idx] = mh
-                end_off = start_off + (mh * mh << i)
-                mip_start[idx] = start_off
-                end_index[idx] = end_off
-                start_off = end_off
-
-            total = int(np.sum(mip_height ** 2))
-            index = np.zeros(total, dtype=labels.dtype)
-            mip_off = 0
-            for i in range(mip_level):
-                cmh  = int(mip_height[i])
-                step = W // 2 // cmh
-                grid = labels[int(mip_start[i]):int(end_index[i])].reshape(W // 2, cmh)
-                mip_data  = grid[::step, :cmh].flatten()
-                tw_idx    = self._twiddle_vq(cmh, cmh).ravel()
-                labels_tw = np.zeros(cmh * cmh, dtype=mip_data.dtype)
-                labels_tw[tw_idx] = mip_data
-                size = cmh * cmh
-                index[mip_off:mip_off + size] = labels_tw
-                mip_off += size
+            index = labels[self._vq_mip_gather(W)]
             index = np.pad(index, (1, 0), mode="constant")
         else:
             nh, nw = H // 2, W // 2
@@ -1816,9 +2166,31 @@ class encode:
                 h //= 2
         return out
 
-    # encode one tile to raw pixel bytes (no header) 
-    def _encode_tile(self, rgba, w, h, tex, px):
-        flat = rgba.reshape(-1, 4)
+    # every mip level in one buffer
+    def _mip_pyramid(self, rgba, size):
+        """
+        Build all mip levels from size×size down to 1×1 in one pass.
+
+        Returns (packed, levels): packed is an (N, C) uint8 array holding
+        each level in raster order, smallest first as the PVR stores them;
+        levels lists (edge, offset) per level in the same order.  Square
+        sources halve the previous level, which is exactly what _resize
+        produces from full resolution.
+        """
+        sizes   = _enc_mip_sizes(size)
+        offsets = np.cumsum([0] + [s * s for s in sizes])
+        nch     = rgba.shape[2]
+        packed  = np.empty((int(offsets[-1]), nch), dtype=np.uint8)
+        incremental = rgba.shape[0] == rgba.shape[1]
+
+        mip = rgba
+        for i in range(len(sizes) - 1, -1, -1):
+            mip = self._resize(mip if incremental else rgba, sizes[i], sizes[i])
+            packed[offsets[i]:offsets[i + 1]] = mip.reshape(-1, nch)
+        return packed, list(zip(sizes, offsets[:-1].tolist()))
+
+    # pixel format conversion of a flat (N, 4) block
+    def _convert_pixels(self, flat, w, h, tex, px):
         if px == "565":
             pv = self._to_565(flat);    dtype = np.uint16
         elif px == "1555":
@@ -1834,15 +2206,23 @@ class encode:
                 pv = self._to_565(flat); dtype = np.uint16
             else:
                 pv = self._to_yuv422(flat, w, h); dtype = np.uint16
-        elif px == "yuv420":
-            return bytes(self._to_yuv420(rgba, w, h)), np.uint8
         else:
             pv = self._to_565(flat);    dtype = np.uint16
+        return pv.flatten().astype(dtype), dtype
+
+    @staticmethod
+    def _needs_twiddle(tex):
+        return any(k in tex for k in ("tw", "pal", "twal"))
+
+    # encode one tile to raw pixel bytes (no header) 
+    def _encode_tile(self, rgba, w, h, tex, px):
+        if px == "yuv420" and "bmp" not in tex:
+            return bytes(self._to_yuv420(rgba, w, h)), np.uint8
 
-        arr = pv.flatten().astype(dtype)
+        arr, dtype = self._convert_pixels(rgba.reshape(-1, 4), w, h, tex, px)
 
         # twiddle when required
-        if any(k in tex for k in ("tw", "pal", "twal")):
+        if self._needs_twiddle(tex):
             tw  = _enc_twiddle_indices(w, h)
             out = np.zeros(w * h, dtype=dtype)
             out[tw] = arr
@@ -1850,6 +2230,30 @@ class encode:
 
         return bytes(arr.tobytes()), dtype
 
+    # encode a whole mip pyramid to raw pixel bytes (no header, no pad)
+    def _encode_pyramid(self, rgba, size, tex, px):
+        packed, levels = self._mip_pyramid(rgba, size)
+
+        if px == "yuv420":
+            return b"".join(self._encode_tile(packed[o:o + s * s].reshape(s, s, -1),
+                                              s, s, tex, px)[0]
+                            for s, o in levels)
+
+        if px == "yuv422" and len(packed) > 1:
+            # 1×1 falls back to 565; the rest pair up within each level
+            # because every larger level has an even pixel count.
+            head, dtype = self._convert_pixels(packed[:1], 1, 1, tex, px)
+            rest, _     = self._convert_pixels(packed[1:], len(packed) - 1, 1, tex, px)
+            arr = np.concatenate([head, rest])
+        else:
+            arr, dtype = self._convert_pixels(packed, len(packed), 1, tex, px)
+
+        if self._needs_twiddle(tex):
+            out = np.zeros_like(arr)
+            out[_enc_pyramid_twiddle(size)] = arr
+            arr = out
+        return bytes(arr.tobytes())
+
     # encode all pixels for a given mode (no header) 
     def _encode_pixels(self, rgba, w, h, tex, px, n_iter, vq_seed):
 
@@ -1864,11 +2268,19 @@ class encode:
 
             if "mm" in tex:
                 atlas = np.zeros((h, w * 2, rgba.shape[2]), dtype=np.uint8)
-                x_off = 0; cur_w, cur_h = w, h
-                while cur_w >= 1 and cur_h >= 1:
-                    mip = self._resize(rgba, cur_w, cur_h)
-                    atlas[0:cur_h, x_off:x_off + cur_w] = mip
-                    x_off += cur_w; cur_w //= 2; cur_h //= 2
+                if w == h:
+                    packed, levels = self._mip_pyramid(rgba, w)
+                    x_off = 0
+                    for cur, off in reversed(levels):
+                        atlas[0:cur, x_off:x_off + cur] = \
+                            packed[off:off + cur * cur].reshape(cur, cur, -1)
+                        x_off += cur
+                else:
+                    x_off = 0; cur_w, cur_h = w, h
+                    while cur_w >= 1 and cur_h >= 1:
+                        mip = self._resize(rgba, cur_w, cur_h)
+                        atlas[0:cur_h, x_off:x_off + cur_w] = mip
+                        x_off += cur_w; cur_w //= 2; cur_h //= 2
                 vq_input = atlas
             else:
                 vq_input = rgba
@@ -1894,33 +2306,29 @@ class encode:
                 else:
                     pad = b"\x00" * 2
 
-                levels = []
-                cur_size = h
                 # Build a flat palette array for nearest-colour lookup (RGBA, float32)
                 pal_rgba = palette.astype(np.float32)  # shape (n_colors, 4)
 
-                while cur_size >= 1:
-                    mip = self._resize(rgba, cur_size, cur_size)   # (cur_size, cur_size, 4)
-                    flat = mip.reshape(-1, 4).astype(np.float32)   # (N, 4)
+                packed, levels = self._mip_pyramid(rgba, h)
+                idx = np.empty(len(packed), dtype=np.uint8)
+                for cur_size, off in levels:
+                    flat = packed[off:off + cur_size * cur_size].astype(np.float32)
 
-                    # Nearest-palette-entry assignment via squared-distance
-                    # Broadcast: (N,1,4) - (1,n_colors,4) → (N,n_colors,4)
+                    # Nearest-palette-entry assignment via squared-distance,
+                    # one level at a time to bound the (N, n_colors, 4) temporary
                     diff = flat[:, np.newaxis, :] - pal_rgba[np.newaxis, :, :]
-                    idx = np.argmin(np.sum(diff ** 2, axis=2), axis=1).astype(np.uint8)
-
-                    tw = _enc_twiddle_indices(cur_size, cur_size)
-                    tw_idx = np.zeros(cur_size * cur_size, dtype=np.uint8)
-                    tw_idx[tw] = idx
-
-                    if "pal4" in tex:
-                        packed = (tw_idx[::2] & 0x0F) | ((tw_idx[1::2] & 0x0F) << 4)
-                        levels.insert(0, bytes(packed.tobytes()))
-                    else:
-                        levels.insert(0, bytes(tw_idx.tobytes()))
+                    idx[off:off + len(flat)] = np.argmin(np.sum(diff ** 2, axis=2), axis=1)
 
-                    cur_size //= 2
+                tw_idx = np.zeros_like(idx)
+                tw_idx[_enc_pyramid_twiddle(h)] = idx
 
-                return pad + b"".join(levels), palette
+                if "pal4" in tex:
+                    # The 1×1 level packs to nothing; every other level is even
+                    # and starts right after it, so nibble pairs never straddle.
+                    body = tw_idx[1:]
+                    packed4 = (body[::2] & 0x0F) | ((body[1::2] & 0x0F) << 4)
+                    return pad + bytes(packed4.tobytes()), palette
+                return pad + bytes(tw_idx.tobytes()), palette
 
             # Non-MM PAL: twiddle full-res labels and return
             tw = _enc_twiddle_indices(w, h)
@@ -1940,14 +2348,7 @@ class encode:
             else:
                 pad = b"\x00" * 2
 
-            levels = []
-            cur_size = h
-            while cur_size >= 1:
-                mip = self._resize(rgba, cur_size, cur_size)
-                tile, _ = self._encode_tile(mip, cur_size, cur_size, tex, px)
-                levels.insert(0, tile)   # prepend: smallest first
-                cur_size //= 2
-            return pad + b"".join(levels)
+            return pad + self._encode_pyramid(rgba, h, tex, px)
 
         # Standard single tile
         tile, _ = self._encode_tile(rgba, w, h, tex, px)